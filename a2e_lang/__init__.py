@@ -1,5 +1,9 @@
 """a2e-lang — DSL compiler for the A2E protocol."""
 
+from __future__ import annotations
+
+import importlib
+
 from .ast_nodes import (
     ArrayValue,
     Condition,
@@ -11,73 +15,74 @@ from .ast_nodes import (
     Property,
     Workflow,
 )
-from .compiler import Compiler
-from .compiler_spec import SpecCompiler
-from .decompiler import Decompiler
-from .engine import ExecutionEngine, ExecutionResult
 from .errors import A2ELangError, CompileError, ParseError, ValidationError
-from .graph import generate_mermaid
-from .logging import ExecutionLogger, PipelineLog
-from .orchestrator import Orchestrator, OrchestrationResult, ChainMode
-from .parser import parse
-from .plugins import (
-    PluginSpec,
-    register_plugin,
-    unregister_plugin,
-    get_plugin,
-    list_plugins,
-    is_valid_op_type,
-    get_all_op_types,
-)
-from .prompts import format_prompt, get_template, list_templates
-from .recovery import recover, parse_with_recovery
-from .registry import WorkflowRegistry, WorkflowEntry
-from .resilience import RetryPolicy, CircuitBreaker, execute_with_retry
-from .scoring import score_syntax
-from .simulator import Simulator, SimulationResult
-from .sourcemap import SourceMap, generate_source_map
-from .tokens import calculate_budget
-from .validator import Validator
-from .webhook import WebhookServer
 
-__all__ = [
-    "parse",
-    "Compiler",
-    "SpecCompiler",
-    "Decompiler",
-    "Validator",
-    "Simulator",
-    "SimulationResult",
-    "generate_mermaid",
-    "recover",
-    "parse_with_recovery",
-    "calculate_budget",
-    "format_prompt",
-    "get_template",
-    "list_templates",
-    "score_syntax",
-    "ExecutionEngine",
-    "ExecutionResult",
-    "ExecutionLogger",
-    "PipelineLog",
-    "RetryPolicy",
-    "CircuitBreaker",
-    "execute_with_retry",
-    "WebhookServer",
-    "PluginSpec",
-    "register_plugin",
-    "unregister_plugin",
-    "get_plugin",
-    "list_plugins",
-    "is_valid_op_type",
-    "get_all_op_types",
-    "WorkflowRegistry",
-    "WorkflowEntry",
-    "Orchestrator",
-    "OrchestrationResult",
-    "ChainMode",
-    "SourceMap",
-    "generate_source_map",
+# ---------------------------------------------------------------------------
+# Lazily resolved public names (PEP 562)
+#
+# Importing the package only loads the AST and error types. Everything else
+# (engine, webhook server, orchestrator, ...) is imported on first access so
+# that e.g. `a2e-lang compile` does not pay for http.server and friends.
+# ---------------------------------------------------------------------------
+
+_LAZY: dict[str, str] = {
+    "parse": ".parser",
+    "parse_cached": ".parser",
+    "parse_uncached": ".parser",
+    "Compiler": ".compiler",
+    "SpecCompiler": ".compiler_spec",
+    "Decompiler": ".decompiler",
+    "Validator": ".validator",
+    "Simulator": ".simulator",
+    "SimulationResult": ".simulator",
+    "generate_mermaid": ".graph",
+    "recover": ".recovery",
+    "parse_with_recovery": ".recovery",
+    "calculate_budget": ".tokens",
+    "format_prompt": ".prompts",
+    "get_template": ".prompts",
+    "list_templates": ".prompts",
+    "score_syntax": ".scoring",
+    "ExecutionEngine": ".engine",
+    "ExecutionResult": ".engine",
+    "PreparedWorkflow": ".engine",
+    "ExecutionLogger": ".logging",
+    "PipelineLog": ".logging",
+    "RetryPolicy": ".resilience",
+    "CircuitBreaker": ".resilience",
+    "execute_with_retry": ".resilience",
+    "WebhookServer": ".webhook",
+    "PluginSpec": ".plugins",
+    "register_plugin": ".plugins",
+    "unregister_plugin": ".plugins",
+    "get_plugin": ".plugins",
+    "list_plugins": ".plugins",
+    "is_valid_op_type": ".plugins",
+    "get_all_op_types": ".plugins",
+    "WorkflowRegistry": ".registry",
+    "WorkflowEntry": ".registry",
+    "Orchestrator": ".orchestrator",
+    "OrchestrationResult": ".orchestrator",
+    "ChainMode": ".orchestrator",
+    "SourceMap": ".sourcemap",
+    "generate_source_map": ".sourcemap",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+_EAGER = (
     "Workflow",
     "Operation",
     "Property",
@@ -91,4 +96,6 @@ __all__ = [
     "ParseError",
     "ValidationError",
     "CompileError",
-]
+)
+
+__all__ = [*_LAZY, *_EAGER]
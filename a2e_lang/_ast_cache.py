@@ -0,0 +1,110 @@
+"""On-disk cache of parsed Workflow ASTs, keyed by a hash of the source.
+
+Used by the CLI so that re-running a command on an unchanged file skips
+parsing. Entries live in `$A2E_LANG_CACHE_DIR`, else
+`$XDG_CACHE_HOME/a2e_lang`, else `~/.cache/a2e_lang`. Set
+`A2E_LANG_NO_CACHE=1` to disable the cache.
+
+The key also covers the grammar, parser and AST modules, so upgrading
+a2e-lang never loads an AST pickled by another version. Content hashing
+uses xxhash when installed (`pip install a2e-lang[fast]`) and blake2b
+otherwise. The cache is best-effort: any I/O or unpickling failure is a
+miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path as FilePath
+
+from .ast_nodes import Workflow
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - depends on the environment
+    xxhash = None
+
+MAX_ENTRIES = 256
+
+_PACKAGE_DIR = FilePath(__file__).parent
+_KEYED_FILES = ("grammar.lark", "parser.py", "ast_nodes.py")
+_salt: bytes | None = None
+
+
+def cache_dir() -> FilePath | None:
+    """Return the cache directory, or None when caching is disabled."""
+    if os.environ.get("A2E_LANG_NO_CACHE"):
+        return None
+    explicit = os.environ.get("A2E_LANG_CACHE_DIR")
+    if explicit:
+        return FilePath(explicit)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return FilePath(base) / "a2e_lang"
+
+
+def load(source: str) -> Workflow | None:
+    """Return the cached AST for source, or None on a miss."""
+    directory = cache_dir()
+    if directory is None:
+        return None
+    entry = directory / f"{_key(source)}.pkl"
+    try:
+        with open(entry, "rb") as f:
+            workflow = pickle.load(f)
+        os.utime(entry)  # mark as recently used
+    except Exception:
+        return None
+    return workflow if isinstance(workflow, Workflow) else None
+
+
+def store(source: str, workflow: Workflow) -> None:
+    """Cache the AST for source, evicting the least recently used entries."""
+    directory = cache_dir()
+    if directory is None:
+        return
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(workflow, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, directory / f"{_key(source)}.pkl")
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        _evict(directory)
+    except Exception:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _key(source: str) -> str:
+    data = _get_salt() + source.encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _get_salt() -> bytes:
+    global _salt
+    if _salt is None:
+        h = hashlib.blake2b(digest_size=16)
+        for name in _KEYED_FILES:
+            h.update((_PACKAGE_DIR / name).read_bytes())
+        _salt = h.digest()
+    return _salt
+
+
+def _evict(directory: FilePath) -> None:
+    entries = list(directory.glob("*.pkl"))
+    if len(entries) <= MAX_ENTRIES:
+        return
+    entries.sort(key=lambda p: p.stat().st_mtime)
+    for entry in entries[:len(entries) - MAX_ENTRIES]:
+        entry.unlink(missing_ok=True)
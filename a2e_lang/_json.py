@@ -0,0 +1,65 @@
+"""JSON helpers: orjson when installed, stdlib json otherwise.
+
+orjson (`pip install a2e-lang[fast]`) parses and serializes several times
+faster than the stdlib. Both backends produce the same layout: compact output
+uses no whitespace, pretty output uses a 2-space indent, and non-ASCII
+characters are written as UTF-8 rather than escaped.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Stdlib fallback: json.dumps() builds a new JSONEncoder on every call when
+# given non-default options, so build the two configurations once.
+_encode_compact = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+_encode_pretty = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+
+def dumps(obj: Any, *, pretty: bool = False, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize obj to a JSON string (compact, or indented when pretty).
+
+    default, when given, converts values JSON cannot represent (as in
+    json.dumps); dict keys may then also be non-strings.
+    """
+    if orjson is not None:
+        return _orjson_dumps(obj, pretty, default).decode("utf-8")
+    if default is not None:
+        return _stdlib_encoder(pretty, default).encode(obj)
+    return _encode_pretty(obj) if pretty else _encode_compact(obj)
+
+
+def dumpb(obj: Any, *, pretty: bool = False, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes (same layout as dumps)."""
+    if orjson is not None:
+        return _orjson_dumps(obj, pretty, default)
+    return dumps(obj, pretty=pretty, default=default).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from UTF-8 bytes or a str.
+
+    Both backends raise json.JSONDecodeError (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _orjson_dumps(obj: Any, pretty: bool, default: Callable[[Any], Any] | None) -> bytes:
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    if default is None:
+        return orjson.dumps(obj, option=option)
+    return orjson.dumps(obj, default=default, option=option | orjson.OPT_NON_STR_KEYS)
+
+
+def _stdlib_encoder(pretty: bool, default: Callable[[Any], Any]) -> json.JSONEncoder:
+    if pretty:
+        return json.JSONEncoder(indent=2, ensure_ascii=False, default=default)
+    return json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=default)
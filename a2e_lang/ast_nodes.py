@@ -1,37 +1,73 @@
-"""AST node definitions for a2e-lang — all frozen (immutable) dataclasses."""
+"""AST node definitions for a2e-lang — all immutable.
+
+Small leaf records (Path, Credential, Property, Condition) are NamedTuples so
+they are built by the C-level tuple constructor; the remaining nodes are
+frozen, slotted dataclasses.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Union
+import heapq
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Union
+
+
+# NamedTuple equality is plain tuple equality, which would make e.g.
+# Path("/x") == Credential("/x") == ("/x",). Leaf nodes compare equal only
+# to nodes of the same type, matching the dataclass semantics.
+
+def _leaf_eq(self, other: object) -> bool:
+    return type(self) is type(other) and tuple.__eq__(self, other)
+
+
+def _leaf_ne(self, other: object) -> bool:
+    return not _leaf_eq(self, other)
+
+
+def _leaf_hash(self) -> int:
+    return hash((type(self).__name__, *self))
+
+
+# Nodes with cache fields pickle their init fields only: the caches are
+# rebuilt on demand, and the MappingProxyType ones cannot be pickled.
+
+def _reduce_init_fields(self):
+    return type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init)
 
 
 # ---------------------------------------------------------------------------
 # Leaf values
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
-class Path:
+class Path(NamedTuple):
     """A data-model path like /workflow/users."""
     raw: str  # full path string including leading /
 
+    __eq__ = _leaf_eq
+    __ne__ = _leaf_ne
+    __hash__ = _leaf_hash
+
     def __str__(self) -> str:
         return self.raw
 
 
-@dataclass(frozen=True)
-class Credential:
+class Credential(NamedTuple):
     """A credential reference: credential("api-token")."""
     id: str
 
+    __eq__ = _leaf_eq
+    __ne__ = _leaf_ne
+    __hash__ = _leaf_hash
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObjectValue:
     """An inline object: { key: value, ... }."""
     properties: tuple[Property, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArrayValue:
     """An inline array: [val1, val2, ...]."""
     items: tuple[Value, ...]
@@ -45,22 +81,28 @@ Value = Union[str, int, float, bool, None, Path, Credential, ObjectValue, ArrayV
 # Structural nodes
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
-class Property:
+class Property(NamedTuple):
     """A key-value pair: key: value."""
     key: str
     value: Value
 
+    __eq__ = _leaf_eq
+    __ne__ = _leaf_ne
+    __hash__ = _leaf_hash
 
-@dataclass(frozen=True)
-class Condition:
+
+class Condition(NamedTuple):
     """A filter condition: field operator value."""
     field: str
     operator: str
     value: Value
 
+    __eq__ = _leaf_eq
+    __ne__ = _leaf_ne
+    __hash__ = _leaf_hash
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IfClause:
     """Conditional clause: if /path op value then targets else targets."""
     path: str
@@ -70,7 +112,7 @@ class IfClause:
     if_false: tuple[str, ...] | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Operation:
     """A single operation definition."""
     id: str
@@ -82,11 +124,223 @@ class Operation:
     if_clause: IfClause | None = None
     line: int = 0
     column: int = 0
+    _predicates: tuple | None = field(  # set by engine._handle_filter_data
+        default=None, init=False, repr=False, compare=False,
+    )
+    _spec_json: str | None = field(  # set by SpecCompiler
+        default=None, init=False, repr=False, compare=False,
+    )
+    _prop_map: Mapping[str, Value] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    __reduce__ = _reduce_init_fields
 
+    def prop_map(self) -> Mapping[str, Value]:
+        """Return a read-only key -> value mapping of the properties (cached).
 
-@dataclass(frozen=True)
+        If a key is repeated, the first occurrence wins.
+        """
+        if self._prop_map is None:
+            index: dict[str, Value] = {}
+            for key, value in self.properties:
+                index.setdefault(key, value)
+            object.__setattr__(self, "_prop_map", MappingProxyType(index))
+        return self._prop_map
+
+
+@dataclass(frozen=True, slots=True)
 class Workflow:
     """Root AST node representing a complete workflow."""
     name: str
     operations: tuple[Operation, ...]
     execution_order: tuple[str, ...] | None = None  # from run: clause
+    _topo_order: tuple[str, ...] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    _topo_levels: tuple[tuple[str, ...], ...] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    _by_id: Mapping[str, Operation] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    _mermaid: str | None = field(  # set by graph.generate_mermaid
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    __reduce__ = _reduce_init_fields
+
+    def by_id(self) -> Mapping[str, Operation]:
+        """Return a read-only id -> Operation mapping (built once, cached).
+
+        If an id is declared twice, the later operation wins.
+        """
+        if self._by_id is None:
+            index = {op.id: op for op in self.operations}
+            object.__setattr__(self, "_by_id", MappingProxyType(index))
+        return self._by_id
+
+    def topo_order(self) -> tuple[str, ...]:
+        """Return operation IDs in dependency order (computed once, cached).
+
+        Reads and writes of a path keep their declaration order (read and
+        write after write, write after read), and a Conditional precedes
+        its then/else targets. Independent operations keep their
+        declaration order; operations caught in a cycle are appended in
+        declaration order.
+        """
+        if self._topo_order is None:
+            object.__setattr__(self, "_topo_order", _kahn_order(self.operations))
+        return self._topo_order
+
+    def topo_levels(self) -> tuple[tuple[str, ...], ...]:
+        """Return operation IDs grouped into dependency levels (cached).
+
+        Operations within one level do not depend on each other, so they
+        may run concurrently once every earlier level has finished.
+        """
+        if self._topo_levels is None:
+            object.__setattr__(self, "_topo_levels", _kahn_levels(self.operations))
+        return self._topo_levels
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _read_paths(op: Operation) -> list[str]:
+    """Paths an operation reads: from clause, if path, MergeData sources."""
+    paths: list[str] = []
+    if op.input_path:
+        paths.append(op.input_path)
+    if op.if_clause:
+        paths.append(op.if_clause.path)
+    for prop in op.properties:
+        if prop.key == "sources" and isinstance(prop.value, ArrayValue):
+            paths.extend(item.raw for item in prop.value.items if isinstance(item, Path))
+    return paths
+
+
+def _successors(operations: tuple[Operation, ...]) -> list[set[int]]:
+    """Dependency edges between operation indices.
+
+    Paths are tracked in declaration order: a reader depends on the
+    nearest writer declared before it, and a writer on the previous
+    writer and on every reader since then. A Conditional counts as
+    reading and writing the paths of its branches, and precedes its
+    then/else targets.
+    """
+    index = {op.id: i for i, op in enumerate(operations)}
+    reads = [_read_paths(op) for op in operations]
+    writes = [[op.output_path] if op.output_path else [] for op in operations]
+    # A Conditional runs its chosen branch itself, so it also touches the
+    # paths of every operation it can reach through then/else
+    for i, op in enumerate(operations):
+        if op.if_clause:
+            for j in _branch_targets(i, operations, index):
+                reads[i] = reads[i] + _read_paths(operations[j])
+                if operations[j].output_path:
+                    writes[i] = writes[i] + [operations[j].output_path]
+
+    successors: list[set[int]] = [set() for _ in operations]
+    last_writer: dict[str, int] = {}
+    readers: dict[str, list[int]] = {}
+
+    for i in range(len(operations)):
+        for path in reads[i]:
+            src = last_writer.get(path)
+            if src is not None:
+                successors[src].add(i)          # read after write
+            readers.setdefault(path, []).append(i)
+        for path in writes[i]:
+            src = last_writer.get(path)
+            if src is not None and src != i:
+                successors[src].add(i)          # write after write
+            for reader in readers.pop(path, ()):
+                if reader != i:
+                    successors[reader].add(i)   # write after read
+            last_writer[path] = i
+
+    for i, op in enumerate(operations):
+        if op.if_clause:
+            for target in (*op.if_clause.if_true, *(op.if_clause.if_false or ())):
+                dst = index.get(target)
+                if dst is not None and dst != i:
+                    successors[i].add(dst)
+    return successors
+
+
+def _branch_targets(
+    i: int, operations: tuple[Operation, ...], index: dict[str, int],
+) -> set[int]:
+    """Indices reachable from operation i through then/else, excluding i."""
+    seen = {i}
+    stack = [i]
+    while stack:
+        clause = operations[stack.pop()].if_clause
+        if clause is None:
+            continue
+        for target in (*clause.if_true, *(clause.if_false or ())):
+            j = index.get(target)
+            if j is not None and j not in seen:
+                seen.add(j)
+                stack.append(j)
+    seen.discard(i)
+    return seen
+
+
+def _dep_counts(successors: list[set[int]]) -> list[int]:
+    dep_count = [0] * len(successors)
+    for succ in successors:
+        for j in succ:
+            dep_count[j] += 1
+    return dep_count
+
+
+def _kahn_order(operations: tuple[Operation, ...]) -> tuple[str, ...]:
+    """Kahn's topological sort, ties broken by declaration index."""
+    successors = _successors(operations)
+    dep_count = _dep_counts(successors)
+
+    ready = [i for i, n in enumerate(dep_count) if n == 0]
+    heapq.heapify(ready)
+    order: list[int] = []
+    while ready:
+        i = heapq.heappop(ready)
+        order.append(i)
+        for j in successors[i]:
+            dep_count[j] -= 1
+            if dep_count[j] == 0:
+                heapq.heappush(ready, j)
+
+    if len(order) < len(operations):
+        placed = set(order)
+        order.extend(i for i in range(len(operations)) if i not in placed)
+
+    return tuple(operations[i].id for i in order)
+
+
+def _kahn_levels(operations: tuple[Operation, ...]) -> tuple[tuple[str, ...], ...]:
+    """Level-by-level Kahn's sort: each level only depends on earlier ones."""
+    successors = _successors(operations)
+    dep_count = _dep_counts(successors)
+
+    levels: list[list[int]] = []
+    ready = [i for i, n in enumerate(dep_count) if n == 0]
+    placed = 0
+    while ready:
+        levels.append(ready)
+        placed += len(ready)
+        next_ready: list[int] = []
+        for i in ready:
+            for j in successors[i]:
+                dep_count[j] -= 1
+                if dep_count[j] == 0:
+                    next_ready.append(j)
+        ready = sorted(next_ready)
+
+    if placed < len(operations):
+        done = {i for level in levels for i in level}
+        levels.extend([i] for i in range(len(operations)) if i not in done)
+
+    return tuple(tuple(operations[i].id for i in level) for level in levels)
@@ -1,58 +1,60 @@
-"""CLI for a2e-lang: compile, validate, and inspect .a2e files."""
+"""CLI for a2e-lang: compile, validate, and inspect .a2e files.
+
+Each command imports what it needs inside its handler, and only the
+chosen subcommand's parser is built, so e.g. `a2e-lang validate` does not
+pay for the engine, webhook server, compilers or simulator at startup.
+"""
 
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import mmap
+import os
+import stat
 import sys
+from typing import Any, Callable
 
-from .compiler import Compiler
-from .compiler_spec import SpecCompiler
-from .decompiler import Decompiler
-from .engine import ExecutionEngine
+from . import _ast_cache
+from ._json import loads
+from .ast_nodes import Workflow
 from .errors import A2ELangError
-from .graph import generate_mermaid
 from .parser import parse
-from .prompts import format_prompt, list_templates
-from .recovery import parse_with_recovery
-from .registry import WorkflowRegistry
-from .resilience import NO_RETRY, API_RETRY
-from .scoring import score_syntax
-from .simulator import Simulator
-from .sourcemap import generate_source_map
-from .tokens import calculate_budget
-from .validator import Validator
-from .watcher import watch_and_compile
-from .webhook import WebhookServer
 
 
-def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(
-        prog="a2e-lang",
-        description="DSL compiler for the A2E protocol",
-    )
-    sub = parser.add_subparsers(dest="command")
+# ---------------------------------------------------------------------------
+# Argument parsing
+#
+# Each subcommand registers its own subparser. When argv names a known
+# command only that subparser is built; help and unknown commands get the
+# full parser so usage output stays complete.
+# ---------------------------------------------------------------------------
 
-    # compile
+def _register_compile(sub) -> None:
     compile_p = sub.add_parser("compile", help="Compile .a2e to JSONL")
     compile_p.add_argument("file", help="Input .a2e file")
     compile_p.add_argument("--pretty", action="store_true", help="Pretty-print output")
     compile_p.add_argument("--spec", action="store_true", help="Use official A2E spec format (one line per operation)")
     compile_p.add_argument("--watch", action="store_true", help="Watch file and recompile on changes")
 
-    # validate
+
+def _register_validate(sub) -> None:
     validate_p = sub.add_parser("validate", help="Validate .a2e file without compiling")
     validate_p.add_argument("file", help="Input .a2e file")
 
-    # ast
+
+def _register_ast(sub) -> None:
     ast_p = sub.add_parser("ast", help="Show parsed AST (debug)")
     ast_p.add_argument("file", help="Input .a2e file")
 
-    # graph
+
+def _register_graph(sub) -> None:
     graph_p = sub.add_parser("graph", help="Generate Mermaid flowchart")
     graph_p.add_argument("file", help="Input .a2e file")
 
-    # simulate
+
+def _register_simulate(sub) -> None:
     sim_p = sub.add_parser("simulate", help="Dry-run workflow simulation")
     sim_p.add_argument("file", help="Input .a2e file")
     sim_p.add_argument("--input", dest="input_file", help="JSON file with mock data")
@@ -60,46 +62,56 @@ def main(argv: list[str] | None = None) -> int:
     sim_p.add_argument("--max-depth", type=int, default=None, help="Max nesting depth limit")
     sim_p.add_argument("--max-conditions", type=int, default=None, help="Max conditions per operation")
 
-    # decompile
+
+def _register_decompile(sub) -> None:
     decompile_p = sub.add_parser("decompile", help="Convert JSONL back to .a2e DSL")
     decompile_p.add_argument("file", help="Input JSONL file")
 
-    # recover
+
+def _register_recover(sub) -> None:
     recover_p = sub.add_parser("recover", help="Auto-fix LLM syntax mistakes")
     recover_p.add_argument("file", help="Input .a2e file")
 
-    # tokens
+
+def _register_tokens(sub) -> None:
     tokens_p = sub.add_parser("tokens", help="Token budget analysis (DSL vs JSONL)")
     tokens_p.add_argument("file", help="Input .a2e file")
 
-    # score
+
+def _register_score(sub) -> None:
     score_p = sub.add_parser("score", help="Syntax learnability score")
     score_p.add_argument("file", help="Input .a2e file")
 
-    # prompt
+
+def _register_prompt(sub) -> None:
     prompt_p = sub.add_parser("prompt", help="Generate LLM prompt template")
     prompt_p.add_argument("template", nargs="?", help="Template name (gpt4, claude, gemini, opensource)")
     prompt_p.add_argument("--task", dest="task_desc", help="Task description for the prompt")
     prompt_p.add_argument("--list", action="store_true", dest="list_all", help="List available templates")
 
-    # run (execute)
+
+def _register_run(sub) -> None:
     run_p = sub.add_parser("run", help="Execute workflow with the native engine")
     run_p.add_argument("file", help="Input .a2e file")
     run_p.add_argument("--input", dest="input_file", help="JSON file with input data")
     run_p.add_argument("--no-retry", action="store_true", help="Disable retry on failures")
+    run_p.add_argument("--workers", type=int, default=1, help="Run independent operations concurrently (default: 1)")
+
 
-    # webhook
+def _register_webhook(sub) -> None:
     webhook_p = sub.add_parser("webhook", help="Start webhook server")
     webhook_p.add_argument("file", help="Input .a2e file")
     webhook_p.add_argument("--port", type=int, default=8080, help="Server port (default: 8080)")
     webhook_p.add_argument("--host", default="0.0.0.0", help="Server host")
 
-    # sourcemap
+
+def _register_sourcemap(sub) -> None:
     sm_p = sub.add_parser("sourcemap", help="Generate source map (DSL -> JSONL)")
     sm_p.add_argument("file", help="Input .a2e file")
     sm_p.add_argument("--out", "-o", help="Output JSON file (default: stdout)")
 
-    # registry
+
+def _register_registry(sub) -> None:
     reg_p = sub.add_parser("registry", help="Interact with workflow registry")
     reg_sub = reg_p.add_subparsers(dest="reg_command", required=True)
 
@@ -125,60 +137,142 @@ def main(argv: list[str] | None = None) -> int:
     # registry remove
     reg_rm = reg_sub.add_parser("remove", help="Remove workflow from registry")
     reg_rm.add_argument("name", help="Workflow name")
-    args = parser.parse_args(argv)
 
-    if not args.command:
-        parser.print_help()
-        return 1
 
-    # Commands that don't need a file
-    if args.command == "prompt":
-        return _cmd_prompt(
-            template=args.template,
-            task_desc=args.task_desc,
-            list_all=args.list_all,
-        )
-    elif args.command == "registry":
-        return _cmd_registry(args)
+_SUBCOMMANDS: dict[str, Callable[[Any], None]] = {
+    "compile": _register_compile,
+    "validate": _register_validate,
+    "ast": _register_ast,
+    "graph": _register_graph,
+    "simulate": _register_simulate,
+    "decompile": _register_decompile,
+    "recover": _register_recover,
+    "tokens": _register_tokens,
+    "score": _register_score,
+    "prompt": _register_prompt,
+    "run": _register_run,
+    "webhook": _register_webhook,
+    "sourcemap": _register_sourcemap,
+    "registry": _register_registry,
+}
+
+
+@functools.cache
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the parser for one subcommand (or all when None), once per process."""
+    parser = argparse.ArgumentParser(
+        prog="a2e-lang",
+        description="DSL compiler for the A2E protocol",
+    )
+    sub = parser.add_subparsers(dest="command")
+    if command in _SUBCOMMANDS:
+        _SUBCOMMANDS[command](sub)
+    else:
+        for register in _SUBCOMMANDS.values():
+            register(sub)
+    return parser
+
+
+# Options understood by the argparse-free fast path:
+# command -> {option: (dest, converter, default)}; converter None = flag.
+# Must mirror the _register_* definitions above.
+_FAST_OPTIONS: dict[str, dict[str, tuple[str, Callable[[str], Any] | None, Any]]] = {
+    "compile": {
+        "--pretty": ("pretty", None, False),
+        "--spec": ("spec", None, False),
+        "--watch": ("watch", None, False),
+    },
+    "validate": {},
+    "ast": {},
+    "graph": {},
+    "simulate": {
+        "--input": ("input_file", str, None),
+        "--max-operations": ("max_operations", int, None),
+        "--max-depth": ("max_depth", int, None),
+        "--max-conditions": ("max_conditions", int, None),
+    },
+    "decompile": {},
+    "recover": {},
+    "tokens": {},
+    "score": {},
+    "run": {
+        "--input": ("input_file", str, None),
+        "--no-retry": ("no_retry", None, False),
+        "--workers": ("workers", int, 1),
+    },
+    "webhook": {
+        "--port": ("port", int, 8080),
+        "--host": ("host", str, "0.0.0.0"),
+    },
+    "sourcemap": {
+        "--out": ("out", str, None),
+        "-o": ("out", str, None),
+    },
+}
+
+
+def _fast_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse plain `<command> FILE [options]` invocations without argparse.
+
+    Returns None for anything unusual (help, unknown options, `--opt=value`,
+    a missing or malformed option value, extra positionals) so that
+    argparse handles it and reports errors as usual.
+    """
+    if not argv:
+        return None
+    options = _FAST_OPTIONS.get(argv[0])
+    if options is None:
+        return None
+    args = argparse.Namespace(command=argv[0])
+    for dest, _, default in options.values():
+        setattr(args, dest, default)
+    files = []
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg.startswith("-") and arg != "-":
+            spec = options.get(arg)
+            if spec is None:
+                return None
+            dest, convert, _ = spec
+            if convert is None:
+                setattr(args, dest, True)
+            else:
+                i += 1
+                if i == len(argv) or argv[i].startswith("-"):
+                    return None
+                try:
+                    setattr(args, dest, convert(argv[i]))
+                except ValueError:
+                    return None
+        else:
+            files.append(arg)
+        i += 1
+    if len(files) != 1:
+        return None
+    args.file = files[0]
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _fast_args(argv)
+    if args is None:
+        parser = _build_parser(argv[0] if argv and argv[0] in _SUBCOMMANDS else None)
+        args = parser.parse_args(argv)
+        if not args.command:
+            parser.print_help()
+            return 1
+
+    handler = _COMMANDS.get(args.command)
+    if handler is None and args.command == "compile" and args.watch:
+        handler = _dispatch_watch
+    if handler is not None:
+        return handler(args)
 
     try:
-        if args.command == "compile":
-            if args.watch:
-                watch_and_compile(args.file, spec=args.spec, pretty=args.pretty)
-                return 0
-            source = _read_file(args.file)
-            return _cmd_compile(source, pretty=args.pretty, spec=args.spec)
-        elif args.command == "simulate":
-            source = _read_file(args.file)
-            return _cmd_simulate(
-                source,
-                input_file=args.input_file,
-                max_operations=args.max_operations,
-                max_depth=args.max_depth,
-                max_conditions=args.max_conditions,
-            )
-        else:
-            source = _read_file(args.file)
-            if args.command == "validate":
-                return _cmd_validate(source)
-            elif args.command == "ast":
-                return _cmd_ast(source)
-            elif args.command == "graph":
-                return _cmd_graph(source)
-            elif args.command == "decompile":
-                return _cmd_decompile(source)
-            elif args.command == "recover":
-                return _cmd_recover(source)
-            elif args.command == "tokens":
-                return _cmd_tokens(source)
-            elif args.command == "score":
-                return _cmd_score(source)
-            elif args.command == "sourcemap":
-                return _cmd_sourcemap(source, out_file=args.out)
-            elif args.command == "run":
-                return _cmd_run(source, input_file=getattr(args, 'input_file', None), no_retry=getattr(args, 'no_retry', False))
-            elif args.command == "webhook":
-                return _cmd_webhook(source, host=args.host, port=args.port)
+        return _FILE_COMMANDS[args.command](_read_file(args.file), args)
     except FileNotFoundError:
         print(f"Error: file not found: {args.file}", file=sys.stderr)
         return 1
@@ -186,41 +280,93 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
-    return 0
+
+# Files at least this large are decoded straight from a memory map
+_MMAP_THRESHOLD = 1 << 20  # 1 MiB
 
 
 def _read_file(path: str) -> str:
-    with open(path, encoding="utf-8") as f:
-        return f.read()
+    # Unbuffered: the size is known up front, so the whole file is read
+    # with a single readinto() into a presized buffer.
+    with open(path, "rb", buffering=0) as f:
+        st = os.fstat(f.fileno())
+        size = st.st_size
+        if not stat.S_ISREG(st.st_mode):  # pipe, /dev/stdin, ...: size unknown
+            text = f.readall().decode("utf-8")
+        elif size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, "utf-8")
+        else:
+            buf = bytearray(size)
+            n = f.readinto(buf)
+            text = str(memoryview(buf)[:n], "utf-8")
+    # Match text-mode universal newlines
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+@functools.lru_cache(maxsize=32)
+def _load(source: str) -> Workflow:
+    """Single entry point from source text to AST for every command.
+
+    Memoized in-process, so one invocation (or one watch session) never
+    parses the same text twice, and backed by the on-disk AST cache
+    across invocations.
+    """
+    workflow = _ast_cache.load(source)
+    if workflow is None:
+        workflow = parse(source)
+        _ast_cache.store(source, workflow)
+    return workflow
+
+
+def _print_errors(errors, prefix: str, header: str | None = None) -> None:
+    """Report errors on stderr, one per line, in a single write."""
+    lines = [f"{prefix}{e}\n" for e in errors]
+    if header is not None:
+        lines.insert(0, f"{header}\n")
+    sys.stderr.write("".join(lines))
+
+
+def _read_json(path: str) -> Any:
+    with open(path, "rb") as f:
+        return loads(f.read())
 
 
 def _cmd_compile(source: str, pretty: bool = False, spec: bool = False) -> int:
-    workflow = parse(source)
+    from .compiler import Compiler
+    from .compiler_spec import SpecCompiler
+    from .validator import Validator
+
+    workflow = _load(source)
 
     validator = Validator()
     errors = validator.validate(workflow)
     if errors:
-        for e in errors:
-            print(f"Validation error: {e}", file=sys.stderr)
+        _print_errors(errors, "Validation error: ")
         return 1
 
     compiler = SpecCompiler() if spec else Compiler()
-    if pretty:
-        output = compiler.compile_pretty(workflow)
-    else:
-        output = compiler.compile(workflow)
-    print(output)
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # stdout replaced by a plain text stream
+        print(compiler.compile_pretty(workflow) if pretty else compiler.compile(workflow))
+        return 0
+    sys.stdout.flush()
+    compiler.write(workflow, buffer, pretty=pretty)
+    buffer.flush()
     return 0
 
 
 def _cmd_validate(source: str) -> int:
-    workflow = parse(source)
+    from .validator import Validator
+
+    workflow = _load(source)
 
     validator = Validator()
     errors = validator.validate(workflow)
     if errors:
-        for e in errors:
-            print(f"  {e}", file=sys.stderr)
+        _print_errors(errors, "  ")
         return 1
 
     print(f"Valid: {len(workflow.operations)} operations, workflow '{workflow.name}'")
@@ -228,41 +374,46 @@ def _cmd_validate(source: str) -> int:
 
 
 def _cmd_ast(source: str) -> int:
-    workflow = parse(source)
+    workflow = _load(source)
     _print_ast(workflow)
     return 0
 
 
 def _print_ast(workflow) -> None:
-    print(f"Workflow: {workflow.name!r}")
-    print(f"Execution order: {workflow.execution_order}")
+    parts = [
+        f"Workflow: {workflow.name!r}",
+        f"Execution order: {workflow.execution_order}",
+    ]
+    add = parts.append
+    fmt = _fmt_value
     for op in workflow.operations:
-        print(f"\n  {op.id} = {op.op_type}")
+        add(f"\n  {op.id} = {op.op_type}")
         if op.input_path:
-            print(f"    from {op.input_path}")
-        for p in op.properties:
-            print(f"    {p.key}: {_fmt_value(p.value)}")
+            add(f"    from {op.input_path}")
+        parts += [f"    {p.key}: {fmt(p.value)}" for p in op.properties]
         if op.conditions:
-            conds = ", ".join(f"{c.field} {c.operator} {_fmt_value(c.value)}" for c in op.conditions)
-            print(f"    where {conds}")
+            conds = ", ".join([f"{c.field} {c.operator} {fmt(c.value)}" for c in op.conditions])
+            add(f"    where {conds}")
         if op.if_clause:
             ic = op.if_clause
-            v = f" {_fmt_value(ic.value)}" if ic.value is not None else ""
-            print(f"    if {ic.path} {ic.operator}{v} then {ic.if_true}")
+            v = f" {fmt(ic.value)}" if ic.value is not None else ""
+            add(f"    if {ic.path} {ic.operator}{v} then {ic.if_true}")
             if ic.if_false:
-                print(f"    else {ic.if_false}")
+                add(f"    else {ic.if_false}")
         if op.output_path:
-            print(f"    -> {op.output_path}")
+            add(f"    -> {op.output_path}")
+    parts.append("")
+    sys.stdout.write("\n".join(parts))
 
 
 def _fmt_value(val) -> str:
-    if isinstance(val, str):
-        return repr(val)
-    return str(val)
+    return repr(val) if type(val) is str else str(val)
 
 
 def _cmd_graph(source: str) -> int:
-    workflow = parse(source)
+    from .graph import generate_mermaid
+
+    workflow = _load(source)
     print(generate_mermaid(workflow))
     return 0
 
@@ -274,7 +425,10 @@ def _cmd_simulate(
     max_depth: int | None = None,
     max_conditions: int | None = None,
 ) -> int:
-    workflow = parse(source)
+    from .simulator import Simulator
+    from .validator import Validator
+
+    workflow = _load(source)
 
     # Validate with optional complexity limits
     validator = Validator(
@@ -284,16 +438,14 @@ def _cmd_simulate(
     )
     errors = validator.validate(workflow)
     if errors:
-        for e in errors:
-            print(f"Validation error: {e}", file=sys.stderr)
+        _print_errors(errors, "Validation error: ")
         return 1
 
     # Load mock data
     input_data = None
     if input_file:
         try:
-            with open(input_file, encoding="utf-8") as f:
-                input_data = json.load(f)
+            input_data = _read_json(input_file)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Error reading input file: {e}", file=sys.stderr)
             return 1
@@ -305,6 +457,8 @@ def _cmd_simulate(
 
 
 def _cmd_decompile(source: str) -> int:
+    from .decompiler import Decompiler
+
     decompiler = Decompiler()
     try:
         dsl = decompiler.decompile(source)
@@ -316,6 +470,8 @@ def _cmd_decompile(source: str) -> int:
 
 
 def _cmd_recover(source: str) -> int:
+    from .recovery import parse_with_recovery
+
     workflow, result = parse_with_recovery(source)
     if result.was_modified:
         print(result.summary(), file=sys.stderr)
@@ -325,13 +481,17 @@ def _cmd_recover(source: str) -> int:
 
 
 def _cmd_tokens(source: str) -> int:
-    budget = calculate_budget(source)
+    from .tokens import calculate_budget
+
+    budget = calculate_budget(source, workflow=_load(source))
     print(budget.summary())
     return 0
 
 
 def _cmd_score(source: str) -> int:
-    score = score_syntax(source)
+    from .scoring import score_syntax
+
+    score = score_syntax(source, workflow=_load(source))
     print(score.summary())
     return 0
 
@@ -341,6 +501,8 @@ def _cmd_prompt(
     task_desc: str | None = None,
     list_all: bool = False,
 ) -> int:
+    from .prompts import format_prompt, list_templates
+
     if list_all or not template:
         templates = list_templates()
         print("Available prompt templates:")
@@ -361,45 +523,58 @@ def _cmd_prompt(
     return 0
 
 
-def _cmd_run(source: str, input_file: str | None = None, no_retry: bool = False) -> int:
-    workflow = parse(source)
+def _cmd_run(
+    source: str,
+    input_file: str | None = None,
+    no_retry: bool = False,
+    workers: int = 1,
+) -> int:
+    from .validator import Validator
+
+    workflow = _load(source)
     errors = Validator().validate(workflow)
     if errors:
-        for e in errors:
-            print(f"Validation error: {e}", file=sys.stderr)
+        _print_errors(errors, "Validation error: ")
         return 1
 
     input_data = None
     if input_file:
         try:
-            with open(input_file, encoding="utf-8") as f:
-                input_data = json.load(f)
+            input_data = _read_json(input_file)
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Error reading input file: {e}", file=sys.stderr)
             return 1
 
+    from .engine import ExecutionEngine
+    from .resilience import API_RETRY, NO_RETRY
+
     policy = NO_RETRY if no_retry else API_RETRY
-    engine = ExecutionEngine(retry_policy=policy, input_data=input_data)
+    engine = ExecutionEngine(retry_policy=policy, input_data=input_data, max_workers=workers)
     result = engine.execute(workflow)
     print(result.summary())
     return 0 if result.success else 1
 
 
 def _cmd_webhook(source: str, host: str = "0.0.0.0", port: int = 8080) -> int:
+    from .validator import Validator
+
     # Validate first
-    workflow = parse(source)
+    workflow = _load(source)
     errors = Validator().validate(workflow)
     if errors:
-        for e in errors:
-            print(f"Validation error: {e}", file=sys.stderr)
+        _print_errors(errors, "Validation error: ")
         return 1
 
-    server = WebhookServer(source, host=host, port=port)
+    from .webhook import WebhookServer
+
+    server = WebhookServer(workflow, source=source, host=host, port=port)
     server.start()
     return 0
 
 
 def _cmd_sourcemap(source: str, out_file: str | None = None) -> int:
+    from .sourcemap import generate_source_map
+
     try:
         sm = generate_source_map(source)
     except Exception as e:
@@ -420,6 +595,9 @@ def _cmd_sourcemap(source: str, out_file: str | None = None) -> int:
 
 
 def _cmd_registry(args) -> int:
+    from .registry import WorkflowRegistry
+    from .validator import Validator
+
     reg = WorkflowRegistry()
     cmd = args.reg_command
 
@@ -461,12 +639,10 @@ def _cmd_registry(args) -> int:
             return 1
 
         # Validate before publishing
-        workflow = parse(source)
+        workflow = _load(source)
         errors = Validator().validate(workflow)
         if errors:
-            print("Validation failed:", file=sys.stderr)
-            for e in errors:
-                print(f"  {e}", file=sys.stderr)
+            _print_errors(errors, "  ", header="Validation failed:")
             return 1
 
         name = args.name or workflow.name
@@ -490,5 +666,75 @@ def _cmd_registry(args) -> int:
     return 0
 
 
+# ---------------------------------------------------------------------------
+# Command dispatch
+#
+# Commands that read an input file take (source, args); the rest take args.
+# `compile --watch` bypasses both: the watcher reads (and re-reads) the
+# file itself.
+# ---------------------------------------------------------------------------
+
+def _dispatch_prompt(args: argparse.Namespace) -> int:
+    return _cmd_prompt(
+        template=args.template,
+        task_desc=args.task_desc,
+        list_all=args.list_all,
+    )
+
+
+def _dispatch_watch(args: argparse.Namespace) -> int:
+    from .watcher import watch_and_compile
+
+    watch_and_compile(args.file, spec=args.spec, pretty=args.pretty)
+    return 0
+
+
+def _dispatch_compile(source: str, args: argparse.Namespace) -> int:
+    return _cmd_compile(source, pretty=args.pretty, spec=args.spec)
+
+
+def _dispatch_simulate(source: str, args: argparse.Namespace) -> int:
+    return _cmd_simulate(
+        source,
+        input_file=args.input_file,
+        max_operations=args.max_operations,
+        max_depth=args.max_depth,
+        max_conditions=args.max_conditions,
+    )
+
+
+def _dispatch_sourcemap(source: str, args: argparse.Namespace) -> int:
+    return _cmd_sourcemap(source, out_file=args.out)
+
+
+def _dispatch_run(source: str, args: argparse.Namespace) -> int:
+    return _cmd_run(source, input_file=args.input_file, no_retry=args.no_retry, workers=args.workers)
+
+
+def _dispatch_webhook(source: str, args: argparse.Namespace) -> int:
+    return _cmd_webhook(source, host=args.host, port=args.port)
+
+
+_COMMANDS: dict[str, Callable[[argparse.Namespace], int]] = {
+    "prompt": _dispatch_prompt,
+    "registry": _cmd_registry,
+}
+
+_FILE_COMMANDS: dict[str, Callable[[str, argparse.Namespace], int]] = {
+    "compile": _dispatch_compile,
+    "validate": lambda source, args: _cmd_validate(source),
+    "ast": lambda source, args: _cmd_ast(source),
+    "graph": lambda source, args: _cmd_graph(source),
+    "simulate": _dispatch_simulate,
+    "decompile": lambda source, args: _cmd_decompile(source),
+    "recover": lambda source, args: _cmd_recover(source),
+    "tokens": lambda source, args: _cmd_tokens(source),
+    "score": lambda source, args: _cmd_score(source),
+    "sourcemap": _dispatch_sourcemap,
+    "run": _dispatch_run,
+    "webhook": _dispatch_webhook,
+}
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+from typing import Any, BinaryIO, Callable
 
 from .ast_nodes import (
     ArrayValue,
@@ -17,6 +17,25 @@ from .ast_nodes import (
     Value,
 )
 from .errors import CompileError
+from ._json import dumpb, dumps
+
+# Leaf value types that compile to themselves. The hot loops test this
+# inline and only call _compile_value() for structured values.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Value compile functions used by the _VALUE_COMPILERS tables (here and in
+# compiler_spec). They take the compiler first so nested values recurse.
+
+def _identity(compiler: object, value: object) -> object:
+    return value
+
+
+def _compile_path(compiler: object, path: Path) -> str:
+    return path.raw
+
+
+def _compile_credential(compiler: object, cred: Credential) -> dict:
+    return {"credentialRef": {"id": cred.id}}
 
 
 class Compiler:
@@ -24,60 +43,45 @@ class Compiler:
 
     def compile(self, workflow: Workflow) -> str:
         """Return JSONL string (one JSON object per line)."""
-        operations = [self._compile_operation(op) for op in workflow.operations]
-
-        # Determine execution order
-        if workflow.execution_order:
-            exec_order = list(workflow.execution_order)
-        else:
-            exec_order = [op.id for op in workflow.operations]
-
-        lines = []
-
-        # Line 1: operationUpdate
-        lines.append(json.dumps({
-            "operationUpdate": {
-                "workflowId": workflow.name,
-                "operations": operations,
-            }
-        }, separators=(",", ":")))
+        update, begin = self._build_payloads(workflow)
+        return f"{dumps(update)}\n{dumps(begin)}"
 
-        # Line 2: beginExecution
-        lines.append(json.dumps({
-            "beginExecution": {
-                "workflowId": workflow.name,
-                "root": exec_order[0] if exec_order else "",
-            }
-        }, separators=(",", ":")))
+    def write(self, workflow: Workflow, stream: BinaryIO, *, pretty: bool = False) -> None:
+        """Write the JSONL to a binary stream, newline-terminated.
 
-        return "\n".join(lines)
+        Same content as compile() (or compile_pretty() when pretty), but
+        each message is encoded straight to bytes instead of being joined
+        into one str first.
+        """
+        update, begin = self._build_payloads(workflow)
+        stream.write(dumpb(update, pretty=pretty) + (b"\n\n" if pretty else b"\n"))
+        stream.write(dumpb(begin, pretty=pretty) + b"\n")
 
     def compile_pretty(self, workflow: Workflow) -> str:
         """Return pretty-printed JSONL (one JSON object per line, indented)."""
-        operations = [self._compile_operation(op) for op in workflow.operations]
+        update, begin = self._build_payloads(workflow)
+        return f"{dumps(update, pretty=True)}\n\n{dumps(begin, pretty=True)}"
 
+    def _build_payloads(self, workflow: Workflow) -> tuple[dict, dict]:
+        """Return the (operationUpdate, beginExecution) messages."""
         if workflow.execution_order:
-            exec_order = list(workflow.execution_order)
+            root = workflow.execution_order[0]
         else:
-            exec_order = [op.id for op in workflow.operations]
+            root = workflow.operations[0].id if workflow.operations else ""
 
-        lines = []
-
-        lines.append(json.dumps({
+        update = {
             "operationUpdate": {
                 "workflowId": workflow.name,
-                "operations": operations,
+                "operations": list(map(self._compile_operation, workflow.operations)),
             }
-        }, indent=2))
-
-        lines.append(json.dumps({
+        }
+        begin = {
             "beginExecution": {
                 "workflowId": workflow.name,
-                "root": exec_order[0] if exec_order else "",
+                "root": root,
             }
-        }, indent=2))
-
-        return "\n\n".join(lines)
+        }
+        return update, begin
 
     # ------------------------------------------------------------------
     # Operation compilation
@@ -115,8 +119,8 @@ class Compiler:
                 config["ifFalse"] = _target_list(op.if_clause.if_false)
 
         # All other properties
-        for prop in op.properties:
-            config[prop.key] = self._compile_value(prop.value)
+        for key, value in op.properties:
+            config[key] = value if type(value) in _SCALAR_TYPES else self._compile_value(value)
 
         return {
             "id": op.id,
@@ -130,38 +134,59 @@ class Compiler:
             "field": cond.field,
             "operator": cond.operator,
         }
-        if cond.value is not None:
-            result["value"] = self._compile_value(cond.value)
+        value = cond.value
+        if value is not None:
+            result["value"] = value if type(value) in _SCALAR_TYPES else self._compile_value(value)
         return result
 
     def _compile_value(self, value: Value) -> object:
-        if isinstance(value, (str, int, float, bool)):
-            return value
-        if value is None:
-            return None
-        if isinstance(value, Path):
-            return value.raw
-        if isinstance(value, Credential):
-            return {"credentialRef": {"id": value.id}}
-        if isinstance(value, ObjectValue):
-            return self._compile_object(value)
-        if isinstance(value, ArrayValue):
-            return [self._compile_value(item) for item in value.items]
-        raise CompileError(f"Unknown value type: {type(value)}")
+        compile_fn = self._VALUE_COMPILERS.get(type(value))
+        if compile_fn is None:
+            # Subclasses of the value types: use the nearest base's entry
+            for base in type(value).__mro__[1:]:
+                compile_fn = self._VALUE_COMPILERS.get(base)
+                if compile_fn is not None:
+                    break
+            else:
+                raise CompileError(f"Unknown value type: {type(value)}")
+        return compile_fn(self, value)
 
     def _compile_object(self, obj: ObjectValue) -> dict:
-        result = {}
-        for prop in obj.properties:
-            result[prop.key] = self._compile_value(prop.value)
-        return result
+        compile_value = self._compile_value
+        return {
+            key: value if type(value) in _SCALAR_TYPES else compile_value(value)
+            for key, value in obj.properties
+        }
+
+    def _compile_array(self, arr: ArrayValue) -> list:
+        compile_value = self._compile_value
+        return [
+            item if type(item) in _SCALAR_TYPES else compile_value(item)
+            for item in arr.items
+        ]
+
+    # Value type -> compile function (subclasses resolve through their MRO)
+    _VALUE_COMPILERS: dict[type, Callable[[Compiler, Any], object]] = {
+        str: _identity,
+        int: _identity,
+        float: _identity,
+        bool: _identity,
+        type(None): _identity,
+        Path: _compile_path,
+        Credential: _compile_credential,
+        ObjectValue: _compile_object,
+        ArrayValue: _compile_array,
+    }
 
 
 # ------------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------------
 
-def _target_list(targets: tuple[str, ...]) -> str | list[str]:
-    """Return a single string for one target, or array for multiple."""
-    if len(targets) == 1:
-        return targets[0]
-    return list(targets)
+def _target_list(targets: tuple[str, ...]) -> str | tuple[str, ...]:
+    """Return a single string for one target, or array for multiple.
+
+    The parser's tuple is returned as is: it serializes as a JSON array
+    and saves copying it into a list for every conditional.
+    """
+    return targets[0] if len(targets) == 1 else targets
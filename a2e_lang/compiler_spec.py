@@ -10,7 +10,9 @@ Output format:
 
 from __future__ import annotations
 
-import json
+import re
+from collections.abc import Iterator
+from typing import Any, BinaryIO, Callable
 
 from .ast_nodes import (
     ArrayValue,
@@ -24,7 +26,9 @@ from .ast_nodes import (
     Workflow,
     Value,
 )
+from .compiler import _SCALAR_TYPES, _compile_credential, _compile_path, _identity
 from .errors import CompileError
+from ._json import dumpb, dumps
 
 
 class SpecCompiler:
@@ -32,59 +36,59 @@ class SpecCompiler:
 
     def compile(self, workflow: Workflow) -> str:
         """Return JSONL string matching the official A2E spec format."""
-        if workflow.execution_order:
-            exec_order = list(workflow.execution_order)
-        else:
-            exec_order = [op.id for op in workflow.operations]
-
-        lines = []
-
-        # One operationUpdate line per operation
-        for op in workflow.operations:
-            config = self._compile_operation_config(op)
-            lines.append(json.dumps({
-                "type": "operationUpdate",
-                "operationId": op.id,
-                "operation": {
-                    op.op_type: config,
-                },
-            }, separators=(",", ":")))
-
-        # Final beginExecution line
-        lines.append(json.dumps({
-            "type": "beginExecution",
-            "executionId": workflow.name,
-            "operationOrder": exec_order,
-        }, separators=(",", ":")))
-
+        lines = list(map(self._operation_json, workflow.operations))
+        lines.append(dumps(_begin_execution(workflow)))
         return "\n".join(lines)
 
+    def write(self, workflow: Workflow, stream: BinaryIO, *, pretty: bool = False) -> None:
+        """Write the spec JSONL (pretty: blank-line separated) to a binary stream."""
+        if not pretty:
+            for op in workflow.operations:
+                stream.write(self._operation_json(op).encode("utf-8"))
+                stream.write(b"\n")
+            stream.write(dumpb(_begin_execution(workflow)))
+            stream.write(b"\n")
+            return
+        for i, message in enumerate(self._messages(workflow)):
+            if i:
+                stream.write(b"\n\n")
+            stream.write(dumpb(message, pretty=True))
+        stream.write(b"\n")
+
     def compile_pretty(self, workflow: Workflow) -> str:
         """Return pretty-printed JSONL in official A2E spec format."""
-        if workflow.execution_order:
-            exec_order = list(workflow.execution_order)
-        else:
-            exec_order = [op.id for op in workflow.operations]
+        return "\n\n".join(dumps(m, pretty=True) for m in self._messages(workflow))
 
-        lines = []
+    def _messages(self, workflow: Workflow) -> Iterator[dict]:
+        """Yield one operationUpdate per operation, then beginExecution.
 
+        Messages are produced lazily so each one is serialized and dropped
+        before the next is built.
+        """
         for op in workflow.operations:
-            config = self._compile_operation_config(op)
-            lines.append(json.dumps({
-                "type": "operationUpdate",
-                "operationId": op.id,
-                "operation": {
-                    op.op_type: config,
-                },
-            }, indent=2))
-
-        lines.append(json.dumps({
-            "type": "beginExecution",
-            "executionId": workflow.name,
-            "operationOrder": exec_order,
-        }, indent=2))
-
-        return "\n\n".join(lines)
+            yield self._operation_update(op)
+        yield _begin_execution(workflow)
+
+    def _operation_json(self, op: Operation) -> str:
+        """Compact JSON for op's operationUpdate, cached on the node.
+
+        AST nodes are immutable, so the serialized form can never go stale;
+        recompiling a cached workflow only joins the stored strings.
+        """
+        text = op._spec_json
+        if text is None:
+            text = _flat_operation_json(op) or dumps(self._operation_update(op))
+            object.__setattr__(op, "_spec_json", text)
+        return text
+
+    def _operation_update(self, op: Operation) -> dict:
+        return {
+            "type": "operationUpdate",
+            "operationId": op.id,
+            "operation": {
+                op.op_type: self._compile_operation_config(op),
+            },
+        }
 
     # ------------------------------------------------------------------
     # Operation compilation
@@ -99,6 +103,9 @@ class SpecCompiler:
         if op.output_path:
             config["outputPath"] = op.output_path
 
+        if not (op.properties or op.conditions or op.if_clause):
+            return config  # bare operation: paths at most
+
         if op.conditions:
             config["conditions"] = [
                 self._compile_condition(c) for c in op.conditions
@@ -112,12 +119,13 @@ class SpecCompiler:
             if op.if_clause.value is not None:
                 config["condition"]["value"] = self._compile_value(op.if_clause.value)
 
-            config["ifTrue"] = list(op.if_clause.if_true)
+            # Tuples serialize as JSON arrays; no need to copy into lists
+            config["ifTrue"] = op.if_clause.if_true
             if op.if_clause.if_false:
-                config["ifFalse"] = list(op.if_clause.if_false)
+                config["ifFalse"] = op.if_clause.if_false
 
-        for prop in op.properties:
-            config[prop.key] = self._compile_value(prop.value)
+        for key, value in op.properties:
+            config[key] = value if type(value) in _SCALAR_TYPES else self._compile_value(value)
 
         return config
 
@@ -126,27 +134,123 @@ class SpecCompiler:
             "field": cond.field,
             "operator": cond.operator,
         }
-        if cond.value is not None:
-            result["value"] = self._compile_value(cond.value)
+        value = cond.value
+        if value is not None:
+            result["value"] = value if type(value) in _SCALAR_TYPES else self._compile_value(value)
         return result
 
     def _compile_value(self, value: Value) -> object:
-        if isinstance(value, (str, int, float, bool)):
-            return value
-        if value is None:
-            return None
-        if isinstance(value, Path):
-            return value.raw
-        if isinstance(value, Credential):
-            return {"credentialRef": {"id": value.id}}
-        if isinstance(value, ObjectValue):
-            return self._compile_object(value)
-        if isinstance(value, ArrayValue):
-            return [self._compile_value(item) for item in value.items]
-        raise CompileError(f"Unknown value type: {type(value)}")
+        compile_fn = self._VALUE_COMPILERS.get(type(value))
+        if compile_fn is None:
+            # Subclasses of the value types: use the nearest base's entry
+            for base in type(value).__mro__[1:]:
+                compile_fn = self._VALUE_COMPILERS.get(base)
+                if compile_fn is not None:
+                    break
+            else:
+                raise CompileError(f"Unknown value type: {type(value)}")
+        return compile_fn(self, value)
 
     def _compile_object(self, obj: ObjectValue) -> dict:
-        result = {}
-        for prop in obj.properties:
-            result[prop.key] = self._compile_value(prop.value)
-        return result
+        compile_value = self._compile_value
+        return {
+            key: value if type(value) in _SCALAR_TYPES else compile_value(value)
+            for key, value in obj.properties
+        }
+
+    def _compile_array(self, arr: ArrayValue) -> list:
+        compile_value = self._compile_value
+        return [
+            item if type(item) in _SCALAR_TYPES else compile_value(item)
+            for item in arr.items
+        ]
+
+    # Value type -> compile function (subclasses resolve through their MRO)
+    _VALUE_COMPILERS: dict[type, Callable[[SpecCompiler, Any], object]] = {
+        str: _identity,
+        int: _identity,
+        float: _identity,
+        bool: _identity,
+        type(None): _identity,
+        Path: _compile_path,
+        Credential: _compile_credential,
+        ObjectValue: _compile_object,
+        ArrayValue: _compile_array,
+    }
+
+
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
+
+# Strings that serialize as themselves between quotes: no quote, backslash,
+# control character or lone surrogate.
+_plain_string = re.compile(r'[^"\\\x00-\x1f\ud800-\udfff]*').fullmatch
+
+# Structural keys that _compile_operation_config writes before properties
+_FLAT_RESERVED = frozenset({"inputPath", "outputPath"})
+
+
+def _flat_operation_json(op: Operation) -> str | None:
+    """Hand-build the operationUpdate JSON for a flat operation, else None.
+
+    Covers the common case: no where/if clause and only string, int, bool,
+    null or path properties whose text needs no escaping. The result is
+    byte-identical to dumps(); anything else (floats, nested values,
+    repeated keys) returns None and takes the generic path.
+    """
+    if op.conditions or op.if_clause:
+        return None
+    if not (_plain_string(op.id) and _plain_string(op.op_type)):
+        return None
+
+    parts = []
+    if op.input_path:
+        if not _plain_string(op.input_path):
+            return None
+        parts.append(f'"inputPath":"{op.input_path}"')
+    if op.output_path:
+        if not _plain_string(op.output_path):
+            return None
+        parts.append(f'"outputPath":"{op.output_path}"')
+
+    seen = set()
+    for key, value in op.properties:
+        if key in seen or key in _FLAT_RESERVED or not _plain_string(key):
+            return None
+        seen.add(key)
+        t = type(value)
+        if t is str:
+            if not _plain_string(value):
+                return None
+            parts.append(f'"{key}":"{value}"')
+        elif t is Path:
+            if not _plain_string(value.raw):
+                return None
+            parts.append(f'"{key}":"{value.raw}"')
+        elif t is bool:
+            parts.append(f'"{key}":true' if value else f'"{key}":false')
+        elif t is int and -(1 << 63) <= value < (1 << 64):  # orjson's range
+            parts.append(f'"{key}":{value}')
+        elif value is None:
+            parts.append(f'"{key}":null')
+        else:
+            return None
+
+    return (
+        f'{{"type":"operationUpdate","operationId":"{op.id}",'
+        f'"operation":{{"{op.op_type}":{{{",".join(parts)}}}}}}}'
+    )
+
+
+def _begin_execution(workflow: Workflow) -> dict:
+    return {
+        "type": "beginExecution",
+        "executionId": workflow.name,
+        "operationOrder": _operation_order(workflow),
+    }
+
+
+def _operation_order(workflow: Workflow) -> tuple[str, ...]:
+    """The run: order, or declaration order. Tuples serialize as arrays."""
+    return workflow.execution_order or tuple(op.id for op in workflow.operations)
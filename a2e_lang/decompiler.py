@@ -6,7 +6,11 @@ This enables round-tripping: DSL -> JSONL -> DSL.
 
 from __future__ import annotations
 
-import json
+import io
+from collections.abc import Iterable, Iterator
+from itertools import chain
+
+from ._json import loads
 
 
 class Decompiler:
@@ -18,16 +22,16 @@ class Decompiler:
         Automatically detects whether the input is in spec format
         (one line per operation) or legacy format (bundled operations).
         """
-        lines_raw = [ln.strip() for ln in jsonl.strip().splitlines() if ln.strip()]
-        messages = [json.loads(ln) for ln in lines_raw]
-
-        if not messages:
+        messages = _iter_messages(jsonl)
+        first = next(messages, None)
+        if first is None:
             raise ValueError("Empty JSONL input")
+        messages = chain((first,), messages)
 
         # Detect format
-        if messages[0].get("type") == "operationUpdate":
+        if first.get("type") == "operationUpdate":
             return self._decompile_spec(messages)
-        elif "operationUpdate" in messages[0]:
+        elif "operationUpdate" in first:
             return self._decompile_legacy(messages)
         else:
             raise ValueError(
@@ -35,7 +39,7 @@ class Decompiler:
                 "(type: operationUpdate) or legacy format (operationUpdate: {...})."
             )
 
-    def _decompile_spec(self, messages: list[dict]) -> str:
+    def _decompile_spec(self, messages: Iterable[dict]) -> str:
         """Decompile official A2E spec format."""
         operations = []
         workflow_name = "workflow"
@@ -56,7 +60,7 @@ class Decompiler:
 
         return self._render_dsl(workflow_name, operations, execution_order)
 
-    def _decompile_legacy(self, messages: list[dict]) -> str:
+    def _decompile_legacy(self, messages: Iterable[dict]) -> str:
         """Decompile legacy bundled format."""
         operations = []
         workflow_name = "workflow"
@@ -110,24 +114,21 @@ class Decompiler:
         lines: list[str] = []
         prefix = " " * indent
 
-        # Handle structural fields first
-        input_path = config.get("inputPath")
-        output_path = config.get("outputPath")
-        conditions = config.get("conditions")
-        condition = config.get("condition")
-        if_true = config.get("ifTrue")
-        if_false = config.get("ifFalse")
+        # Take the structural fields out; what remains are regular properties
+        props = config.copy()
+        input_path = props.pop("inputPath", None)
+        output_path = props.pop("outputPath", None)
+        conditions = props.pop("conditions", None)
+        condition = props.pop("condition", None)
+        if_true = props.pop("ifTrue", None)
+        if_false = props.pop("ifFalse", None)
 
         # inputPath -> from clause
         if input_path:
             lines.append(f"{prefix}from {input_path}")
 
-        # Regular properties (excluding structural fields)
-        structural = {"inputPath", "outputPath", "conditions", "condition", "ifTrue", "ifFalse"}
-        for key, value in config.items():
-            if key in structural:
-                continue
-            rendered = self._render_value(value, indent)
+        for key, value in props.items():
+            rendered = _render_value(value, indent)
             lines.append(f"{prefix}{key}: {rendered}")
 
         # conditions -> where clause
@@ -137,7 +138,7 @@ class Decompiler:
                 field = c["field"]
                 operator = c["operator"]
                 if "value" in c:
-                    val = self._render_value(c["value"], indent)
+                    val = _render_value(c["value"], indent)
                     cond_parts.append(f"{field} {operator} {val}")
                 else:
                     cond_parts.append(f"{field} {operator}")
@@ -150,7 +151,7 @@ class Decompiler:
             cond_val = condition.get("value")
             if_line = f"{prefix}if {path} {operator}"
             if cond_val is not None:
-                if_line += f" {self._render_value(cond_val, indent)}"
+                if_line += f" {_render_value(cond_val, indent)}"
 
             # ifTrue targets
             if isinstance(if_true, list):
@@ -172,47 +173,67 @@ class Decompiler:
 
         return lines
 
-    def _render_value(self, value: object, indent: int = 2) -> str:
-        """Render a JSON value as DSL syntax."""
-        if value is None:
-            return "null"
-        if isinstance(value, bool):
-            return "true" if value else "false"
-        if isinstance(value, (int, float)):
-            return str(value)
-        if isinstance(value, str):
-            # Check if it looks like a path
-            if value.startswith("/"):
-                return value
-            return f'"{value}"'
-        if isinstance(value, dict):
-            # Check for credential ref
-            if "credentialRef" in value:
-                cred_id = value["credentialRef"].get("id", "")
-                return f'credential("{cred_id}")'
-            # Render as object
-            return self._render_object(value, indent)
-        if isinstance(value, list):
-            # Check if all items are strings that look like paths
-            items = [self._render_value(item, indent) for item in value]
-            return "[" + ", ".join(items) + "]"
-        return str(value)
 
-    def _render_object(self, obj: dict, indent: int) -> str:
-        """Render a dict as a DSL object literal."""
-        if not obj:
-            return "{}"
-        parts = []
-        for key, val in obj.items():
-            parts.append(f"{key}: {self._render_value(val, indent)}")
-        # Single-line if short enough
-        inline = "{ " + ", ".join(parts) + " }"
-        if len(inline) <= 80:
-            return inline
-        # Multi-line
-        prefix = " " * (indent + 2)
-        lines = ["{"]
-        for part in parts:
-            lines.append(f"{prefix}{part}")
-        lines.append(" " * indent + "}")
-        return "\n".join(lines)
+# ------------------------------------------------------------------
+# Input
+# ------------------------------------------------------------------
+
+def _iter_messages(jsonl: str) -> Iterator[dict]:
+    """Parse JSONL one line at a time, skipping blank lines.
+
+    Only "\n" ends a line, so U+2028 and other Unicode line breaks that
+    appear unescaped inside JSON strings do not split a message.
+    """
+    for line in io.StringIO(jsonl):
+        line = line.strip()
+        if line:
+            yield loads(line)
+
+
+# ------------------------------------------------------------------
+# Value rendering
+# ------------------------------------------------------------------
+
+def _render_value(value: object, indent: int = 2) -> str:
+    """Render a JSON value as DSL syntax.
+
+    Decoded JSON only holds exact built-in types, so dispatch on type()
+    rather than an isinstance ladder (bool would otherwise match int).
+    """
+    t = type(value)
+    if t is str:
+        # Paths are written bare
+        if value.startswith("/"):
+            return value
+        return f'"{value}"'
+    if t is int or t is float:
+        return str(value)
+    if t is bool:
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if t is dict:
+        cred_ref = value.get("credentialRef")
+        if cred_ref is not None:
+            return f'credential("{cred_ref.get("id", "")}")'
+        return _render_object(value, indent)
+    if t is list:
+        return "[" + ", ".join([_render_value(item, indent) for item in value]) + "]"
+    return str(value)
+
+
+def _render_object(obj: dict, indent: int) -> str:
+    """Render a dict as a DSL object literal."""
+    if not obj:
+        return "{}"
+    parts = [f"{key}: {_render_value(val, indent)}" for key, val in obj.items()]
+    # Single-line if short enough
+    inline = "{ " + ", ".join(parts) + " }"
+    if len(inline) <= 80:
+        return inline
+    # Multi-line
+    prefix = " " * (indent + 2)
+    lines = ["{"]
+    lines.extend([f"{prefix}{part}" for part in parts])
+    lines.append(" " * indent + "}")
+    return "\n".join(lines)
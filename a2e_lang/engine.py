@@ -7,11 +7,17 @@ registered handlers. Integrates structured logging and resilience
 
 from __future__ import annotations
 
+import operator
 import time
+from collections import ChainMap, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from datetime import datetime, timezone
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, MutableMapping, Sequence
 
-from .ast_nodes import Operation, Path, Workflow
+from .ast_nodes import ArrayValue, Condition, Operation, Path, Workflow
 from .logging import ExecutionLogger, PipelineLog, OperationLog
 from .resilience import (
     CircuitBreaker,
@@ -30,10 +36,26 @@ OperationHandler = Callable[[Operation, "ExecutionContext"], Any]
 
 _HANDLERS: dict[str, OperationHandler] = {}
 
+# Operation types whose handler cannot fail: run without retry or circuit
+_UNGUARDED: set[str] = set()
 
-def register_handler(op_type: str, handler: OperationHandler) -> None:
-    """Register a handler for an operation type."""
+
+def register_handler(
+    op_type: str,
+    handler: OperationHandler,
+    *,
+    needs_circuit: bool = True,
+) -> None:
+    """Register a handler for an operation type.
+
+    Pass needs_circuit=False for handlers that cannot fail; they are called
+    directly, without the retry policy or a circuit breaker.
+    """
     _HANDLERS[op_type] = handler
+    if needs_circuit:
+        _UNGUARDED.discard(op_type)
+    else:
+        _UNGUARDED.add(op_type)
 
 
 def get_handler(op_type: str) -> OperationHandler | None:
@@ -45,10 +67,10 @@ def get_handler(op_type: str) -> OperationHandler | None:
 # Execution context
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Runtime context available to operation handlers."""
-    data: dict[str, Any] = field(default_factory=dict)
+    data: MutableMapping[str, Any] = field(default_factory=dict)
     logger: ExecutionLogger | None = None
     retry_policy: RetryPolicy = field(default_factory=lambda: API_RETRY)
     circuit_breakers: dict[str, CircuitBreaker] = field(default_factory=dict)
@@ -97,19 +119,18 @@ def _handle_filter_data(op: Operation, ctx: ExecutionContext) -> Any:
     if not op.conditions:
         return input_data
 
-    results = []
-    for item in input_data:
-        if not isinstance(item, dict):
-            continue
-        match = True
-        for cond in op.conditions:
-            val = item.get(cond.field)
-            if not _eval_condition(val, cond.operator, _resolve_value(cond.value)):
-                match = False
-                break
-        if match:
-            results.append(item)
-    return results
+    preds = op._predicates
+    if preds is None:
+        preds = tuple(map(_condition_predicate, op.conditions))
+        object.__setattr__(op, "_predicates", preds)
+
+    if len(preds) == 1:
+        pred = preds[0]
+        return [item for item in input_data if isinstance(item, dict) and pred(item)]
+    return [
+        item for item in input_data
+        if isinstance(item, dict) and all(pred(item) for pred in preds)
+    ]
 
 
 def _handle_transform_data(op: Operation, ctx: ExecutionContext) -> Any:
@@ -127,25 +148,26 @@ def _handle_merge_data(op: Operation, ctx: ExecutionContext) -> Any:
     sources = _get_prop(op, "sources")
     strategy = _get_prop(op, "strategy") or "concat"
 
-    if not isinstance(sources, list):
+    if isinstance(sources, ArrayValue):
+        sources = sources.items
+    elif not isinstance(sources, list):
         return None
 
-    merged: list = []
-    for src in sources:
-        path = src if isinstance(src, str) else getattr(src, "raw", str(src))
-        data = ctx.get(path)
-        if isinstance(data, list):
-            merged.extend(data)
-        elif data is not None:
-            merged.append(data)
-
-    return merged
+    get = ctx.get
+    datas = [
+        get(src if isinstance(src, str) else getattr(src, "raw", str(src)))
+        for src in sources
+    ]
+    # Lists are spliced in, other values appended, missing sources dropped
+    return list(chain.from_iterable(
+        data if isinstance(data, list) else (data,)
+        for data in datas if data is not None
+    ))
 
 
 def _handle_get_datetime(op: Operation, ctx: ExecutionContext) -> Any:
     """Execute a GetCurrentDateTime operation."""
-    import datetime
-    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+    return datetime.now(timezone.utc).isoformat()
 
 
 def _handle_calculate(op: Operation, ctx: ExecutionContext) -> Any:
@@ -172,20 +194,20 @@ register_handler("StoreData", _handle_store_data)
 register_handler("FilterData", _handle_filter_data)
 register_handler("TransformData", _handle_transform_data)
 register_handler("MergeData", _handle_merge_data)
-register_handler("GetCurrentDateTime", _handle_get_datetime)
-register_handler("Calculate", _handle_calculate)
-register_handler("FormatText", _handle_format_text)
+register_handler("GetCurrentDateTime", _handle_get_datetime, needs_circuit=False)
+register_handler("Calculate", _handle_calculate, needs_circuit=False)
+register_handler("FormatText", _handle_format_text, needs_circuit=False)
 
 
 # ---------------------------------------------------------------------------
 # Engine
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of a workflow execution."""
     success: bool
-    data: dict[str, Any] = field(default_factory=dict)
+    data: MutableMapping[str, Any] = field(default_factory=dict)
     pipeline_log: PipelineLog | None = None
     error: str | None = None
 
@@ -196,6 +218,26 @@ class ExecutionResult:
         return f"{status}: {self.error or 'OK'}"
 
 
+# (operation, handler, guarded); Conditionals have no handler. Unguarded
+# steps (pure handlers and the no-op fallback) skip retry and circuit.
+_Step = tuple[Operation, OperationHandler | None, bool]
+
+
+@dataclass(frozen=True)
+class PreparedWorkflow:
+    """A workflow resolved once for repeated execution.
+
+    Built by ExecutionEngine.prepare(). Handlers and branch targets are
+    looked up ahead of time, so each run only iterates over the steps.
+    Handlers registered after preparing are not picked up.
+    """
+    workflow: Workflow
+    steps: tuple[_Step, ...]            # run order
+    skipped: tuple[str, ...]            # IDs in the run order with no operation
+    by_id: Mapping[str, _Step]          # every operation, for level scheduling
+    branches: Mapping[str, tuple[tuple[_Step, ...], tuple[_Step, ...]]]  # then/else
+
+
 class ExecutionEngine:
     """Native Python runtime for executing a2e-lang workflows.
 
@@ -204,41 +246,80 @@ class ExecutionEngine:
     - Structured logging with per-operation timing
     - Retry + circuit breaker per operation
     - Data flow through paths
+    - Optional concurrent execution of independent operations
+
+    Args:
+        retry_policy: Retry policy applied to each operation.
+        input_data: Initial path -> value mappings. Copied per run, unless
+            it is a read-only ``MappingProxyType``: then each run layers
+            its writes over it with a ``ChainMap`` and ``result.data`` is
+            that ChainMap.
+        max_workers: When > 1 and the workflow has no explicit ``run:``
+            order, operations with no pending dependencies are dispatched
+            together on a thread pool, one dependency level at a time.
     """
 
     def __init__(
         self,
         retry_policy: RetryPolicy | None = None,
-        input_data: dict[str, Any] | None = None,
+        input_data: Mapping[str, Any] | None = None,
+        max_workers: int = 1,
     ):
         self.retry_policy = retry_policy or API_RETRY
-        self.initial_data = input_data or {}
+        self.initial_data = input_data if input_data is not None else {}
+        self.max_workers = max_workers
+
+    def prepare(self, workflow: Workflow) -> PreparedWorkflow:
+        """Resolve a workflow's run order, handlers and branches once.
+
+        Pass the result to execute() to run the same workflow repeatedly
+        without resolving it again.
+        """
+        lookup = _HANDLERS.get
+        by_id: dict[str, _Step] = {}
+        for op in workflow.operations:
+            if op.op_type == "Conditional" and op.if_clause:
+                by_id[op.id] = (op, None, False)
+            else:
+                handler = lookup(op.op_type, _handle_noop)
+                guarded = handler is not _handle_noop and op.op_type not in _UNGUARDED
+                by_id[op.id] = (op, handler, guarded)
+
+        def resolve(ids: Sequence[str] | None) -> tuple[_Step, ...]:
+            return tuple(by_id[op_id] for op_id in ids or () if op_id in by_id)
+
+        branches = {
+            op_id: (resolve(op.if_clause.if_true), resolve(op.if_clause.if_false))
+            for op_id, (op, handler, _) in by_id.items() if handler is None
+        }
+        order = workflow.execution_order or tuple(op.id for op in workflow.operations)
+        return PreparedWorkflow(
+            workflow=workflow,
+            steps=resolve(order),
+            skipped=tuple(op_id for op_id in order if op_id not in by_id),
+            by_id=MappingProxyType(by_id),
+            branches=MappingProxyType(branches),
+        )
+
+    def execute(self, workflow: Workflow | PreparedWorkflow) -> ExecutionResult:
+        """Execute a workflow (or a prepared one) and return the result."""
+        prepared = workflow if isinstance(workflow, PreparedWorkflow) else self.prepare(workflow)
+        workflow = prepared.workflow
 
-    def execute(self, workflow: Workflow) -> ExecutionResult:
-        """Execute a workflow and return the result."""
         logger = ExecutionLogger(workflow.name)
         ctx = ExecutionContext(
-            data=dict(self.initial_data),
+            data=self._initial_store(),
             logger=logger,
             retry_policy=self.retry_policy,
         )
 
-        op_map = {op.id: op for op in workflow.operations}
-
-        # Determine execution order
-        if workflow.execution_order:
-            exec_order = list(workflow.execution_order)
-        else:
-            exec_order = [op.id for op in workflow.operations]
-
         try:
-            for op_id in exec_order:
-                if op_id not in op_map:
-                    logger.skip_operation(op_id, "unknown", reason="Not defined")
-                    continue
-
-                op = op_map[op_id]
-                self._execute_operation(op, ctx, logger, op_map)
+            for op_id in prepared.skipped:
+                logger.skip_operation(op_id, "unknown", reason="Not defined")
+            if self.max_workers > 1 and not workflow.execution_order:
+                self._execute_levels(prepared, ctx, logger)
+            else:
+                self._drain(deque(prepared.steps), prepared, ctx, logger)
 
         except Exception as e:
             logger.finish("failed")
@@ -256,67 +337,106 @@ class ExecutionEngine:
             pipeline_log=pipeline,
         )
 
-    def _execute_operation(
+    def _initial_store(self) -> MutableMapping[str, Any]:
+        """Return the data store for a new run.
+
+        A read-only base is shared through a ChainMap rather than copied,
+        which matters when a large input is reused across many runs.
+        """
+        if type(self.initial_data) is MappingProxyType:
+            return ChainMap({}, self.initial_data)
+        return dict(self.initial_data)
+
+    def _execute_levels(
         self,
-        op: Operation,
+        prepared: PreparedWorkflow,
         ctx: ExecutionContext,
         logger: ExecutionLogger,
-        op_map: dict[str, Operation],
     ) -> None:
-        """Execute a single operation with retry and logging."""
+        """Run each dependency level of the workflow concurrently."""
+        by_id = prepared.by_id
 
-        # Handle Conditional branching
-        if op.op_type == "Conditional" and op.if_clause:
-            self._execute_conditional(op, ctx, logger, op_map)
-            return
+        def run(op_id: str) -> None:
+            self._drain(deque((by_id[op_id],)), prepared, ctx, logger)
 
-        handler = get_handler(op.op_type) or _handle_noop
-        circuit = ctx.get_circuit(op.id)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for level in prepared.workflow.topo_levels():
+                if len(level) == 1:
+                    run(level[0])
+                else:
+                    list(pool.map(run, level))
 
+    def _drain(
+        self,
+        queue: deque[_Step],
+        prepared: PreparedWorkflow,
+        ctx: ExecutionContext,
+        logger: ExecutionLogger,
+    ) -> None:
+        """Execute steps from the front of the queue until it is empty.
+
+        A Conditional pushes its chosen branch to the front, so the targets
+        run next, in order, without recursing.
+        """
+        while queue:
+            op, handler, guarded = queue.popleft()
+            if handler is None:
+                then_steps, else_steps = prepared.branches[op.id]
+                branch = then_steps if self._execute_conditional(op, ctx, logger) else else_steps
+                queue.extendleft(reversed(branch))
+            else:
+                self._run_operation(op, handler, guarded, ctx, logger)
+
+    def _run_operation(
+        self,
+        op: Operation,
+        handler: OperationHandler,
+        guarded: bool,
+        ctx: ExecutionContext,
+        logger: ExecutionLogger,
+    ) -> None:
+        """Run a resolved handler with logging, and retry when guarded."""
         logger.start_operation(op.id, op.op_type)
 
-        # Wrap handler in retry + circuit breaker
-        result = execute_with_retry(
-            fn=lambda: handler(op, ctx),
-            policy=ctx.retry_policy,
-            circuit=circuit,
-            sleep_fn=time.sleep,
-        )
-
-        if result.success:
-            # Write output to data store
-            if op.output_path and result.value is not None:
-                ctx.set(op.output_path, result.value)
-            logger.complete_operation(op.id, output=result.value, output_path=op.output_path)
+        if guarded:
+            # Wrap handler in retry + circuit breaker
+            result = execute_with_retry(
+                fn=lambda: handler(op, ctx),
+                policy=ctx.retry_policy,
+                circuit=ctx.get_circuit(op.id),
+                sleep_fn=time.sleep,
+            )
+            if not result.success:
+                logger.fail_operation(op.id, str(result.error))
+                return
+            value = result.value
         else:
-            logger.fail_operation(op.id, str(result.error))
+            try:
+                value = handler(op, ctx)
+            except Exception as e:
+                logger.fail_operation(op.id, str(e))
+                return
+
+        # Write output to data store
+        if op.output_path and value is not None:
+            ctx.set(op.output_path, value)
+        logger.complete_operation(op.id, output=value, output_path=op.output_path)
 
     def _execute_conditional(
         self,
         op: Operation,
         ctx: ExecutionContext,
         logger: ExecutionLogger,
-        op_map: dict[str, Operation],
-    ) -> None:
-        """Execute a Conditional operation (branching)."""
+    ) -> bool:
+        """Evaluate a Conditional operation; True selects the then-branch."""
         ic = op.if_clause
         actual = ctx.get(ic.path)
         expected = _resolve_value(ic.value)
         condition_met = _eval_condition(actual, ic.operator, expected)
 
         logger.start_operation(op.id, "Conditional")
-
-        if condition_met:
-            logger.complete_operation(op.id, output={"branch": "then"})
-            for target_id in ic.if_true:
-                if target_id in op_map:
-                    self._execute_operation(op_map[target_id], ctx, logger, op_map)
-        else:
-            logger.complete_operation(op.id, output={"branch": "else"})
-            if ic.if_false:
-                for target_id in ic.if_false:
-                    if target_id in op_map:
-                        self._execute_operation(op_map[target_id], ctx, logger, op_map)
+        logger.complete_operation(op.id, output={"branch": "then" if condition_met else "else"})
+        return condition_met
 
 
 # ---------------------------------------------------------------------------
@@ -325,13 +445,10 @@ class ExecutionEngine:
 
 def _get_prop(op: Operation, key: str) -> Any:
     """Get property value from an operation."""
-    for p in op.properties:
-        if p.key == key:
-            v = p.value
-            if isinstance(v, Path):
-                return v.raw
-            return v
-    return None
+    v = op.prop_map().get(key)
+    if isinstance(v, Path):
+        return v.raw
+    return v
 
 
 def _resolve_value(value: Any) -> Any:
@@ -341,35 +458,56 @@ def _resolve_value(value: Any) -> Any:
     return value
 
 
+# Operator -> comparison(actual, expected), for non-None actual values
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "contains": lambda actual, expected: expected in actual,
+    "in": lambda actual, expected: actual in expected,
+    "startsWith": lambda actual, expected: str(actual).startswith(str(expected)),
+    "endsWith": lambda actual, expected: str(actual).endswith(str(expected)),
+    "exists": lambda actual, expected: True,
+    "empty": lambda actual, expected: not actual,
+}
+
+
+def _condition_predicate(cond: Condition) -> Callable[[dict], bool]:
+    """Compile a where-condition into an item -> bool test.
+
+    The operator and expected value are resolved once, so filtering does no
+    operator dispatch per item. Matches _eval_condition.
+    """
+    compare = _COMPARISONS.get(cond.operator)
+    if compare is None:
+        return lambda item: False
+    field = cond.field
+    expected = _resolve_value(cond.value)
+    missing = cond.operator == "empty"
+
+    def predicate(item: dict) -> bool:
+        actual = item.get(field)
+        if actual is None:
+            return missing
+        try:
+            return compare(actual, expected)
+        except (TypeError, ValueError):
+            return False
+
+    return predicate
+
+
 def _eval_condition(actual: Any, operator: str, expected: Any) -> bool:
     """Evaluate a comparison condition."""
     if actual is None:
-        return operator in ("empty",)
+        return operator == "empty"
+    compare = _COMPARISONS.get(operator)
+    if compare is None:
+        return False
     try:
-        if operator == "==":
-            return actual == expected
-        if operator == "!=":
-            return actual != expected
-        if operator == ">":
-            return actual > expected
-        if operator == "<":
-            return actual < expected
-        if operator == ">=":
-            return actual >= expected
-        if operator == "<=":
-            return actual <= expected
-        if operator == "contains":
-            return expected in actual
-        if operator == "in":
-            return actual in expected
-        if operator == "startsWith":
-            return str(actual).startswith(str(expected))
-        if operator == "endsWith":
-            return str(actual).endswith(str(expected))
-        if operator == "exists":
-            return actual is not None
-        if operator == "empty":
-            return not actual
+        return compare(actual, expected)
     except (TypeError, ValueError):
         return False
-    return False
@@ -24,99 +24,110 @@ _OP_STYLES = {
 
 _DEFAULT_STYLE = "fill:#1e293b,stroke:#64748b,color:#e2e8f0"
 
+# Operation type -> Mermaid node shape template (%s is the label)
+_SHAPE_FMT = {
+    "Conditional": "{%s}",      # diamond
+    "Loop":        "((%s))",    # circle
+    "ApiCall":     "[/%s/]",    # parallelogram (I/O)
+}
 
-def generate_mermaid(workflow: Workflow) -> str:
-    """Generate a Mermaid flowchart from a validated Workflow AST."""
-    lines: list[str] = ["graph TD"]
+_DEFAULT_SHAPE = "[%s]"  # rectangle
 
-    op_map = {op.id: op for op in workflow.operations}
 
-    # Build write registry: output_path -> op_id
-    write_registry: dict[str, str] = {}
-    for op in workflow.operations:
-        if op.output_path:
-            write_registry[op.output_path] = op.id
+def generate_mermaid(workflow: Workflow) -> str:
+    """Generate a Mermaid flowchart from a validated Workflow AST.
+
+    The result is cached on the workflow, so rendering the same AST again
+    (e.g. from a long-running server) is free.
+    """
+    if workflow._mermaid is None:
+        object.__setattr__(workflow, "_mermaid", _render_mermaid(workflow))
+    return workflow._mermaid
+
+
+def _render_mermaid(workflow: Workflow) -> str:
+    reads, writes, cond_edges, loop_edges = _build_indices(workflow)
+
+    # Emission only does dict lookups. Node and style lines carry their
+    # leading newline so each section is a single "".join().
+    nodes: list[str] = []
+    data_edges: list[_Edge] = []
+    styles: list[str] = []
+    for op, op_reads in zip(workflow.operations, reads):
+        op_id = op.id
+        nodes.append(f"\n    {op_id}{_node_shape(op)}")
+        for rp in op_reads:
+            source_id = writes.get(rp)
+            if source_id is not None and source_id != op_id:
+                data_edges.append((source_id, rp, op_id))
+        styles.append(f"\n    style {op_id} {_OP_STYLES.get(op.op_type, _DEFAULT_STYLE)}")
+
+    edges = "".join([
+        f"\n    {src} -->|{label}| {dst}"
+        for src, label, dst in (*data_edges, *cond_edges, *loop_edges)
+    ])
 
-    # Node declarations
-    for op in workflow.operations:
-        shape = _node_shape(op)
-        lines.append(f"    {op.id}{shape}")
+    # Execution order edges (if explicit)
+    order = workflow.execution_order
+    if order and len(order) > 1:
+        order_edges = "\n\n    %% Execution order" + "".join([
+            f"\n    {a} -.->|next| {b}" for a, b in zip(order, order[1:])
+        ])
+    else:
+        order_edges = ""
 
-    lines.append("")
+    # Sections are separated by one blank line
+    return "".join(("graph TD", *nodes, "\n", edges, order_edges, "\n", *styles))
 
-    # Data flow edges (from input paths)
-    for op in workflow.operations:
-        read_paths = _get_read_paths(op)
-        for rp in read_paths:
-            if rp in write_registry and write_registry[rp] != op.id:
-                source_id = write_registry[rp]
-                lines.append(f"    {source_id} -->|{rp}| {op.id}")
 
-    # Conditional edges
-    for op in workflow.operations:
-        if op.if_clause:
-            for target in op.if_clause.if_true:
-                lines.append(f"    {op.id} -->|then| {target}")
-            if op.if_clause.if_false:
-                for target in op.if_clause.if_false:
-                    lines.append(f"    {op.id} -->|else| {target}")
+def _node_shape(op: Operation) -> str:
+    """Return Mermaid node shape based on operation type."""
+    return _SHAPE_FMT.get(op.op_type, _DEFAULT_SHAPE) % f"{op.id}\\n{op.op_type}"
 
-    # Loop edges
-    for op in workflow.operations:
-        if op.op_type == "Loop":
-            ops_prop = _find_property(op, "operations")
-            if ops_prop and isinstance(ops_prop.value, ArrayValue):
-                for item in ops_prop.value.items:
-                    if isinstance(item, str):
-                        lines.append(f"    {op.id} -->|loop| {item}")
 
-    # Execution order edges (if explicit)
-    if workflow.execution_order and len(workflow.execution_order) > 1:
-        lines.append("")
-        lines.append("    %% Execution order")
-        order = list(workflow.execution_order)
-        for i in range(len(order) - 1):
-            lines.append(f"    {order[i]} -.->|next| {order[i+1]}")
+# Edges are (source, label, target)
+_Edge = tuple[str, str, str]
 
-    lines.append("")
 
-    # Styles
+def _build_indices(
+    workflow: Workflow,
+) -> tuple[list[list[str]], dict[str, str], list[_Edge], list[_Edge]]:
+    """Walk the operations once and return the graph's structural tables.
+
+    Returns the paths each operation reads (aligned with
+    workflow.operations), the writer of each output path, the then/else
+    edges and the loop edges.
+    """
+    reads: list[list[str]] = []
+    writes: dict[str, str] = {}
+    cond_edges: list[_Edge] = []
+    loop_edges: list[_Edge] = []
     for op in workflow.operations:
-        style = _OP_STYLES.get(op.op_type, _DEFAULT_STYLE)
-        lines.append(f"    style {op.id} {style}")
+        op_id = op.id
+        props = op.prop_map()
+
+        paths: list[str] = []
+        if op.input_path:
+            paths.append(op.input_path)
+        if op.if_clause:
+            paths.append(op.if_clause.path)
+        sources = props.get("sources")
+        if isinstance(sources, ArrayValue):
+            paths += [item.raw for item in sources.items if isinstance(item, Path)]
+        reads.append(paths)
 
-    return "\n".join(lines)
+        if op.output_path:
+            writes[op.output_path] = op_id
 
+        if op.if_clause:
+            cond_edges += [(op_id, "then", target) for target in op.if_clause.if_true]
+            if op.if_clause.if_false:
+                cond_edges += [(op_id, "else", target) for target in op.if_clause.if_false]
 
-def _node_shape(op: Operation) -> str:
-    """Return Mermaid node shape based on operation type."""
-    label = f"{op.id}\\n{op.op_type}"
-    if op.op_type == "Conditional":
-        return "{" + f"{label}" + "}"  # diamond
-    if op.op_type == "Loop":
-        return f"(({label}))"  # circle
-    if op.op_type in ("ApiCall",):
-        return f"[/{label}/]"  # parallelogram (I/O)
-    return f"[{label}]"  # rectangle
-
-
-def _get_read_paths(op: Operation) -> list[str]:
-    """Extract paths that an operation reads from."""
-    paths: list[str] = []
-    if op.input_path:
-        paths.append(op.input_path)
-    if op.if_clause:
-        paths.append(op.if_clause.path)
-    sources_prop = _find_property(op, "sources")
-    if sources_prop and isinstance(sources_prop.value, ArrayValue):
-        for item in sources_prop.value.items:
-            if isinstance(item, Path):
-                paths.append(item.raw)
-    return paths
-
-
-def _find_property(op, key):
-    for p in op.properties:
-        if p.key == key:
-            return p
-    return None
+        if op.op_type == "Loop":
+            loop_ops = props.get("operations")
+            if isinstance(loop_ops, ArrayValue):
+                loop_edges += [
+                    (op_id, "loop", item) for item in loop_ops.items if isinstance(item, str)
+                ]
+    return reads, writes, cond_edges, loop_edges
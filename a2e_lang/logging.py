@@ -10,11 +10,31 @@ Provides a logging framework for workflow execution that captures:
 
 from __future__ import annotations
 
+import io
+import threading
 import time
-import json
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, BinaryIO, Mapping
+
+from ._json import dumpb, dumps
+
+
+# Shared metadata for log entries that have none; to_dict only reads it.
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+# Collections and strings longer than this are summarized in snapshots,
+# at any depth; containers nested deeper than _SNAPSHOT_MAX_DEPTH are too,
+# and so is anything left once a snapshot has kept _SNAPSHOT_BUDGET
+# characters and items in total
+_SNAPSHOT_MAX_ITEMS = 32
+_SNAPSHOT_MAX_CHARS = 1024
+_SNAPSHOT_MAX_DEPTH = 8
+_SNAPSHOT_BUDGET = 16 * 1024
+
+SNAPSHOT_MODES = ("ref", "summary", "none")
 
 
 class LogLevel(Enum):
@@ -25,7 +45,7 @@ class LogLevel(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationLog:
     """Log entry for a single operation execution."""
     operation_id: str
@@ -38,7 +58,11 @@ class OperationLog:
     input_snapshot: Any = None
     output_snapshot: Any = None
     error: str | None = None
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+    # summary() line, set by ExecutionLogger once the entry is final
+    _rendered: str | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def to_dict(self) -> dict:
         """Convert to serializable dict."""
@@ -65,7 +89,7 @@ class OperationLog:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineLog:
     """Aggregated log for an entire pipeline execution."""
     workflow_name: str
@@ -74,6 +98,21 @@ class PipelineLog:
     status: str = "running"
     operations: list[OperationLog] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    # status -> number of operations in it; kept in step by ExecutionLogger
+    _status_counts: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        for op in self.operations:
+            self._recount(None, op.status)
+
+    def _recount(self, old: str | None, new: str) -> None:
+        """Move one operation from status old (None: new entry) to new."""
+        counts = self._status_counts
+        if old is not None:
+            counts[old] -= 1
+        counts[new] = counts.get(new, 0) + 1
 
     @property
     def total_duration_ms(self) -> float | None:
@@ -87,23 +126,57 @@ class PipelineLog:
 
     @property
     def error_count(self) -> int:
-        return sum(1 for op in self.operations if op.status == "failed")
+        return self._status_counts.get("failed", 0)
 
     @property
     def success_count(self) -> int:
-        return sum(1 for op in self.operations if op.status == "completed")
+        return self._status_counts.get("completed", 0)
 
     def finish(self, status: str = "completed") -> None:
         self.finished_at = time.time()
         self.status = status
 
     def to_dict(self) -> dict:
-        d = {
+        d = self._header()
+        d["operations"] = [op.to_dict() for op in self.operations]
+        d.update(self._trailer())
+        return d
+
+    def to_json(self, pretty: bool = False) -> str:
+        if pretty:
+            return dumps(self.to_dict(), pretty=True, default=str)
+        buf = io.BytesIO()
+        self.write_json(buf)
+        return buf.getvalue().decode("utf-8")
+
+    def write_json(self, stream: BinaryIO, *, pretty: bool = False) -> None:
+        """Write the log as JSON to a binary stream.
+
+        Compact output is streamed one operation at a time, so the full
+        to_dict() structure is never built.
+        """
+        if pretty:
+            stream.write(dumpb(self.to_dict(), pretty=True, default=str))
+            return
+        stream.write(dumpb(self._header(), default=str)[:-1])
+        stream.write(b',"operations":[')
+        for i, op in enumerate(self.operations):
+            if i:
+                stream.write(b",")
+            stream.write(dumpb(op.to_dict(), default=str))
+        stream.write(b"]")
+        trailer = self._trailer()
+        stream.write(b"," + dumpb(trailer, default=str)[1:] if trailer else b"}")
+
+    def _header(self) -> dict:
+        return {
             "workflow_name": self.workflow_name,
             "started_at": self.started_at,
             "status": self.status,
-            "operations": [op.to_dict() for op in self.operations],
         }
+
+    def _trailer(self) -> dict:
+        d = {}
         if self.finished_at:
             d["finished_at"] = self.finished_at
             d["total_duration_ms"] = round(self.total_duration_ms, 3)
@@ -111,48 +184,63 @@ class PipelineLog:
             d["errors"] = self.errors
         return d
 
-    def to_json(self, pretty: bool = False) -> str:
-        indent = 2 if pretty else None
-        return json.dumps(self.to_dict(), indent=indent, default=str)
-
     def summary(self) -> str:
         duration = f"{self.total_duration_ms:.1f}ms" if self.total_duration_ms else "running"
-        lines = [
-            f"Pipeline: {self.workflow_name} [{self.status}]",
-            f"Duration: {duration}",
-            f"Operations: {self.success_count}/{self.operation_count} succeeded",
-            "─" * 50,
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"Pipeline: {self.workflow_name} [{self.status}]\n")
+        w(f"Duration: {duration}\n")
+        w(f"Operations: {self.success_count}/{self.operation_count} succeeded\n")
+        w("─" * 50)
         for op in self.operations:
-            dur = f"{op.duration_ms:.1f}ms" if op.duration_ms else "—"
-            icon = "✅" if op.status == "completed" else "❌" if op.status == "failed" else "⏭️"
-            lines.append(f"  {icon} {op.operation_id} ({op.operation_type}) [{dur}]")
+            w("\n")
+            w(op._rendered or _render_line(op))
             if op.error:
-                lines.append(f"     └─ {op.error}")
+                w(f"\n     └─ {op.error}")
         if self.errors:
-            lines.append("─" * 50)
+            w("\n")
+            w("─" * 50)
             for err in self.errors:
-                lines.append(f"  ⚠ {err}")
-        return "\n".join(lines)
+                w(f"\n  ⚠ {err}")
+        return buf.getvalue()
 
 
 class ExecutionLogger:
     """Logger that tracks operation executions in a pipeline."""
 
-    def __init__(self, workflow_name: str):
+    def __init__(self, workflow_name: str, snapshot_mode: str = "summary"):
+        """
+        Args:
+            workflow_name: Name recorded on the pipeline log.
+            snapshot_mode: How operation outputs are kept: "ref" stores the
+                value itself, "summary" (default) replaces large collections
+                and strings with a small description, "none" drops them.
+        """
+        if snapshot_mode not in SNAPSHOT_MODES:
+            raise ValueError(
+                f"Unknown snapshot_mode '{snapshot_mode}', expected one of {SNAPSHOT_MODES}"
+            )
+        self.snapshot_mode = snapshot_mode
         self.pipeline = PipelineLog(workflow_name=workflow_name)
         self._op_starts: dict[str, float] = {}
+        # Serializes status changes so the pipeline's counters stay exact
+        # when operations run on a thread pool
+        self._lock = threading.Lock()
+        # op_id -> most recent log entry, kept in step with pipeline.operations
+        self._log_index: dict[str, OperationLog] = {}
 
     def start_operation(self, op_id: str, op_type: str, **metadata) -> None:
         """Log the start of an operation."""
-        self._op_starts[op_id] = time.time()
+        now = time.time()
+        self._op_starts[op_id] = now
         log = OperationLog(
             operation_id=op_id,
             operation_type=op_type,
             status="started",
-            metadata=metadata,
+            timestamp=now,
+            metadata=metadata or _EMPTY_METADATA,
         )
-        self.pipeline.operations.append(log)
+        self._add(log)
 
     def complete_operation(
         self,
@@ -163,24 +251,28 @@ class ExecutionLogger:
         """Log the successful completion of an operation."""
         log = self._find_log(op_id)
         if log:
-            log.status = "completed"
+            self._set_status(log, "completed")
             start = self._op_starts.get(op_id)
             if start:
                 log.duration_ms = (time.time() - start) * 1000
-            if output is not None:
-                log.output_snapshot = output
+            if output is not None and self.snapshot_mode != "none":
+                log.output_snapshot = (
+                    output if self.snapshot_mode == "ref" else _summarize(output)
+                )
             if output_path:
                 log.output_path = output_path
+            log._rendered = _render_line(log)
 
     def fail_operation(self, op_id: str, error: str) -> None:
         """Log an operation failure."""
         log = self._find_log(op_id)
         if log:
-            log.status = "failed"
+            self._set_status(log, "failed")
             log.error = error
             start = self._op_starts.get(op_id)
             if start:
                 log.duration_ms = (time.time() - start) * 1000
+            log._rendered = _render_line(log)
         self.pipeline.errors.append(f"{op_id}: {error}")
 
     def skip_operation(self, op_id: str, op_type: str, reason: str = "") -> None:
@@ -189,9 +281,11 @@ class ExecutionLogger:
             operation_id=op_id,
             operation_type=op_type,
             status="skipped",
-            metadata={"reason": reason} if reason else {},
+            timestamp=time.time(),
+            metadata={"reason": reason} if reason else _EMPTY_METADATA,
         )
-        self.pipeline.operations.append(log)
+        log._rendered = _render_line(log)
+        self._add(log)
 
     def finish(self, status: str | None = None) -> PipelineLog:
         """Finalize the pipeline log."""
@@ -200,9 +294,70 @@ class ExecutionLogger:
         self.pipeline.finish(status)
         return self.pipeline
 
+    def _add(self, log: OperationLog) -> None:
+        # Index and list are updated together so that, for a repeated id,
+        # the index always holds the entry appended last.
+        with self._lock:
+            self.pipeline.operations.append(log)
+            self.pipeline._recount(None, log.status)
+            self._log_index[log.operation_id] = log
+
+    def _set_status(self, log: OperationLog, status: str) -> None:
+        with self._lock:
+            self.pipeline._recount(log.status, status)
+            log.status = status
+
     def _find_log(self, op_id: str) -> OperationLog | None:
         """Find the most recent log entry for an operation."""
-        for log in reversed(self.pipeline.operations):
-            if log.operation_id == op_id:
-                return log
-        return None
+        return self._log_index.get(op_id)
+
+
+def _render_line(op: OperationLog) -> str:
+    """The summary() line for one operation log entry."""
+    dur = f"{op.duration_ms:.1f}ms" if op.duration_ms else "—"
+    icon = "✅" if op.status == "completed" else "❌" if op.status == "failed" else "⏭️"
+    return f"  {icon} {op.operation_id} ({op.operation_type}) [{dur}]"
+
+
+def _summarize(value: Any) -> Any:
+    """Return value, or a bounded copy with its large parts described."""
+    return _summarize_within(value, 0, [_SNAPSHOT_BUDGET])
+
+
+def _describe(value: Any) -> dict[str, Any]:
+    summary: dict[str, Any] = {"type": type(value).__name__, "len": len(value)}
+    if isinstance(value, dict):
+        summary["keys"] = [str(k) for k in islice(value, _SNAPSHOT_MAX_ITEMS)]
+    return summary
+
+
+def _summarize_within(value: Any, depth: int, budget: list[int]) -> Any:
+    """Summarize value, charging what is kept to budget[0].
+
+    Containers whose parts are all kept unchanged are returned as they
+    are rather than copied.
+    """
+    if isinstance(value, (str, bytes)):
+        if len(value) > min(_SNAPSHOT_MAX_CHARS, budget[0]):
+            return _describe(value)
+        budget[0] -= len(value)
+        return value
+    if isinstance(value, (dict, list, tuple, set, frozenset)):
+        if (
+            len(value) > min(_SNAPSHOT_MAX_ITEMS, budget[0])
+            or (value and depth >= _SNAPSHOT_MAX_DEPTH)
+        ):
+            return _describe(value)
+        budget[0] -= len(value)
+        depth += 1
+        if isinstance(value, dict):
+            items = {k: _summarize_within(v, depth, budget) for k, v in value.items()}
+            changed = any(items[k] is not v for k, v in value.items())
+            return items if changed else value
+        parts = [_summarize_within(v, depth, budget) for v in value]
+        if all(p is v for p, v in zip(parts, value)):
+            return value
+        # Summaries are dicts, which a set cannot hold
+        return tuple(parts) if isinstance(value, tuple) else parts
+    budget[0] -= 1
+    return value
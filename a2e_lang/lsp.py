@@ -13,7 +13,10 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import re
 import sys
 
 try:
@@ -25,7 +28,7 @@ except ImportError:
     )
 
 from .errors import A2ELangError
-from .parser import parse
+from .parser import parse_cached
 from .validator import Validator, VALID_OP_TYPES, REQUIRED_PROPERTIES
 
 logger = logging.getLogger(__name__)
@@ -96,33 +99,9 @@ PROPERTY_SNIPPETS = {
     ],
 }
 
-# ---------------------------------------------------------------------------
-# Server
-# ---------------------------------------------------------------------------
-
-server = LanguageServer("a2e-lang-lsp", "v0.1.0")
-
-
-@server.feature(types.TEXT_DOCUMENT_DID_OPEN)
-def did_open(params: types.DidOpenTextDocumentParams) -> None:
-    _validate_document(params.text_document.uri, params.text_document.text)
-
-
-@server.feature(types.TEXT_DOCUMENT_DID_SAVE)
-def did_save(params: types.DidSaveTextDocumentParams) -> None:
-    doc = server.workspace.get_text_document(params.text_document.uri)
-    _validate_document(params.text_document.uri, doc.source)
-
-
-@server.feature(types.TEXT_DOCUMENT_DID_CHANGE)
-def did_change(params: types.DidChangeTextDocumentParams) -> None:
-    doc = server.workspace.get_text_document(params.text_document.uri)
-    _validate_document(params.text_document.uri, doc.source)
 
-
-@server.feature(types.TEXT_DOCUMENT_COMPLETION)
-def completion(params: types.CompletionParams) -> types.CompletionList:
-    """Provide autocompletion for operation types, keywords, and properties."""
+def _build_completions() -> tuple[types.CompletionItem, ...]:
+    """Build the document-independent completion items (called once)."""
     items: list[types.CompletionItem] = []
 
     # Operation type completions
@@ -154,15 +133,58 @@ def completion(params: types.CompletionParams) -> types.CompletionList:
                 insert_text_format=types.InsertTextFormat.Snippet,
             ))
 
-    # Comparison operator completions
-    for op in ["==", "!=", ">", "<", ">=", "<=", "contains", "startsWith", "endsWith", "in", "exists", "empty"]:
-        items.append(types.CompletionItem(
-            label=op,
-            kind=types.CompletionItemKind.Operator,
-            detail="Comparison operator",
-        ))
+    return tuple(items)
+
+
+_COMPARISON_ITEMS = tuple(
+    types.CompletionItem(
+        label=op,
+        kind=types.CompletionItemKind.Operator,
+        detail="Comparison operator",
+    )
+    for op in ("==", "!=", ">", "<", ">=", "<=", "contains", "startsWith", "endsWith", "in", "exists", "empty")
+)
+
+# Completions do not depend on the document, so they are built at import.
+_STATIC_COMPLETIONS = _build_completions() + _COMPARISON_ITEMS
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+server = LanguageServer("a2e-lang-lsp", "v0.1.0")
+
+# did_change validation waits this long for typing to pause; save is immediate.
+_DEBOUNCE_SECONDS = 0.15
+_pending: dict[str, asyncio.TimerHandle] = {}
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@server.feature(types.TEXT_DOCUMENT_DID_OPEN)
+def did_open(params: types.DidOpenTextDocumentParams) -> None:
+    _validate_document(params.text_document.uri, params.text_document.text)
+
+
+@server.feature(types.TEXT_DOCUMENT_DID_SAVE)
+def did_save(params: types.DidSaveTextDocumentParams) -> None:
+    _cancel_pending(params.text_document.uri)
+    doc = server.workspace.get_text_document(params.text_document.uri)
+    _validate_document(params.text_document.uri, doc.source)
+
+
+@server.feature(types.TEXT_DOCUMENT_DID_CHANGE)
+def did_change(params: types.DidChangeTextDocumentParams) -> None:
+    uri = params.text_document.uri
+    _cancel_pending(uri)
+    _pending[uri] = server.loop.call_later(_DEBOUNCE_SECONDS, _validate_pending, uri)
+
 
-    return types.CompletionList(is_incomplete=False, items=items)
+@server.feature(types.TEXT_DOCUMENT_COMPLETION)
+def completion(params: types.CompletionParams) -> types.CompletionList:
+    """Provide autocompletion for operation types, keywords, and properties."""
+    return types.CompletionList(is_incomplete=False, items=list(_STATIC_COMPLETIONS))
 
 
 @server.feature(types.TEXT_DOCUMENT_HOVER)
@@ -196,7 +218,20 @@ def _validate_document(uri: str, source: str) -> None:
     diagnostics: list[types.Diagnostic] = []
 
     try:
-        workflow = parse(source)
+        diagnostics = list(_compute_diagnostics(source))
+    except Exception as e:
+        logger.error(f"Unexpected error validating document: {e}")
+
+    server.publish_diagnostics(uri, diagnostics)
+
+
+@functools.lru_cache(maxsize=64)
+def _compute_diagnostics(source: str) -> tuple[types.Diagnostic, ...]:
+    """Diagnostics for a source text (memoized; unexpected errors are not cached)."""
+    diagnostics: list[types.Diagnostic] = []
+
+    try:
+        workflow = parse_cached(source)
         validator = Validator()
         errors = validator.validate(workflow)
 
@@ -223,23 +258,32 @@ def _validate_document(uri: str, source: str) -> None:
             severity=types.DiagnosticSeverity.Error,
             source="a2e-lang",
         ))
-    except Exception as e:
-        logger.error(f"Unexpected error validating document: {e}")
 
-    server.publish_diagnostics(uri, diagnostics)
+    return tuple(diagnostics)
+
+
+def _cancel_pending(uri: str) -> None:
+    """Drop a scheduled debounced validation for the document, if any."""
+    handle = _pending.pop(uri, None)
+    if handle is not None:
+        handle.cancel()
+
+
+def _validate_pending(uri: str) -> None:
+    """Run a debounced validation against the document's latest text."""
+    _pending.pop(uri, None)
+    doc = server.workspace.get_text_document(uri)
+    _validate_document(uri, doc.source)
 
 
 def _get_word_at_position(line: str, character: int) -> str:
     """Extract the word at the given character position."""
     if character >= len(line):
         return ""
-    start = character
-    while start > 0 and (line[start - 1].isalnum() or line[start - 1] == "_"):
-        start -= 1
-    end = character
-    while end < len(line) and (line[end].isalnum() or line[end] == "_"):
-        end += 1
-    return line[start:end]
+    for match in _WORD_RE.finditer(line):
+        if match.end() >= character:
+            return match.group() if match.start() <= character else ""
+    return ""
 
 
 # ---------------------------------------------------------------------------
@@ -7,17 +7,26 @@ sequential, parallel, and conditional chaining patterns.
 
 from __future__ import annotations
 
+import io
 import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
+from .ast_nodes import Workflow
 from .engine import ExecutionEngine, ExecutionResult
+from .errors import ValidationError
 from .logging import ExecutionLogger, PipelineLog
-from .parser import parse
+from .parser import parse_cached
 from .resilience import RetryPolicy, API_RETRY, NO_RETRY
 from .validator import Validator
 
+# (workflow, validation errors, parse exception) for one step source
+_Checked = tuple[Workflow | None, list[ValidationError], Exception | None]
+
 
 class ChainMode(Enum):
     """How workflows are chained together."""
@@ -26,7 +35,7 @@ class ChainMode(Enum):
     CONDITIONAL = "conditional"  # Based on previous result
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentStep:
     """A single step in a multi-agent orchestration."""
     name: str
@@ -38,7 +47,7 @@ class AgentStep:
     # input_mapping: maps target_path -> source_path from previous step output
 
 
-@dataclass
+@dataclass(slots=True)
 class OrchestrationResult:
     """Result of a multi-agent orchestration."""
     success: bool
@@ -50,21 +59,21 @@ class OrchestrationResult:
 
     def summary(self) -> str:
         status = "✅ Success" if self.success else "❌ Failed"
-        lines = [
-            f"Orchestration: {status}",
-            f"Steps: {self.steps_completed}/{self.steps_total} completed",
-            f"Duration: {self.total_duration_ms:.1f}ms",
-            "─" * 50,
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"Orchestration: {status}\n")
+        w(f"Steps: {self.steps_completed}/{self.steps_total} completed\n")
+        w(f"Duration: {self.total_duration_ms:.1f}ms\n")
+        w("─" * 50)
         for sr in self.step_results:
             icon = "✅" if sr.get("success") else "❌"
             dur = sr.get("duration_ms", 0)
-            lines.append(f"  {icon} {sr['name']} [{dur:.1f}ms]")
+            w(f"\n  {icon} {sr['name']} [{dur:.1f}ms]")
             if sr.get("error"):
-                lines.append(f"     └─ {sr['error']}")
+                w(f"\n     └─ {sr['error']}")
         if self.error:
-            lines.append(f"\n  ⚠ {self.error}")
-        return "\n".join(lines)
+            w(f"\n\n  ⚠ {self.error}")
+        return buf.getvalue()
 
 
 class Orchestrator:
@@ -111,6 +120,7 @@ class Orchestrator:
         result = OrchestrationResult(steps_total=len(self.steps), success=False)
         start_time = time.time()
         accumulated_data: dict[str, Any] = dict(input_data or {})
+        checked = self._check_sources()
 
         for step in self.steps:
             step_start = time.time()
@@ -129,36 +139,37 @@ class Orchestrator:
                     result.steps_completed += 1
                     continue
 
-            # Map inputs from previous step outputs
-            step_input = dict(accumulated_data)
-            for target_path, source_path in step.input_mapping.items():
-                if source_path in accumulated_data:
-                    step_input[target_path] = accumulated_data[source_path]
-
-            # Parse and validate
-            try:
-                workflow = parse(step.source)
-                errors = Validator().validate(workflow)
-                if errors:
-                    step_duration = (time.time() - step_start) * 1000
-                    result.step_results.append({
-                        "name": step.name,
-                        "success": False,
-                        "duration_ms": step_duration,
-                        "error": f"Validation: {errors[0]}",
-                    })
-                    result.error = f"Step '{step.name}' failed validation"
-                    break
-
-            except Exception as e:
+            # Map inputs from previous step outputs. The step sees the
+            # overrides layered on the shared data instead of a full copy;
+            # the read-only proxy tells the engine not to copy it either.
+            overrides = {
+                target_path: accumulated_data[source_path]
+                for target_path, source_path in step.input_mapping.items()
+                if source_path in accumulated_data
+            }
+            step_input = MappingProxyType(ChainMap(overrides, accumulated_data))
+
+            # Parse and validate (done up front by _check_sources)
+            workflow, errors, exc = checked[step.source]
+            if exc is not None:
                 step_duration = (time.time() - step_start) * 1000
                 result.step_results.append({
                     "name": step.name,
                     "success": False,
                     "duration_ms": step_duration,
-                    "error": str(e),
+                    "error": str(exc),
                 })
-                result.error = f"Step '{step.name}' failed: {e}"
+                result.error = f"Step '{step.name}' failed: {exc}"
+                break
+            if errors:
+                step_duration = (time.time() - step_start) * 1000
+                result.step_results.append({
+                    "name": step.name,
+                    "success": False,
+                    "duration_ms": step_duration,
+                    "error": f"Validation: {errors[0]}",
+                })
+                result.error = f"Step '{step.name}' failed validation"
                 break
 
             # Execute
@@ -178,8 +189,10 @@ class Orchestrator:
 
             if exec_result.success:
                 result.steps_completed += 1
-                # Merge outputs into accumulated data for next step
-                accumulated_data.update(exec_result.data)
+                # Merge the mapped inputs and the step's writes into the
+                # accumulated data for the next step
+                accumulated_data.update(overrides)
+                accumulated_data.update(exec_result.data.maps[0])
             else:
                 result.error = f"Step '{step.name}' failed: {exec_result.error}"
                 break
@@ -187,3 +200,23 @@ class Orchestrator:
         result.total_duration_ms = (time.time() - start_time) * 1000
         result.success = result.steps_completed == result.steps_total
         return result
+
+    def _check_sources(self) -> dict[str, _Checked]:
+        """Parse and validate every distinct step source, concurrently.
+
+        Parsing does not depend on runtime data, so it is done for all
+        steps before the first one runs.
+        """
+        sources = list(dict.fromkeys(step.source for step in self.steps))
+        if len(sources) < 2:
+            return {source: _check_source(source) for source in sources}
+        with ThreadPoolExecutor(max_workers=min(len(sources), 8)) as pool:
+            return dict(zip(sources, pool.map(_check_source, sources)))
+
+
+def _check_source(source: str) -> _Checked:
+    try:
+        workflow = parse_cached(source)
+        return workflow, Validator().validate(workflow), None
+    except Exception as e:
+        return None, [], e
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import sys
 from pathlib import Path as FilePath
 
-from lark import Lark, Token, Transformer, Tree, v_args
-from lark.exceptions import UnexpectedInput
+from lark import Lark, Token, Transformer, v_args
+from lark.exceptions import GrammarError, UnexpectedInput
 
+from . import _ast_cache
 from .ast_nodes import (
     ArrayValue,
     Condition,
@@ -26,187 +29,194 @@ from .errors import ParseError
 # ---------------------------------------------------------------------------
 
 _GRAMMAR_PATH = FilePath(__file__).parent / "grammar.lark"
-_lark_parser: Lark | None = None
+_lark_parsers: dict[str, Lark] = {}
 
 
-def _get_parser() -> Lark:
-    global _lark_parser
-    if _lark_parser is None:
+def _get_parser(kind: str = "lalr") -> Lark:
+    """Return the Lark parser of the given kind, building it once.
+
+    "lalr" is a table-driven LALR(1) parser with Lark's contextual lexer,
+    which only tries the terminals the parser can accept next; it is the
+    fast path. "earley" uses the dynamic lexer, which matches terminals per
+    position in parser context, so keywords such as `in` or `contains` can
+    also be used as identifiers anywhere; it is the reference parser.
+    """
+    parser = _lark_parsers.get(kind)
+    if parser is None:
         grammar_text = _GRAMMAR_PATH.read_text(encoding="utf-8")
-        _lark_parser = Lark(
-            grammar_text,
-            parser="earley",
-            propagate_positions=True,
-        )
-    return _lark_parser
+        if kind == "lalr":
+            try:
+                parser = Lark(
+                    grammar_text,
+                    parser="lalr",
+                    lexer="contextual",
+                    cache=_parser_cache_file() or False,
+                )
+            except GrammarError:
+                # The grammar stopped being LALR(1); Earley still parses it
+                parser = _get_parser("earley")
+        else:
+            parser = Lark(
+                grammar_text,
+                parser="earley",
+                lexer="dynamic",
+                propagate_positions=True,
+            )
+        _lark_parsers[kind] = parser
+    return parser
+
+
+def _parser_cache_file() -> str | None:
+    """Where Lark keeps the built LALR tables between processes.
+
+    Lark stores a hash of the grammar, options and Lark version in the file
+    and rebuilds it when they change, so only the interpreter version is
+    part of the name. Returns None when the on-disk cache is disabled.
+    """
+    directory = _ast_cache.cache_dir()
+    if directory is None:
+        return None
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return str(directory / f"lalr-py{sys.version_info[0]}{sys.version_info[1]}.lark")
 
 
 # ---------------------------------------------------------------------------
 # Transformer: Lark parse tree -> AST nodes
 # ---------------------------------------------------------------------------
 
+@v_args(inline=True)
 class A2ETransformer(Transformer):
-    """Converts Lark parse tree into a2e-lang AST."""
+    """Converts Lark parse tree into a2e-lang AST.
+
+    Handlers take a rule's children as positional arguments; optional
+    children marked [...] in the grammar arrive as None when absent.
+    """
 
     # --- Top-level ---
 
-    def start(self, items):
-        name = None
-        operations = []
-        execution_order = None
-        for item in items:
-            if isinstance(item, str):
-                name = item  # workflow name
-            elif isinstance(item, Operation):
-                operations.append(item)
-            elif isinstance(item, tuple) and item and isinstance(item[0], str):
-                # Could be execution_order or a workflow name
-                # Distinguish by checking if name is already set
-                if name is None:
-                    name = item[0]
-                else:
-                    execution_order = item
+    def start(self, name, operations, execution_order):
         return Workflow(
-            name=name or "unnamed",
-            operations=tuple(operations),
+            name=name,
+            operations=operations,
             execution_order=execution_order,
         )
 
-    def workflow_decl(self, items):
-        # items[0] is an ESCAPED_STRING token
-        return _unquote(items[0])
+    def workflow_decl(self, name):
+        return _unquote(name)
 
-    def operation_def(self, items):
-        op_id = str(items[0])  # IDENT
-        op_type = str(items[1])  # IDENT (operation type name)
+    def operations(self, *operations):
+        return operations
 
+    def operation_def(self, op_id, op_type, *body):
         properties = []
         input_path = None
         output_path = None
         conditions = None
         if_clause = None
-        line = items[0].line if hasattr(items[0], "line") else 0
-        column = items[0].column if hasattr(items[0], "column") else 0
-
-        for item in items[2:]:
-            if isinstance(item, Property):
-                properties.append(item)
-            elif isinstance(item, str) and item.startswith("/"):
-                # Disambiguation: from_clause or output_arrow both produce strings
-                # This shouldn't happen — we use tagged tuples below
-                pass
-            elif isinstance(item, tuple):
-                tag, val = item
-                if tag == "from":
-                    input_path = val
-                elif tag == "output":
-                    output_path = val
-                elif tag == "conditions":
-                    conditions = val
-            elif isinstance(item, IfClause):
-                if_clause = item
+
+        for item in body:
+            # Property is itself a 2-tuple, so it must be matched first
+            match item:
+                case Property():
+                    properties.append(item)
+                case ("from", path):
+                    input_path = path
+                case ("output", path):
+                    output_path = path
+                case ("conditions", conds):
+                    conditions = conds
+                case IfClause():
+                    if_clause = item
 
         return Operation(
-            id=op_id,
-            op_type=op_type,
+            id=sys.intern(str(op_id)),
+            op_type=sys.intern(str(op_type)),
             properties=tuple(properties),
             input_path=input_path,
             output_path=output_path,
             conditions=conditions,
             if_clause=if_clause,
-            line=line,
-            column=column,
+            line=op_id.line,
+            column=op_id.column,
         )
 
-    def run_decl(self, items):
-        return tuple(str(tok) for tok in items)
+    def run_decl(self, *idents):
+        return tuple(map(sys.intern, map(str, idents)))
 
     # --- Operation body items ---
 
-    def property(self, items):
-        key = _unquote(items[0]) if items[0].type == "ESCAPED_STRING" else str(items[0])
-        value = items[1]
+    def property(self, key, value):
+        key = sys.intern(_unquote(key) if key.type == "ESCAPED_STRING" else str(key))
         return Property(key=key, value=value)
 
-    def from_clause(self, items):
-        return ("from", items[0].raw if isinstance(items[0], Path) else str(items[0]))
-
-    def where_clause(self, items):
-        return ("conditions", tuple(items))
+    def from_clause(self, path):
+        return ("from", path.raw)
 
-    def if_clause(self, items):
-        # items: path, COMPARE_OP, [value], "then" ident_list, ["else" ident_list]
-        path_val = items[0].raw if isinstance(items[0], Path) else str(items[0])
-        operator = str(items[1])
-
-        idx = 2
-        value = None
-        if idx < len(items) and not isinstance(items[idx], tuple):
-            # It's the optional value (not an ident_list tuple)
-            value = items[idx]
-            idx += 1
-
-        if_true = items[idx] if idx < len(items) else ()
-        idx += 1
-        if_false = items[idx] if idx < len(items) else None
+    def where_clause(self, *conditions):
+        return ("conditions", conditions)
 
+    def if_clause(self, path, operator, value, if_true, if_false):
         return IfClause(
-            path=path_val,
-            operator=operator,
+            path=path.raw,
+            operator=sys.intern(str(operator)),
             value=value,
             if_true=if_true,
             if_false=if_false,
         )
 
-    def output_arrow(self, items):
-        return ("output", items[0].raw if isinstance(items[0], Path) else str(items[0]))
+    def output_arrow(self, path):
+        return ("output", path.raw)
 
-    def condition(self, items):
-        field = str(items[0])
-        operator = str(items[1])
-        value = items[2] if len(items) > 2 else None
-        return Condition(field=field, operator=operator, value=value)
+    def condition(self, field, operator, value):
+        return Condition(
+            field=sys.intern(str(field)),
+            operator=sys.intern(str(operator)),
+            value=value,
+        )
 
-    def ident_list(self, items):
-        return tuple(str(tok) for tok in items)
+    def ident_list(self, *idents):
+        return tuple(map(sys.intern, map(str, idents)))
 
     # --- Values ---
 
-    def string_val(self, items):
-        return _unquote(items[0])
+    def string_val(self, token):
+        return _unquote(token)
 
-    def number_val(self, items):
-        s = str(items[0])
+    def number_val(self, token):
+        s = str(token)
         if "." in s:
             return float(s)
         return int(s)
 
-    def true_val(self, _items):
+    def true_val(self):
         return True
 
-    def false_val(self, _items):
+    def false_val(self):
         return False
 
-    def null_val(self, _items):
+    def null_val(self):
         return None
 
-    def path_val(self, items):
-        return items[0]  # already a Path from path()
+    def path_val(self, path):
+        return path  # already a Path from path()
 
-    def ident_val(self, items):
-        return str(items[0])
+    def ident_val(self, token):
+        return str(token)
 
-    def path(self, items):
-        return Path(raw=str(items[0]))
+    def path(self, token):
+        return Path(raw=sys.intern(str(token)))
 
-    def credential(self, items):
-        return Credential(id=_unquote(items[0]))
+    def credential(self, token):
+        return Credential(id=_unquote(token))
 
-    def object(self, items):
-        return ObjectValue(properties=tuple(items))
+    def object(self, *properties):
+        return ObjectValue(properties=properties)
 
-    def array(self, items):
-        return ArrayValue(items=tuple(items))
+    def array(self, *items):
+        return ArrayValue(items=items)
 
 
 # ---------------------------------------------------------------------------
@@ -225,13 +235,31 @@ def _unquote(token: Token) -> str:
 # Public API
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=128)
 def parse(source: str) -> Workflow:
     """Parse a2e-lang source code and return a Workflow AST.
 
+    Results are memoized by source text. Workflow ASTs are immutable, so
+    callers parsing the same source share one object; use parse_uncached()
+    for a fresh one. Raises ParseError on syntax errors (not cached).
+    """
+    return parse_uncached(source)
+
+
+def parse_uncached(source: str) -> Workflow:
+    """Parse source into a new Workflow AST, bypassing the parse() cache.
+
     Raises ParseError on syntax errors.
     """
     try:
         tree = _get_parser().parse(source)
+    except UnexpectedInput:
+        # Either a real syntax error or a keyword used as an identifier;
+        # the Earley parser decides (and reports the error).
+        tree = None
+    try:
+        if tree is None:
+            tree = _get_parser("earley").parse(source)
         return A2ETransformer().transform(tree)
     except UnexpectedInput as e:
         raise ParseError(
@@ -239,3 +267,7 @@ def parse(source: str) -> Workflow:
             line=getattr(e, "line", None),
             column=getattr(e, "column", None),
         ) from e
+
+
+# parse() is memoized itself; the older name is kept for existing callers
+parse_cached = parse
@@ -7,11 +7,13 @@ description for LSP integration.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
 from .ast_nodes import Operation
 from .engine import ExecutionContext, register_handler as _register_engine_handler
+from .validator import VALID_OP_TYPES
 
 
 @dataclass(frozen=True)
@@ -26,6 +28,14 @@ class PluginSpec:
 
 _PLUGINS: dict[str, PluginSpec] = {}
 
+# Built-in + plugin op types, rebuilt whenever _PLUGINS changes
+_ALL_OP_TYPES: frozenset[str] = frozenset(VALID_OP_TYPES)
+
+
+def _refresh_op_types() -> None:
+    global _ALL_OP_TYPES
+    _ALL_OP_TYPES = frozenset(VALID_OP_TYPES).union(_PLUGINS)
+
 
 def register_plugin(spec: PluginSpec) -> None:
     """Register a custom operation type plugin.
@@ -35,7 +45,9 @@ def register_plugin(spec: PluginSpec) -> None:
     """
     if spec.name in _PLUGINS:
         raise ValueError(f"Plugin '{spec.name}' is already registered")
-    _PLUGINS[spec.name] = spec
+    # Parsed op types are interned, so lookups can match by identity
+    _PLUGINS[sys.intern(spec.name)] = spec
+    _refresh_op_types()
 
     # Register handler with the execution engine
     if spec.handler:
@@ -44,7 +56,8 @@ def register_plugin(spec: PluginSpec) -> None:
 
 def unregister_plugin(name: str) -> None:
     """Remove a registered plugin."""
-    _PLUGINS.pop(name, None)
+    if _PLUGINS.pop(name, None) is not None:
+        _refresh_op_types()
 
 
 def get_plugin(name: str) -> PluginSpec | None:
@@ -59,16 +72,15 @@ def list_plugins() -> list[PluginSpec]:
 
 def is_valid_op_type(name: str) -> bool:
     """Check if name is a built-in or plugin operation type."""
-    from .validator import VALID_OP_TYPES
-    return name in VALID_OP_TYPES or name in _PLUGINS
+    return name in _ALL_OP_TYPES
 
 
 def get_all_op_types() -> set[str]:
     """Get all valid operation types (built-in + plugins)."""
-    from .validator import VALID_OP_TYPES
-    return VALID_OP_TYPES | set(_PLUGINS.keys())
+    return set(_ALL_OP_TYPES)
 
 
 def clear_plugins() -> None:
     """Remove all registered plugins (useful for testing)."""
     _PLUGINS.clear()
+    _refresh_op_types()
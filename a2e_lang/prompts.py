@@ -7,6 +7,7 @@ tuning hints.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 
 
@@ -94,6 +95,12 @@ save = StoreData {
 run: fetch_users -> filter_active -> save
 ```'''
 
+# Grammar + example block embedded in every system prompt
+_REFERENCE = f"""{_GRAMMAR_SUMMARY}
+
+## Example
+{_EXAMPLE_WORKFLOW}"""
+
 
 # ---------------------------------------------------------------------------
 # Templates per model family
@@ -112,10 +119,7 @@ _register(PromptTemplate(
     model_family="OpenAI GPT-4",
     system_prompt=f"""You are a workflow architect that generates a2e-lang DSL code.
 
-{_GRAMMAR_SUMMARY}
-
-## Example
-{_EXAMPLE_WORKFLOW}
+{_REFERENCE}
 
 Generate ONLY valid a2e-lang DSL code. Do NOT include markdown fences unless asked.
 Always include a `run:` declaration at the end.
@@ -131,10 +135,7 @@ _register(PromptTemplate(
     model_family="Anthropic Claude",
     system_prompt=f"""You generate a2e-lang DSL — a declarative workflow language that compiles to JSON for the A2E protocol.
 
-{_GRAMMAR_SUMMARY}
-
-## Example
-{_EXAMPLE_WORKFLOW}
+{_REFERENCE}
 
 <rules>
 - Output ONLY a2e-lang code, no explanations
@@ -157,10 +158,7 @@ _register(PromptTemplate(
     model_family="Google Gemini/Gemma",
     system_prompt=f"""Generate a2e-lang DSL workflows. a2e-lang is a declarative language for automation workflows.
 
-{_GRAMMAR_SUMMARY}
-
-## Example
-{_EXAMPLE_WORKFLOW}
+{_REFERENCE}
 
 Output rules:
 * Generate ONLY valid a2e-lang syntax
@@ -177,10 +175,7 @@ _register(PromptTemplate(
     model_family="Llama/Mistral/Open-source",
     system_prompt=f"""You write a2e-lang code. a2e-lang is a simple DSL for workflow automation.
 
-{_GRAMMAR_SUMMARY}
-
-## Example
-{_EXAMPLE_WORKFLOW}
+{_REFERENCE}
 
 IMPORTANT:
 - Output ONLY the a2e-lang code
@@ -205,11 +200,16 @@ def format_prompt(template_name: str, task_description: str) -> dict[str, str]:
 
     Returns dict with 'system' and 'user' keys.
     """
+    system, user = _render(template_name, task_description)
+    return {"system": system, "user": user}
+
+
+@functools.lru_cache(maxsize=1024)
+def _render(template_name: str, task_description: str) -> tuple[str, str]:
+    """Build the (system, user) prompt pair; memoized for batched calls."""
     t = get_template(template_name)
-    return {
-        "system": t.system_prompt,
-        "user": t.user_template.format(task_description=task_description),
-    }
+    # A plain replace: user templates have this one placeholder only
+    return t.system_prompt, t.user_template.replace("{task_description}", task_description)
 
 
 def list_templates() -> list[dict[str, str]]:
@@ -7,14 +7,19 @@ tolerance for LLM-generated output.
 
 from __future__ import annotations
 
+import functools
 import re
 
 
 # ---------------------------------------------------------------------------
 # Fix registry — ordered list of (pattern, replacement, description)
+#
+# A replacement may also be a dict from matched text to its replacement
+# (matches not in the dict are kept); the description is then formatted
+# with each (match, replacement) pair that occurred, in dict order.
 # ---------------------------------------------------------------------------
 
-_FIXES: list[tuple[re.Pattern, str, str]] = [
+_FIXES: list[tuple[re.Pattern, str | dict[str, str], str]] = [
     # 1. Missing quotes around workflow name
     #    workflow my-pipeline  →  workflow "my-pipeline"
     (
@@ -100,22 +105,13 @@ _FIXES: list[tuple[re.Pattern, str, str]] = [
         "Removed trailing commas",
     ),
 
-    # 11. Python-style True/False/None
+    # 11. Python-style True/False/None, in one pass
     #     True  →  true, False  →  false, None  →  null
+    #     Quoted strings and comments are matched too, and left as they are
     (
-        re.compile(r'\bTrue\b'),
-        'true',
-        "Converted Python 'True' to 'true'",
-    ),
-    (
-        re.compile(r'\bFalse\b'),
-        'false',
-        "Converted Python 'False' to 'false'",
-    ),
-    (
-        re.compile(r'\bNone\b'),
-        'null',
-        "Converted Python 'None' to 'null'",
+        re.compile(r'''"(?:[^"\\\n]|\\.)*"|'[^'\n]*'|#[^\n]*|\b(?:True|False|None)\b'''),
+        {"True": "true", "False": "false", "None": "null"},
+        "Converted Python '{0}' to '{1}'",
     ),
 
     # 12. Single quotes → double quotes (Python/JS habit)
@@ -127,6 +123,23 @@ _FIXES: list[tuple[re.Pattern, str, str]] = [
     ),
 ]
 
+# One scan to tell clean sources apart. Each alternative is a looser form
+# of the numbered fix above, so a source it does not match is left
+# unchanged by every fix; keep the two in step when adding a fix.
+_DIRTY_PROBE = re.compile(
+    r"^[ \t]*workflow(?:\s*:|\s+[a-zA-Z_])"           # 1, 2
+    r"|;\s*$"                                           # 3
+    r"|:\s*(?:string|number|boolean|int|float)\s*="     # 4
+    r"|=\s*op"                                          # 5
+    r"|=>|-->"                                          # 6
+    r"|^[ \t]*(?:input|output)\s+/"                     # 7, 8
+    r"|^[ \t]*(?:execute|order)\s*:"                    # 9
+    r"|,\s*\}"                                          # 10
+    r"|True|False|None"                                 # 11
+    r"|:\s'",                                           # 12
+    re.MULTILINE,
+)
+
 
 class RecoveryResult:
     """Result of error recovery processing."""
@@ -155,16 +168,74 @@ def recover(source: str) -> RecoveryResult:
     Returns a RecoveryResult with the fixed source and a list of
     applied fixes. The original source is preserved in the result.
     """
-    original = source
-    fixes: list[str] = []
-
-    for pattern, replacement, description in _FIXES:
-        new_source = pattern.sub(replacement, source)
-        if new_source != source:
-            fixes.append(description)
-            source = new_source
-
-    return RecoveryResult(source=source, original=original, fixes=fixes)
+    if _DIRTY_PROBE.search(source) is None:
+        return RecoveryResult(source=source, original=source, fixes=[])
+    fixed, fixes = _apply_fixes(source)
+    return RecoveryResult(source=fixed, original=source, fixes=list(fixes))
+
+
+def _sub_table(
+    pattern: re.Pattern,
+    table: dict[str, str],
+    description: str,
+    source: str,
+    fixes: list[str],
+) -> str:
+    """Replace every match via table in one scan, noting each key replaced."""
+    seen: set[str] = set()
+
+    def replace(m: re.Match) -> str:
+        text = m[0]
+        if text not in table:
+            return text
+        seen.add(text)
+        return table[text]
+
+    source = pattern.sub(replace, source)
+    fixes.extend(description.format(key, table[key]) for key in table if key in seen)
+    return source
+
+
+def _compile_fixes(table: list[tuple[re.Pattern, str | dict[str, str], str]]):
+    """Generate a function applying every fix in table, unrolled in order.
+
+    Each fix's bound sub method, replacement and description are closure
+    variables of the generated function, so applying the fixes costs no
+    loop, tuple unpacking or attribute lookup per fix.
+    """
+    params: dict[str, object] = {"_sub_table": _sub_table}
+    body: list[str] = []
+    for i, (pattern, replacement, description) in enumerate(table):
+        params[f"r{i}"] = replacement
+        params[f"d{i}"] = description
+        if isinstance(replacement, dict):
+            params[f"p{i}"] = pattern
+            body.append(f"source = _sub_table(p{i}, r{i}, d{i}, source, fixes)")
+        else:
+            params[f"sub{i}"] = pattern.sub
+            body += [
+                f"new = sub{i}(r{i}, source)",
+                "if new != source:",
+                f"    add(d{i})",
+                "    source = new",
+            ]
+    code = "\n".join([
+        f"def make({', '.join(params)}):",
+        "    def apply_fixes(source):",
+        "        fixes = []",
+        "        add = fixes.append",
+        *(f"        {line}" for line in body),
+        "        return source, tuple(fixes)",
+        "    return apply_fixes",
+    ])
+    namespace: dict[str, object] = {}
+    exec(compile(code, "<a2e_lang.recovery._FIXES>", "exec"), namespace)
+    return namespace["make"](**params)
+
+
+# Run _FIXES over source -> (source, fixes); memoized, as LLMs often
+# repeat an output
+_apply_fixes = functools.lru_cache(maxsize=256)(_compile_fixes(_FIXES))
 
 
 def parse_with_recovery(source: str):
@@ -175,6 +246,10 @@ def parse_with_recovery(source: str):
     from .parser import parse
     from .errors import ParseError
 
+    # Nothing to recover in a clean source: parse it once, errors propagate
+    if _DIRTY_PROBE.search(source) is None:
+        return parse(source), RecoveryResult(source, source, [])
+
     # First try: parse as-is
     try:
         workflow = parse(source)
@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from ._json import dumpb, loads
+
 
 @dataclass
 class WorkflowEntry:
@@ -25,6 +27,15 @@ class WorkflowEntry:
     tags: list[str] = field(default_factory=list)
     source: str = ""
     published_at: float = field(default_factory=time.time)
+    # Lowercased name, description and tags for search(), built once
+    _name_lc: str = field(default="", init=False, repr=False, compare=False)
+    _desc_lc: str = field(default="", init=False, repr=False, compare=False)
+    _tags_lc: tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._name_lc = self.name.lower()
+        self._desc_lc = self.description.lower()
+        self._tags_lc = tuple(t.lower() for t in self.tags)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -54,12 +65,23 @@ class WorkflowEntry:
         return f"{self.name} v{self.version} by {self.author or '?'} [{tags}]"
 
 
+def _index_record(entry: WorkflowEntry) -> dict[str, Any]:
+    """An entry as stored in index.json.
+
+    The source is left out: it already lives in workflows/<name>.a2e and is
+    read from there on demand.
+    """
+    record = entry.to_dict()
+    del record["source"]
+    return record
+
+
 class WorkflowRegistry:
     """Local file-based workflow registry.
 
     Stores workflow metadata and source code in a directory structure:
       registry_dir/
-        index.json          — registry index
+        index.json          — registry index (metadata only)
         workflows/
           <name>.a2e        — workflow source files
     """
@@ -71,13 +93,19 @@ class WorkflowRegistry:
         self._workflows_dir = self.root / "workflows"
         self._index_path = self.root / "index.json"
         self._entries: dict[str, WorkflowEntry] = {}
-        self._load()
+        # The index is read on first use, not on construction
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self._loaded = True
+            self._load()
 
     def _load(self) -> None:
         """Load registry index from disk."""
         if self._index_path.exists():
             try:
-                data = json.loads(self._index_path.read_text(encoding="utf-8"))
+                data = loads(self._index_path.read_bytes())
                 for entry_data in data.get("workflows", []):
                     entry = WorkflowEntry.from_dict(entry_data)
                     self._entries[entry.name] = entry
@@ -90,12 +118,13 @@ class WorkflowRegistry:
         self._workflows_dir.mkdir(parents=True, exist_ok=True)
         data = {
             "version": "1.0.0",
-            "workflows": [e.to_dict() for e in self._entries.values()],
+            "workflows": [_index_record(e) for e in self._entries.values()],
         }
-        self._index_path.write_text(
-            json.dumps(data, indent=2, default=str),
-            encoding="utf-8",
-        )
+        # Write a sibling file and rename it over the index, so a crash
+        # mid-write never leaves a truncated index.json behind
+        tmp_path = self._index_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(dumpb(data, default=str))
+        os.replace(tmp_path, self._index_path)
 
     def publish(
         self,
@@ -108,6 +137,7 @@ class WorkflowRegistry:
         tags: list[str] | None = None,
     ) -> WorkflowEntry:
         """Publish a workflow to the registry."""
+        self._ensure_loaded()
         entry = WorkflowEntry(
             name=name,
             version=version,
@@ -127,35 +157,42 @@ class WorkflowRegistry:
         return entry
 
     def get(self, name: str) -> WorkflowEntry | None:
-        """Get a workflow entry by name."""
-        return self._entries.get(name)
+        """Get a workflow entry by name (with its source loaded)."""
+        self._ensure_loaded()
+        entry = self._entries.get(name)
+        if entry is not None and not entry.source:
+            src_path = self._workflows_dir / f"{name}.a2e"
+            if src_path.exists():
+                entry.source = src_path.read_text(encoding="utf-8")
+        return entry
 
     def get_source(self, name: str) -> str | None:
         """Get the source code for a published workflow."""
-        entry = self._entries.get(name)
+        entry = self.get(name)
         if entry:
             return entry.source
         return None
 
     def search(self, query: str) -> list[WorkflowEntry]:
         """Search workflows by name or tag (case-insensitive)."""
+        self._ensure_loaded()
         q = query.lower()
-        results = []
-        for entry in self._entries.values():
-            if q in entry.name.lower():
-                results.append(entry)
-            elif any(q in t.lower() for t in entry.tags):
-                results.append(entry)
-            elif q in entry.description.lower():
-                results.append(entry)
+        results = [
+            entry for entry in self._entries.values()
+            if q in entry._name_lc
+            or q in entry._desc_lc
+            or any(q in t for t in entry._tags_lc)
+        ]
         return sorted(results, key=lambda e: e.name)
 
     def list_all(self) -> list[WorkflowEntry]:
         """List all published workflows."""
+        self._ensure_loaded()
         return sorted(self._entries.values(), key=lambda e: e.name)
 
     def remove(self, name: str) -> bool:
         """Remove a workflow from the registry."""
+        self._ensure_loaded()
         if name not in self._entries:
             return False
         del self._entries[name]
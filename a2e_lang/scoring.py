@@ -10,6 +10,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+from .ast_nodes import Workflow
 from .parser import parse
 
 
@@ -64,9 +65,13 @@ def _grade(score: int) -> str:
     return "F"
 
 
-def score_syntax(source: str) -> SyntaxScore:
-    """Analyze a2e-lang source and return learnability metrics."""
-    workflow = parse(source)
+def score_syntax(source: str, *, workflow: Workflow | None = None) -> SyntaxScore:
+    """Analyze a2e-lang source and return learnability metrics.
+
+    Pass workflow when the caller has already parsed source.
+    """
+    if workflow is None:
+        workflow = parse(source)
     lines = source.strip().splitlines()
     non_empty = [ln.strip() for ln in lines if ln.strip() and not ln.strip().startswith("#")]
 
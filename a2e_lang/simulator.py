@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
+from typing import Mapping
 
 from .ast_nodes import (
     ArrayValue,
@@ -77,11 +78,11 @@ class Simulator:
             data.update(input_data)
 
         # Build operation map
-        op_map = {op.id: op for op in workflow.operations}
+        op_map = workflow.by_id()
 
         # Determine execution order
         if workflow.execution_order:
-            exec_order = list(workflow.execution_order)
+            exec_order = workflow.execution_order
         else:
             exec_order = [op.id for op in workflow.operations]
 
@@ -107,7 +108,7 @@ class Simulator:
         op: Operation,
         data: dict[str, object],
         result: SimulationResult,
-        op_map: dict[str, Operation],
+        op_map: Mapping[str, Operation],
     ) -> None:
         """Simulate a single operation."""
 
@@ -7,15 +7,15 @@ attribution from runtime failures back to the original DSL source.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from typing import Any
 
 from .ast_nodes import Operation, Workflow
 from .parser import parse
+from ._json import dumps
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceLocation:
     """A location in the DSL source."""
     line: int
@@ -32,7 +32,7 @@ class SourceLocation:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class Mapping:
     """Maps a JSONL element to its DSL source location."""
     jsonl_line: int         # Line in the JSONL output (0-indexed)
@@ -86,8 +86,7 @@ class SourceMap:
         }
 
     def to_json(self, pretty: bool = False) -> str:
-        indent = 2 if pretty else None
-        return json.dumps(self.to_dict(), indent=indent)
+        return dumps(self.to_dict(), pretty=pretty)
 
     @classmethod
     def from_dict(cls, d: dict) -> SourceMap:
@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 
+from .ast_nodes import Workflow
 from .compiler_spec import SpecCompiler
 from .parser import parse
 
@@ -70,16 +71,18 @@ def _estimate_tokens(text: str) -> int:
     return max(1, len(text) // 4)
 
 
-def calculate_budget(source: str) -> TokenBudget:
+def calculate_budget(source: str, *, workflow: Workflow | None = None) -> TokenBudget:
     """Calculate token budget for a2e-lang source vs compiled JSONL.
 
     Args:
         source: a2e-lang DSL source code.
+        workflow: The already-parsed AST of source, if the caller has it.
 
     Returns:
         TokenBudget with cost comparison.
     """
-    workflow = parse(source)
+    if workflow is None:
+        workflow = parse(source)
     jsonl = SpecCompiler().compile(workflow)
 
     dsl_tokens = _estimate_tokens(source)
@@ -87,13 +87,44 @@ class Validator:
         self.max_conditions = max_conditions
 
     def validate(self, workflow: Workflow) -> list[ValidationError]:
-        """Run all validations and return a list of errors (empty = valid)."""
+        """Run all validations and return a list of errors (empty = valid).
+
+        The errors are those of validate_limits(), validate_syntax() and
+        validate_structure(), in that order.
+        """
+        return (
+            self.validate_limits(workflow)
+            + self.validate_syntax(workflow)
+            + self.validate_structure(workflow)
+        )
+
+    def validate_limits(self, workflow: Workflow) -> list[ValidationError]:
+        """Workflow-wide checks: complexity limits and unique operation IDs.
+
+        Like validate_structure(), the result depends only on
+        structure_key(workflow).
+        """
         errors: list[ValidationError] = []
         errors += self._validate_complexity(workflow)
         errors += self._validate_unique_ids(workflow)
+        return errors
+
+    def validate_syntax(self, workflow: Workflow) -> list[ValidationError]:
+        """Per-operation checks: known op types, required properties and clauses."""
+        errors: list[ValidationError] = []
         errors += self._validate_op_types(workflow)
         errors += self._validate_required_properties(workflow)
         errors += self._validate_required_clauses(workflow)
+        return errors
+
+    def validate_structure(self, workflow: Workflow) -> list[ValidationError]:
+        """Graph-level checks: references, execution order, cycles.
+
+        Their result depends only on structure_key(workflow), so callers that
+        re-validate edited versions of a workflow may reuse it while the key
+        is unchanged.
+        """
+        errors: list[ValidationError] = []
         errors += self._validate_conditional_targets(workflow)
         errors += self._validate_loop_operations(workflow)
         errors += self._validate_execution_order(workflow)
@@ -125,40 +156,18 @@ class Validator:
 
         # Max depth (Conditional/Loop nesting)
         if self.max_depth is not None:
-            op_map = {op.id: op for op in workflow.operations}
-            branching_types = {"Conditional", "Loop"}
-
-            def _measure_depth(op_id: str, visited: set[str]) -> int:
-                if op_id in visited or op_id not in op_map:
-                    return 0
-                op = op_map[op_id]
-                if op.op_type not in branching_types:
-                    return 0
-                visited.add(op_id)
-                child_depths = []
-                if op.if_clause:
-                    for target in op.if_clause.if_true:
-                        child_depths.append(_measure_depth(target, visited))
-                    if op.if_clause.if_false:
-                        for target in op.if_clause.if_false:
-                            child_depths.append(_measure_depth(target, visited))
-                ops_prop = _find_property(op, "operations")
-                if ops_prop and isinstance(ops_prop.value, ArrayValue):
-                    for item in ops_prop.value.items:
-                        if isinstance(item, str):
-                            child_depths.append(_measure_depth(item, visited))
-                return 1 + max(child_depths, default=0)
-
+            depths = _nesting_depths(workflow)
             for op in workflow.operations:
-                if op.op_type in branching_types:
-                    depth = _measure_depth(op.id, set())
-                    if depth > self.max_depth:
-                        errors.append(ValidationError(
-                            f"Operation '{op.id}' has nesting depth {depth}, "
-                            f"maximum allowed is {self.max_depth}",
-                            line=op.line,
-                            column=op.column,
-                        ))
+                if op.op_type not in _BRANCHING_TYPES:
+                    continue
+                depth = depths.get(op.id, 0)
+                if depth > self.max_depth:
+                    errors.append(ValidationError(
+                        f"Operation '{op.id}' has nesting depth {depth}, "
+                        f"maximum allowed is {self.max_depth}",
+                        line=op.line,
+                        column=op.column,
+                    ))
 
         return errors
 
@@ -328,6 +337,85 @@ class Validator:
 # Helpers
 # ---------------------------------------------------------------------------
 
+def structure_key(workflow: Workflow) -> tuple:
+    """Hashable summary of everything validate_limits()/validate_structure() read.
+
+    Covers op IDs, types, positions (errors carry line numbers), data paths,
+    condition counts, branch targets and `sources`, plus the run: order.
+    Edits to any other property value leave the key unchanged.
+    """
+    ops = []
+    for op in workflow.operations:
+        ic = op.if_clause
+        sources = _find_property(op, "sources")
+        ops.append((
+            op.id, op.op_type, op.line, op.column,
+            op.input_path, op.output_path, len(op.conditions or ()),
+            (ic.path, ic.if_true, ic.if_false) if ic else None,
+            tuple(_branch_targets(op)),
+            sources.value if sources else None,
+        ))
+    return tuple(ops), workflow.execution_order
+
+
+_BRANCHING_TYPES = frozenset({"Conditional", "Loop"})
+
+
+def _branch_targets(op: Operation) -> list[str]:
+    """IDs an operation branches into: then/else targets and Loop operations."""
+    targets: list[str] = []
+    if op.if_clause:
+        targets += op.if_clause.if_true
+        if op.if_clause.if_false:
+            targets += op.if_clause.if_false
+    ops_prop = _find_property(op, "operations")
+    if ops_prop and isinstance(ops_prop.value, ArrayValue):
+        targets += [item for item in ops_prop.value.items if isinstance(item, str)]
+    return targets
+
+
+def _nesting_depths(workflow: Workflow) -> dict[str, int]:
+    """Longest Conditional/Loop nesting chain starting at each branching op.
+
+    An op that is reached again while still on the current chain (a
+    cycle) contributes 0. Depths of sub-branches that reach no cycle do
+    not depend on the chain leading to them, so they are memoized and
+    every such op is measured once (O(N + E)); ops that reach a cycle
+    are re-measured from each root.
+    """
+    op_map = workflow.by_id()
+    memo: dict[str, int] = {}
+    active: set[str] = set()
+
+    def measure(op_id: str) -> tuple[int, bool]:
+        """(depth, whether a cycle was cut short below op_id)."""
+        depth = memo.get(op_id)
+        if depth is not None:
+            return depth, False
+        op = op_map.get(op_id)
+        if op is None or op.op_type not in _BRANCHING_TYPES:
+            return 0, False
+        if op_id in active:
+            return 0, True
+        active.add(op_id)
+        depth, cut = 0, False
+        for target in _branch_targets(op):
+            child, child_cut = measure(target)
+            depth = max(depth, child)
+            cut = cut or child_cut
+        active.discard(op_id)
+        depth += 1
+        if not cut:
+            memo[op_id] = depth
+        return depth, cut
+
+    depths: dict[str, int] = {}
+    for op in workflow.operations:
+        if op.op_type in _BRANCHING_TYPES:
+            depths[op.id] = measure(op.id)[0]
+    return depths
+
+
 def _find_property(op: Operation, key: str) -> Property | None:
     for p in op.properties:
         if p.key == key:
@@ -1,10 +1,27 @@
-"""File watcher for auto-recompilation."""
+"""File watcher for auto-recompilation.
+
+Uses watchdog (inotify / FSEvents / ReadDirectoryChangesW) when installed
+(`pip install a2e-lang[watch]`), so an idle watch costs no CPU and a save
+is picked up immediately. Without it, the file's mtime is polled.
+"""
 
 from __future__ import annotations
 
+import functools
 import os
-import sys
+import threading
 import time
+from collections.abc import Iterator
+
+from .ast_nodes import Workflow
+from .errors import ValidationError
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - depends on the environment
+    FileSystemEventHandler = object
+    Observer = None
 
 
 def watch_and_compile(
@@ -20,75 +37,149 @@ def watch_and_compile(
         filepath: Path to the .a2e file.
         spec: Use official A2E spec format.
         pretty: Pretty-print output.
-        interval: Polling interval in seconds.
+        interval: Polling interval in seconds (without watchdog), or how
+            often to wake up to handle Ctrl+C (with it).
     """
-    from .compiler import Compiler
-    from .compiler_spec import SpecCompiler
-    from .errors import A2ELangError
-    from .parser import parse
-    from .validator import Validator
+    global _last_structure
 
     print(f"👀 Watching {filepath} (Ctrl+C to stop)")
 
-    last_mtime = 0.0
-    last_hash = ""
+    last_source = None
+    try:
+        for _ in _changes(filepath, interval):
+            try:
+                with open(filepath, encoding="utf-8") as f:
+                    source = f.read()
+            except FileNotFoundError:
+                print(f"❌ File not found: {filepath}")
+                continue
+
+            # Skip if content hasn't actually changed (touch, save without edits)
+            if source == last_source:
+                continue
+            last_source = source
+            _rebuild(filepath, source, spec=spec, pretty=pretty)
+    except KeyboardInterrupt:
+        print("\n🛑 Stopped watching.")
+        _parse_and_validate.cache_clear()
+        _last_structure = None
+
 
+def _rebuild(filepath: str, source: str, *, spec: bool, pretty: bool) -> None:
+    from .compiler import Compiler
+    from .compiler_spec import SpecCompiler
+    from .errors import A2ELangError
+
+    # Clear screen
+    print("\033[2J\033[H", end="")
+    timestamp = time.strftime("%H:%M:%S")
+    print(f"[{timestamp}] Compiling {filepath}...")
+    print("-" * 60)
+
+    try:
+        workflow, errors = _parse_and_validate(source)
+
+        if errors:
+            print(f"❌ {len(errors)} validation error(s):")
+            for e in errors:
+                print(f"  {e}")
+        else:
+            compiler = SpecCompiler() if spec else Compiler()
+            if pretty:
+                output = compiler.compile_pretty(workflow)
+            else:
+                output = compiler.compile(workflow)
+
+            print(f"✅ Compiled ({len(workflow.operations)} ops)")
+            print("-" * 60)
+            print(output)
+
+    except A2ELangError as e:
+        print(f"❌ Error: {e}")
+
+    print()
+    print(f"👀 Watching for changes... (Ctrl+C to stop)")
+
+
+def _changes(filepath: str, interval: float) -> Iterator[None]:
+    """Yield once at start and again whenever filepath may have changed."""
+    if Observer is None:
+        yield from _poll(filepath, interval)
+        return
+
+    changed = threading.Event()
+    changed.set()
+    observer = Observer()
+    # Watch the directory: editors often save by writing a temp file and
+    # renaming it over the original, which replaces the watched inode.
+    directory = os.path.dirname(os.path.abspath(filepath))
+    observer.schedule(_FileEventHandler(filepath, changed), directory, recursive=False)
+    observer.start()
+    try:
+        while True:
+            # Wake up periodically so Ctrl+C is handled on every platform
+            if changed.wait(interval):
+                changed.clear()
+                yield
+    finally:
+        observer.stop()
+        observer.join()
+
+
+def _poll(filepath: str, interval: float) -> Iterator[None]:
+    last_mtime = None
     while True:
         try:
             mtime = os.path.getmtime(filepath)
-            if mtime == last_mtime:
-                time.sleep(interval)
-                continue
-
+        except FileNotFoundError:
+            mtime = None
+        if mtime != last_mtime or mtime is None:
             last_mtime = mtime
+            yield
+        time.sleep(interval)
 
-            with open(filepath, encoding="utf-8") as f:
-                source = f.read()
 
-            # Skip if content hasn't actually changed
-            content_hash = str(hash(source))
-            if content_hash == last_hash:
-                time.sleep(interval)
-                continue
-            last_hash = content_hash
+class _FileEventHandler(FileSystemEventHandler):
+    """Sets an event when a filesystem event touches the watched file."""
 
-            # Clear screen
-            print("\033[2J\033[H", end="")
-            timestamp = time.strftime("%H:%M:%S")
-            print(f"[{timestamp}] Compiling {filepath}...")
-            print("-" * 60)
+    def __init__(self, filepath: str, changed: threading.Event) -> None:
+        super().__init__()
+        self._target = os.path.abspath(filepath)
+        self._changed = changed
 
-            try:
-                workflow = parse(source)
-                validator = Validator()
-                errors = validator.validate(workflow)
-
-                if errors:
-                    print(f"❌ {len(errors)} validation error(s):")
-                    for e in errors:
-                        print(f"  {e}")
-                else:
-                    compiler = SpecCompiler() if spec else Compiler()
-                    if pretty:
-                        output = compiler.compile_pretty(workflow)
-                    else:
-                        output = compiler.compile(workflow)
-
-                    print(f"✅ Compiled ({len(workflow.operations)} ops)")
-                    print("-" * 60)
-                    print(output)
-
-            except A2ELangError as e:
-                print(f"❌ Error: {e}")
-
-            print()
-            print(f"👀 Watching for changes... (Ctrl+C to stop)")
+    def on_any_event(self, event) -> None:
+        if event.is_directory:
+            return
+        paths = (event.src_path, getattr(event, "dest_path", ""))
+        if any(p and os.path.abspath(p) == self._target for p in paths):
+            self._changed.set()
 
-        except FileNotFoundError:
-            print(f"❌ File not found: {filepath}")
-            time.sleep(interval)
-        except KeyboardInterrupt:
-            print("\n🛑 Stopped watching.")
-            break
 
-        time.sleep(interval)
+@functools.lru_cache(maxsize=8)
+def _parse_and_validate(source: str) -> tuple[Workflow, tuple[ValidationError, ...]]:
+    """Parse and validate source, memoized across rebuilds.
+
+    Saving a file back to an earlier version (undo, branch switch) then
+    costs a dict lookup instead of a full parse and validation. Structural
+    validation is also skipped when an edit only touched property values.
+    """
+    global _last_structure
+    from .parser import parse
+    from .validator import Validator, structure_key
+
+    workflow = parse(source)
+    validator = Validator()
+    key = structure_key(workflow)
+    if _last_structure is not None and _last_structure[0] == key:
+        _, limit_errors, structure_errors = _last_structure
+    else:
+        limit_errors = tuple(validator.validate_limits(workflow))
+        structure_errors = tuple(validator.validate_structure(workflow))
+        _last_structure = (key, limit_errors, structure_errors)
+    # Same order as Validator.validate()
+    return workflow, (*limit_errors, *validator.validate_syntax(workflow), *structure_errors)
+
+
+# (structure_key, limit errors, structure errors) of the most recent
+# structural validation
+_last_structure: tuple[tuple, tuple[ValidationError, ...], tuple[ValidationError, ...]] | None = None
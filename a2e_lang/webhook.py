@@ -13,8 +13,9 @@ import threading
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from typing import Any
 
-from .engine import ExecutionEngine, ExecutionResult
-from .parser import parse
+from .ast_nodes import Workflow
+from .engine import ExecutionEngine, ExecutionResult, PreparedWorkflow
+from .parser import parse_cached
 from .validator import Validator
 
 
@@ -23,6 +24,9 @@ class WebhookHandler(BaseHTTPRequestHandler):
 
     # Set by WebhookServer before starting
     workflow_source: str = ""
+    workflow: Workflow | None = None
+    validation_errors: list[str] | None = None
+    prepared: PreparedWorkflow | None = None
     retry_policy: Any = None
 
     def do_POST(self):
@@ -41,13 +45,12 @@ class WebhookHandler(BaseHTTPRequestHandler):
                 return
 
         try:
-            # Parse and validate workflow
-            workflow = parse(self.workflow_source)
-            errors = Validator().validate(workflow)
+            # Parse and validate workflow (once, then served from cache)
+            workflow, errors = self._load_workflow()
             if errors:
                 self._send_json(422, {
                     "error": "Validation failed",
-                    "details": [str(e) for e in errors],
+                    "details": errors,
                 })
                 return
 
@@ -56,7 +59,11 @@ class WebhookHandler(BaseHTTPRequestHandler):
                 retry_policy=self.retry_policy,
                 input_data=input_data,
             )
-            result = engine.execute(workflow)
+            # Resolve handlers and branches once; every request reuses them
+            cls = type(self)
+            if cls.prepared is None:
+                cls.prepared = engine.prepare(workflow)
+            result = engine.execute(cls.prepared)
 
             # Return result
             response = {
@@ -74,6 +81,15 @@ class WebhookHandler(BaseHTTPRequestHandler):
         except Exception as e:
             self._send_json(500, {"error": str(e)})
 
+    @classmethod
+    def _load_workflow(cls) -> tuple[Workflow, list[str]]:
+        """Return the served workflow and its validation errors, parsing at most once."""
+        if cls.workflow is None:
+            cls.workflow = parse_cached(cls.workflow_source)
+        if cls.validation_errors is None:
+            cls.validation_errors = [str(e) for e in Validator().validate(cls.workflow)]
+        return cls.workflow, cls.validation_errors
+
     def do_GET(self):
         """Health check endpoint."""
         self._send_json(200, {"status": "ok", "endpoint": "a2e-lang webhook"})
@@ -95,8 +111,11 @@ class WebhookHandler(BaseHTTPRequestHandler):
 class WebhookServer:
     """Webhook server for triggering workflow execution via HTTP.
 
+    Accepts either a parsed Workflow or DSL source. The workflow is parsed,
+    validated and prepared once and every request executes the same plan.
+
     Usage:
-        server = WebhookServer("workflow.a2e", port=8080)
+        server = WebhookServer(parse(source), port=8080)
         server.start()  # Blocking
         # or
         server.start_background()  # Non-blocking
@@ -105,13 +124,19 @@ class WebhookServer:
 
     def __init__(
         self,
-        workflow_source: str,
+        workflow: Workflow | str,
         *,
+        source: str = "",
         host: str = "0.0.0.0",
         port: int = 8080,
         retry_policy: Any = None,
     ):
-        self.workflow_source = workflow_source
+        if isinstance(workflow, str):
+            self.workflow: Workflow | None = None
+            self.workflow_source = workflow
+        else:
+            self.workflow = workflow
+            self.workflow_source = source
         self.host = host
         self.port = port
         self.retry_policy = retry_policy
@@ -120,8 +145,7 @@ class WebhookServer:
 
     def start(self) -> None:
         """Start the webhook server (blocking)."""
-        WebhookHandler.workflow_source = self.workflow_source
-        WebhookHandler.retry_policy = self.retry_policy
+        self._bind_handler()
 
         self._server = HTTPServer((self.host, self.port), WebhookHandler)
         print(f"🌐 Webhook server listening on http://{self.host}:{self.port}")
@@ -135,13 +159,19 @@ class WebhookServer:
 
     def start_background(self) -> None:
         """Start the webhook server in a background thread."""
-        WebhookHandler.workflow_source = self.workflow_source
-        WebhookHandler.retry_policy = self.retry_policy
+        self._bind_handler()
 
         self._server = HTTPServer((self.host, self.port), WebhookHandler)
         self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
         self._thread.start()
 
+    def _bind_handler(self) -> None:
+        WebhookHandler.workflow_source = self.workflow_source
+        WebhookHandler.workflow = self.workflow
+        WebhookHandler.validation_errors = None
+        WebhookHandler.prepared = None
+        WebhookHandler.retry_policy = self.retry_policy
+
     def stop(self) -> None:
         """Stop the webhook server."""
         if self._server:
@@ -15,12 +15,13 @@ Supported step types (6 core primitives):
 
 from __future__ import annotations
 
-import json
 import re
 from typing import Any
 
 import yaml
 
+from ._json import dumps
+
 
 # ── Step type mapping ────────────────────────────────────────────────
 
@@ -265,18 +266,18 @@ def compile_yaml(data: dict) -> str:
     exec_order = [s["id"] for s in steps]
 
     lines = [
-        json.dumps({
+        dumps({
             "operationUpdate": {
                 "workflowId": workflow_name,
                 "operations": operations,
             }
-        }, separators=(",", ":")),
-        json.dumps({
+        }),
+        dumps({
             "beginExecution": {
                 "workflowId": workflow_name,
                 "root": exec_order[0],
             }
-        }, separators=(",", ":")),
+        }),
     ]
     return "\n".join(lines)
 
@@ -289,18 +290,18 @@ def compile_yaml_pretty(data: dict) -> str:
     exec_order = [s["id"] for s in steps]
 
     lines = [
-        json.dumps({
+        dumps({
             "operationUpdate": {
                 "workflowId": workflow_name,
                 "operations": operations,
             }
-        }, indent=2),
-        json.dumps({
+        }, pretty=True),
+        dumps({
             "beginExecution": {
                 "workflowId": workflow_name,
                 "root": exec_order[0],
             }
-        }, indent=2),
+        }, pretty=True),
     ]
     return "\n\n".join(lines)
 
@@ -1,5 +1,7 @@
 """Shared fixtures for a2e-lang tests."""
 
+import os
+
 import pytest
 
 from a2e_lang.compiler import Compiler
@@ -7,6 +9,12 @@ from a2e_lang.parser import parse
 from a2e_lang.validator import Validator
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _ast_cache_dir(tmp_path_factory):
+    """Keep the CLI's on-disk AST cache out of the user's home directory."""
+    os.environ["A2E_LANG_CACHE_DIR"] = str(tmp_path_factory.mktemp("ast-cache"))
+
+
 @pytest.fixture
 def compiler():
     return Compiler()
@@ -59,6 +59,17 @@ class TestCliCompile:
         finally:
             os.unlink(path)
 
+    def test_compile_writes_utf8(self, capsysbinary):
+        path = _write_temp_file(VALID_SOURCE.replace("api.example.com", "api.exämple.com"))
+        try:
+            rc = main(["compile", path])
+            assert rc == 0
+            output = capsysbinary.readouterr().out
+            assert output.endswith(b"\n")
+            assert "api.exämple.com".encode("utf-8") in output
+        finally:
+            os.unlink(path)
+
     def test_compile_validation_failure(self, capsys):
         path = _write_temp_file(INVALID_SOURCE)
         try:
@@ -112,3 +123,139 @@ class TestCliNoCommand:
     def test_no_command_returns_1(self, capsys):
         rc = main([])
         assert rc == 1
+
+
+class TestCliFastPath:
+
+    @pytest.mark.parametrize("argv", [
+        ["validate", "wf.a2e"],
+        ["compile", "wf.a2e"],
+        ["compile", "--pretty", "wf.a2e", "--spec"],
+        ["graph", "wf.a2e"],
+        ["simulate", "wf.a2e", "--input", "data.json", "--max-depth", "3"],
+        ["run", "--no-retry", "wf.a2e", "--workers", "4"],
+        ["run", "wf.a2e"],
+        ["webhook", "wf.a2e", "--port", "9000"],
+        ["sourcemap", "wf.a2e", "-o", "map.json"],
+    ])
+    def test_fast_args_match_argparse(self, argv):
+        from a2e_lang.cli import _build_parser, _fast_args
+        assert _fast_args(argv) == _build_parser().parse_args(argv)
+
+    @pytest.mark.parametrize("argv", [
+        [],
+        ["compile", "--help"],
+        ["compile", "--out", "x", "wf.a2e"],
+        ["compile", "a.a2e", "b.a2e"],
+        ["run", "wf.a2e", "--workers"],
+        ["run", "wf.a2e", "--workers", "many"],
+        ["run", "wf.a2e", "--workers=4"],
+        ["prompt", "claude"],
+    ])
+    def test_fast_args_defers_to_argparse(self, argv):
+        from a2e_lang.cli import _fast_args
+        assert _fast_args(argv) is None
+
+    def test_fast_defaults_match_argparse(self):
+        from a2e_lang.cli import _FAST_OPTIONS, _build_parser, _fast_args
+        for command in _FAST_OPTIONS:
+            argv = [command, "wf.a2e"]
+            assert _fast_args(argv) == _build_parser().parse_args(argv), command
+
+    def test_single_command_parser_matches_full_parser(self):
+        from a2e_lang.cli import _build_parser
+        argv = ["simulate", "wf.a2e", "--input", "data.json", "--max-depth", "3"]
+        assert _build_parser("simulate").parse_args(argv) == _build_parser().parse_args(argv)
+
+
+class TestAstCache:
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("A2E_LANG_CACHE_DIR", str(tmp_path))
+        monkeypatch.delenv("A2E_LANG_NO_CACHE", raising=False)
+        from a2e_lang.cli import _load
+        _load.cache_clear()
+        return tmp_path
+
+    def test_store_and_load(self):
+        from a2e_lang import _ast_cache
+        from a2e_lang.parser import parse
+        workflow = parse(VALID_SOURCE)
+        assert _ast_cache.load(VALID_SOURCE) is None
+        _ast_cache.store(VALID_SOURCE, workflow)
+        assert _ast_cache.load(VALID_SOURCE) == workflow
+        assert _ast_cache.load(VALID_SOURCE + "\n") is None
+
+    def test_store_after_cached_indexes_built(self):
+        from a2e_lang import _ast_cache
+        from a2e_lang.parser import parse_uncached
+        workflow = parse_uncached(VALID_SOURCE)
+        workflow.by_id()
+        workflow.topo_order()
+        for op in workflow.operations:
+            op.prop_map()
+        _ast_cache.store(VALID_SOURCE, workflow)
+
+        loaded = _ast_cache.load(VALID_SOURCE)
+        assert loaded == workflow
+        assert loaded._by_id is None
+        assert loaded.by_id().keys() == workflow.by_id().keys()
+        assert loaded.operations[0].prop_map() == workflow.operations[0].prop_map()
+
+    def test_disabled(self, monkeypatch, cache_dir):
+        from a2e_lang import _ast_cache
+        from a2e_lang.parser import parse
+        monkeypatch.setenv("A2E_LANG_NO_CACHE", "1")
+        _ast_cache.store(VALID_SOURCE, parse(VALID_SOURCE))
+        assert _ast_cache.load(VALID_SOURCE) is None
+        assert not list(cache_dir.iterdir())
+
+    def test_eviction(self, monkeypatch, cache_dir):
+        from a2e_lang import _ast_cache
+        from a2e_lang.parser import parse
+        monkeypatch.setattr(_ast_cache, "MAX_ENTRIES", 2)
+        for i in range(4):
+            source = VALID_SOURCE.replace("cli-test", f"cli-test-{i}")
+            _ast_cache.store(source, parse(source))
+        assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+    def test_cli_populates_cache(self, capsys, cache_dir):
+        path = _write_temp_file(VALID_SOURCE)
+        try:
+            assert main(["validate", path]) == 0
+            assert len(list(cache_dir.glob("*.pkl"))) == 1
+            assert main(["validate", path]) == 0
+        finally:
+            os.unlink(path)
+
+    def test_load_memoized_in_process(self, monkeypatch):
+        from a2e_lang import _ast_cache
+        from a2e_lang.cli import _load
+        first = _load(VALID_SOURCE)
+        monkeypatch.setattr(_ast_cache, "load", lambda source: pytest.fail("re-read"))
+        assert _load(VALID_SOURCE) is first
+
+
+class TestWatch:
+
+    def test_rebuilds_only_when_content_changes(self, capsys, monkeypatch):
+        from a2e_lang import watcher
+        path = _write_temp_file(VALID_SOURCE)
+
+        def changes(filepath, interval):
+            yield
+            yield  # touched, same content
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(VALID_SOURCE.replace("cli-test", "cli-test-2"))
+            yield
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(watcher, "_changes", changes)
+        try:
+            watcher.watch_and_compile(path)
+        finally:
+            os.unlink(path)
+        output = capsys.readouterr().out
+        assert output.count("✅ Compiled") == 2
+        assert "Stopped watching" in output
@@ -1,5 +1,6 @@
 """Tests for a2e_lang.compiler."""
 
+import io
 import json
 
 import pytest
@@ -211,6 +212,21 @@ class TestConditionalCompilation:
         assert cond["ifTrue"] == "a"
         assert "ifFalse" not in cond
 
+    def test_conditional_multiple_targets(self, c):
+        w = parse('''
+        workflow "t"
+        a = Wait { duration: 1 }
+        b = Wait { duration: 2 }
+        check = Conditional {
+            if /workflow/data > 0
+            then a, b
+        }
+        ''')
+        result = c.compile(w)
+        ops = json.loads(result.split("\n")[0])["operationUpdate"]["operations"]
+        cond = ops[2]["operation"]["Conditional"]
+        assert cond["ifTrue"] == ["a", "b"]
+
 
 # ---------------------------------------------------------------------------
 # Other operations
@@ -291,6 +307,54 @@ class TestPrettyPrint:
         json.loads(blocks[1])  # Should not raise
 
 
+# ---------------------------------------------------------------------------
+# Value dispatch
+# ---------------------------------------------------------------------------
+
+class TestValueDispatch:
+
+    def test_value_subclass_uses_base_compiler(self, c):
+        from a2e_lang.ast_nodes import Path
+
+        class Tag(str):
+            pass
+
+        class RootPath(Path):
+            pass
+
+        assert c._compile_value(Tag("x")) == "x"
+        assert c._compile_value(RootPath("/workflow")) == "/workflow"
+
+    def test_unknown_value_type(self, c):
+        from a2e_lang.errors import CompileError
+        with pytest.raises(CompileError, match="Unknown value type"):
+            c._compile_value(object())
+
+
+# ---------------------------------------------------------------------------
+# Streaming output
+# ---------------------------------------------------------------------------
+
+class TestWrite:
+
+    def test_write_matches_compile(self, c, full_ast):
+        buf = io.BytesIO()
+        c.write(full_ast, buf)
+        assert buf.getvalue().decode("utf-8") == c.compile(full_ast) + "\n"
+
+    def test_write_pretty_matches_compile_pretty(self, c, full_ast):
+        buf = io.BytesIO()
+        c.write(full_ast, buf, pretty=True)
+        assert buf.getvalue().decode("utf-8") == c.compile_pretty(full_ast) + "\n"
+
+    def test_write_without_orjson(self, c, full_ast, monkeypatch):
+        from a2e_lang import _json
+        monkeypatch.setattr(_json, "orjson", None)
+        buf = io.BytesIO()
+        c.write(full_ast, buf)
+        assert buf.getvalue().decode("utf-8") == c.compile(full_ast) + "\n"
+
+
 # ---------------------------------------------------------------------------
 # Full pipeline
 # ---------------------------------------------------------------------------
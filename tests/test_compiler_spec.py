@@ -1,5 +1,6 @@
 """Tests for a2e_lang.compiler_spec (official A2E protocol format)."""
 
+import io
 import json
 
 import pytest
@@ -197,6 +198,87 @@ class TestPrettyPrint:
             json.loads(block)  # Should not raise
 
 
+# ---------------------------------------------------------------------------
+# Streaming output
+# ---------------------------------------------------------------------------
+
+class TestWrite:
+
+    def test_write_matches_compile(self, sc, full_ast):
+        buf = io.BytesIO()
+        sc.write(full_ast, buf)
+        assert buf.getvalue().decode("utf-8") == sc.compile(full_ast) + "\n"
+
+    def test_write_pretty_matches_compile_pretty(self, sc, full_ast):
+        buf = io.BytesIO()
+        sc.write(full_ast, buf, pretty=True)
+        assert buf.getvalue().decode("utf-8") == sc.compile_pretty(full_ast) + "\n"
+
+    def test_write_without_orjson(self, sc, full_ast, monkeypatch):
+        from a2e_lang import _json
+        monkeypatch.setattr(_json, "orjson", None)
+        buf = io.BytesIO()
+        sc.write(full_ast, buf)
+        assert buf.getvalue().decode("utf-8") == sc.compile(full_ast) + "\n"
+
+
+class TestOperationCache:
+
+    def test_recompile_reuses_cached_lines(self, sc):
+        ast = parse('''
+        workflow "cached"
+        w = Wait { duration: 5 }
+        ''')
+        first = sc.compile(ast)
+        cached = ast.operations[0]._spec_json
+        assert cached is not None
+        assert sc.compile(ast) == first
+        assert ast.operations[0]._spec_json is cached
+
+    def test_replaced_operation_is_recompiled(self, sc):
+        import dataclasses
+        from a2e_lang.ast_nodes import Property
+
+        ast = parse('''
+        workflow "cached"
+        w = Wait { duration: 5 }
+        ''')
+        sc.compile(ast)
+        op = dataclasses.replace(ast.operations[0], properties=(Property("duration", 7),))
+        ast2 = dataclasses.replace(ast, operations=(op,))
+        line = sc.compile(ast2).splitlines()[0]
+        assert json.loads(line)["operation"]["Wait"]["duration"] == 7
+
+
+class TestFlatOperationJson:
+
+    SOURCE = '''
+    workflow "flat"
+    plain = StoreData { from /workflow/in storage: "localStorage" key: "k" -> /workflow/out }
+    scalars = Wait { duration: 5 neg: -3 on: true off: false none: null }
+    unicode = FormatText { template: "héllo ✓" }
+    quoted = FormatText { template: "say \\"hi\\"" }
+    big = Wait { duration: 123456789012345678901234567890 }
+    real = Wait { duration: 1.5 }
+    nested = ApiCall { method: "GET" url: "u" headers: { a: "b" } }
+    '''
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_matches_generic_serialization(self, sc, monkeypatch, use_orjson):
+        from a2e_lang import _json
+        from a2e_lang.compiler_spec import _flat_operation_json
+
+        if not use_orjson:
+            monkeypatch.setattr(_json, "orjson", None)
+        ast = parse(self.SOURCE)
+        flat = {op.id: _flat_operation_json(op) for op in ast.operations}
+
+        assert {k for k, v in flat.items() if v is not None} == {"plain", "scalars", "unicode"}
+        for op in ast.operations:
+            if flat[op.id] is not None:
+                assert flat[op.id] == _json.dumps(sc._operation_update(op))
+
+
 # ---------------------------------------------------------------------------
 # Full roundtrip with spec format
 # ---------------------------------------------------------------------------
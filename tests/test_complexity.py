@@ -111,6 +111,32 @@ class TestMaxDepth:
         errors = v.validate(w)
         assert any("nesting depth 2" in str(e) and "maximum allowed is 1" in str(e) for e in errors)
 
+    def test_depth_follows_longest_branch(self):
+        v = Validator(max_depth=3)
+        w = parse('''
+        workflow "t"
+        a = Wait { duration: 1 }
+        leaf = Conditional { if /workflow/x > 0 then a }
+        short = Conditional { if /workflow/x > 1 then leaf }
+        mid = Conditional { if /workflow/x > 2 then leaf }
+        long = Conditional { if /workflow/x > 3 then mid }
+        top = Conditional { if /workflow/x > 4 then short, long }
+        ''')
+        errors = v.validate(w)
+        assert any("'top' has nesting depth 4" in str(e) for e in errors)
+
+    @pytest.mark.parametrize("order", [("a", "b"), ("b", "a")])
+    def test_depth_through_branch_cycle(self, order):
+        v = Validator(max_depth=1)
+        ops = {
+            "a": "a = Conditional { if /workflow/x > 0 then b }",
+            "b": "b = Conditional { if /workflow/x > 1 then a }",
+        }
+        w = parse('workflow "t"\n' + "\n".join(ops[name] for name in order))
+        errors = [str(e) for e in v.validate(w)]
+        assert any("'a' has nesting depth 2" in e for e in errors)
+        assert any("'b' has nesting depth 2" in e for e in errors)
+
     def test_combined_limits(self):
         v = Validator(max_operations=10, max_depth=3, max_conditions=5)
         w = parse('''
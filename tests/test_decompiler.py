@@ -108,6 +108,32 @@ class TestDecompileCredentials:
         assert 'credential("api-key")' in dsl
 
 
+class TestDecompileValues:
+
+    def test_scalar_values(self):
+        jsonl = (
+            '{"type":"operationUpdate","operationId":"w","operation":{"Wait":'
+            '{"a":true,"b":false,"c":1,"d":1.5,"e":null,"f":"x","g":"/p","h":[1,true]}}}'
+        )
+        dsl = Decompiler().decompile(jsonl)
+        assert "a: true" in dsl
+        assert "b: false" in dsl
+        assert "c: 1" in dsl
+        assert "d: 1.5" in dsl
+        assert "e: null" in dsl
+        assert 'f: "x"' in dsl
+        assert "g: /p" in dsl
+        assert "h: [1, true]" in dsl
+
+    def test_blank_lines_and_unicode_line_separator(self):
+        jsonl = (
+            '\n{"type":"operationUpdate","operationId":"w","operation":'
+            '{"FormatText":{"template":"a\u2028b"}}}\n\n'
+        )
+        dsl = Decompiler().decompile(jsonl)
+        assert 'template: "a\u2028b"' in dsl
+
+
 class TestDecompileConditional:
 
     def test_conditional_roundtrip(self):
@@ -75,6 +75,16 @@ class TestPluginSystem:
         assert is_valid_op_type("MyCustomOp") is True
         assert is_valid_op_type("NonExistent") is False
 
+    def test_unregister_and_clear_drop_op_type(self):
+        register_plugin(PluginSpec(name="GoneOp"))
+        register_plugin(PluginSpec(name="AlsoGoneOp"))
+        unregister_plugin("GoneOp")
+        assert is_valid_op_type("GoneOp") is False
+        assert is_valid_op_type("AlsoGoneOp") is True
+        clear_plugins()
+        assert is_valid_op_type("AlsoGoneOp") is False
+        assert is_valid_op_type("ApiCall") is True
+
     def test_get_all_op_types_includes_plugins(self):
         register_plugin(PluginSpec(name="ExtraOp"))
         all_types = get_all_op_types()
@@ -131,6 +141,22 @@ class TestWorkflowRegistry:
         results = reg.search("api")
         assert len(results) == 1
 
+    def test_search_matches_tags_and_description_case_insensitively(self, tmp_path):
+        reg = WorkflowRegistry(tmp_path / "registry")
+        reg.publish("wf1", SIMPLE, tags=["REST"])
+        reg.publish("wf2", SIMPLE, tags=["restful"])
+        reg.publish("wf3", SIMPLE, description="Uses a REST endpoint")
+        reg.publish("wf4", SIMPLE, tags=["other"])
+        assert [e.name for e in reg.search("rest")] == ["wf1", "wf2", "wf3"]
+
+    def test_search_after_republish_and_remove(self, tmp_path):
+        reg = WorkflowRegistry(tmp_path / "registry")
+        reg.publish("wf1", SIMPLE, tags=["api"])
+        reg.publish("wf1", SIMPLE, tags=["batch"])
+        assert reg.search("api") == []
+        reg.remove("wf1")
+        assert reg.search("batch") == []
+
     def test_remove(self, tmp_path):
         reg = WorkflowRegistry(tmp_path / "registry")
         reg.publish("to-remove", SIMPLE)
@@ -154,6 +180,45 @@ class TestWorkflowRegistry:
         reg2 = WorkflowRegistry(reg_dir)
         assert reg2.get("persist-test") is not None
 
+    def test_index_omits_source(self, tmp_path):
+        import json
+        reg_dir = tmp_path / "registry"
+        WorkflowRegistry(reg_dir).publish("wf", SIMPLE, tags=["t"])
+
+        index = json.loads((reg_dir / "index.json").read_text(encoding="utf-8"))
+        assert "source" not in index["workflows"][0]
+        assert not (reg_dir / "index.json.tmp").exists()
+        reg2 = WorkflowRegistry(reg_dir)
+        assert reg2.get_source("wf") == SIMPLE
+        assert reg2.get("wf").source == SIMPLE
+
+    def test_index_with_inline_source_still_loads(self, tmp_path):
+        import json
+        reg_dir = tmp_path / "registry"
+        reg_dir.mkdir()
+        entry = WorkflowEntry(name="old", source=SIMPLE)
+        (reg_dir / "index.json").write_text(
+            json.dumps({"version": "1.0.0", "workflows": [entry.to_dict()]}),
+            encoding="utf-8",
+        )
+        assert WorkflowRegistry(reg_dir).get_source("old") == SIMPLE
+
+    def test_index_is_loaded_on_first_use(self, tmp_path, monkeypatch):
+        reg_dir = tmp_path / "registry"
+        WorkflowRegistry(reg_dir).publish("first", SIMPLE)
+
+        loads = []
+        original = WorkflowRegistry._load
+        monkeypatch.setattr(
+            WorkflowRegistry, "_load", lambda self: (loads.append(1), original(self))
+        )
+        reg = WorkflowRegistry(reg_dir)
+        assert loads == []
+        reg.publish("second", SIMPLE)
+        reg.list_all()
+        assert loads == [1]
+        assert [e.name for e in WorkflowRegistry(reg_dir).list_all()] == ["first", "second"]
+
     def test_summary(self, tmp_path):
         reg = WorkflowRegistry(tmp_path / "registry")
         reg.publish("wf1", SIMPLE, author="alice", tags=["test"])
@@ -255,6 +320,18 @@ class TestOrchestrator:
         assert result.success is True
         assert result.steps_completed == 2
 
+    def test_invalid_step_stops_at_that_step(self):
+        orch = Orchestrator()
+        orch.add_step("ok", WAIT_WF)
+        orch.add_step("bad", 'workflow "t"\nx = Bogus { }')
+        orch.add_step("broken", "not a workflow")
+        result = orch.run()
+
+        assert result.success is False
+        assert result.steps_completed == 1
+        assert [sr["name"] for sr in result.step_results] == ["ok", "bad"]
+        assert result.error == "Step 'bad' failed validation"
+
 
 # ---------------------------------------------------------------------------
 # Source Maps
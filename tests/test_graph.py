@@ -1,5 +1,7 @@
 """Tests for graph visualization (Mermaid output)."""
 
+import pytest
+
 from a2e_lang.graph import generate_mermaid
 from a2e_lang.parser import parse
 
@@ -44,6 +46,21 @@ class TestMermaidGeneration:
         assert "check -->|then| a" in result
         assert "check -->|else| b" in result
 
+    def test_merge_and_loop_edges(self):
+        w = parse('''
+        workflow "t"
+        a = Wait { duration: 1 -> /workflow/a }
+        b = Wait { duration: 2 -> /workflow/b }
+        m = MergeData { sources: [/workflow/a, /workflow/b] -> /workflow/m }
+        each = Loop { from /workflow/m operations: ["a", "b"] }
+        ''')
+        result = generate_mermaid(w)
+        assert "a -->|/workflow/a| m" in result
+        assert "b -->|/workflow/b| m" in result
+        assert "m -->|/workflow/m| each" in result
+        assert "each -->|loop| a" in result
+        assert "each((each\\nLoop))" in result
+
     def test_execution_order_edges(self):
         w = parse('''
         workflow "t"
@@ -99,3 +116,87 @@ class TestMermaidGeneration:
         # Execution order
         assert "fetch -.->|next| filter" in result
         assert "filter -.->|next| store" in result
+
+    def test_result_cached_on_workflow(self):
+        w = parse('workflow "t"\nop = Wait { duration: 1 }')
+        assert generate_mermaid(w) is generate_mermaid(w)
+        assert w == parse('workflow "t"\nop = Wait { duration: 1 }')
+
+
+class TestTopoOrder:
+
+    def test_declaration_order_kept_when_valid(self):
+        w = parse('''
+        workflow "t"
+        a = ApiCall { method: "GET" url: "https://x.com" -> /workflow/a }
+        b = Wait { duration: 1 }
+        c = FilterData { from /workflow/a where x == 1 -> /workflow/c }
+        ''')
+        assert w.topo_order() == ("a", "b", "c")
+
+    def test_reader_before_writer_keeps_order(self):
+        w = parse('''
+        workflow "t"
+        store = StoreData { from /workflow/data storage: "s" key: "k" }
+        fetch = ApiCall { method: "GET" url: "https://x.com" -> /workflow/data }
+        ''')
+        assert w.topo_order() == ("store", "fetch")
+
+    def test_overwritten_path_keeps_order(self):
+        w = parse('''
+        workflow "t"
+        a = Wait { duration: 1 -> /workflow/x }
+        b = FilterData { from /workflow/x where v > 0 -> /workflow/y }
+        c = Wait { duration: 1 -> /workflow/x }
+        ''')
+        assert w.topo_order() == ("a", "b", "c")
+        assert w.topo_levels() == (("a",), ("b",), ("c",))
+
+    def test_conditional_precedes_targets(self):
+        w = parse('''
+        workflow "t"
+        a = Wait { duration: 1 }
+        check = Conditional { if /workflow/x > 0 then a }
+        ''')
+        assert w.topo_order() == ("check", "a")
+
+    def test_conditional_carries_branch_paths(self):
+        w = parse('''
+        workflow "t"
+        check = Conditional { if /workflow/n > 0 then w }
+        r = FilterData { from /workflow/x where v > 0 -> /workflow/y }
+        w = Wait { duration: 1 -> /workflow/x }
+        ''')
+        # w may run inside check's branch, so r cannot share check's level
+        assert w.topo_levels() == (("check",), ("r",), ("w",))
+
+    def test_result_is_cached(self):
+        w = parse('''
+        workflow "t"
+        a = Wait { duration: 1 }
+        ''')
+        assert w.topo_order() is w.topo_order()
+
+    def test_by_id_index(self):
+        w = parse('''
+        workflow "t"
+        a = Wait { duration: 1 }
+        b = Wait { duration: 2 }
+        ''')
+        index = w.by_id()
+        assert index["b"] is w.operations[1]
+        assert w.by_id() is index
+        with pytest.raises(TypeError):
+            index["c"] = w.operations[0]
+
+    def test_prop_map_first_key_wins(self):
+        w = parse('''
+        workflow "t"
+        a = Wait { duration: 1 duration: 2 }
+        ''')
+        op = w.operations[0]
+        props = op.prop_map()
+        assert props["duration"] == 1
+        assert op.prop_map() is props
+        with pytest.raises(TypeError):
+            props["x"] = 3
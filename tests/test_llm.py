@@ -40,6 +40,33 @@ class TestRecovery:
         assert "true" in result.source
         assert "True" not in result.source
 
+    def test_python_literals_in_one_pass(self):
+        src = 'workflow "test"\n\na = Wait { duration: 1\n  a: None\n  b: True\n  c: Nonesuch\n}\n'
+        result = recover(src)
+        assert "a: null" in result.source
+        assert "b: true" in result.source
+        assert "c: Nonesuch" in result.source
+        assert result.fixes == [
+            "Converted Python 'True' to 'true'",
+            "Converted Python 'None' to 'null'",
+        ]
+
+    def test_python_literals_in_strings_and_comments_kept(self):
+        src = 'workflow "t"\na = Wait {\n  x: "is True" # or False\n  y: \'None\'\n  z: False\n}\n'
+        result = recover(src)
+        assert 'x: "is True" # or False' in result.source
+        assert 'y: "None"' in result.source
+        assert "z: false" in result.source
+        assert "Converted Python 'True' to 'true'" not in result.fixes
+
+    def test_repeated_source_returns_independent_results(self):
+        src = 'workflow: "t"\na = Wait { duration: 1 }\n'
+        first = recover(src)
+        first.fixes.append("mutated")
+        second = recover(src)
+        assert second.fixes == ["Removed colon after 'workflow'"]
+        assert second.source == first.source
+
     def test_single_quotes_to_double(self):
         src = """workflow "test"\n\na = ApiCall {\n  method: 'GET'\n  url: 'https://x.com'\n}\n"""
         result = recover(src)
@@ -88,6 +115,55 @@ class TestRecovery:
         assert workflow.name == "my-pipeline"
         assert result.was_modified
 
+    @pytest.mark.parametrize("src", [
+        'workflow my-pipeline\n',
+        'workflow: "t"\n',
+        'a = Wait {\n  duration: 1;\n}\n',
+        'a = Wait { duration: int = 1 }\n',
+        'a = operation Wait { duration: 1 }\n',
+        'a = Wait { => /workflow/out }\n',
+        'a = Wait { --> /workflow/out }\n',
+        'a = FilterData {\n  input /workflow/in\n}\n',
+        'a = Wait {\n  output /workflow/out\n}\n',
+        'order: a -> b\n',
+        'a = Wait { headers: { x: "y", } }\n',
+        'a = Wait { on: None }\n',
+        "a = Wait { method: 'GET' }\n",
+    ])
+    def test_dirty_probe_flags_every_fix(self, src):
+        from a2e_lang.recovery import _DIRTY_PROBE
+        assert recover(src).was_modified
+        assert _DIRTY_PROBE.search(src) is not None
+
+    def test_clean_source_skips_fixes(self, monkeypatch):
+        from a2e_lang import recovery
+
+        def fail(source):
+            raise AssertionError("fixes applied to a clean source")
+
+        monkeypatch.setattr(recovery, "_apply_fixes", fail)
+        src = 'workflow "test"\n\n# a "TODO" note\na = Wait { duration: 1 }\n'
+        assert recover(src).fixes == []
+        workflow, result = parse_with_recovery(src)
+        assert workflow.name == "test"
+        assert not result.was_modified
+
+    def test_parse_with_recovery_clean_invalid_source_raises(self):
+        from a2e_lang.errors import ParseError
+        with pytest.raises(ParseError):
+            parse_with_recovery('workflow "test"\n\na = Wait { duration }\n')
+
+    def test_compiled_fixes_follow_table_order(self):
+        import re
+        from a2e_lang.recovery import _compile_fixes
+        apply = _compile_fixes([
+            (re.compile("a"), "b", "a to b"),
+            (re.compile("x"), "x", "no-op"),
+            (re.compile("[bc]"), {"b": "c"}, "{0} to {1}"),
+        ])
+        assert apply("xa") == ("xc", ("a to b", "b to c"))
+        assert apply("x") == ("x", ())
+
     def test_summary(self):
         result = RecoveryResult("fixed", "original", ["Fix 1", "Fix 2"])
         summary = result.summary()
@@ -177,6 +253,13 @@ class TestPrompts:
         assert "Fetch users" in result["user"]
         assert "a2e-lang" in result["system"]
 
+    def test_format_prompt_repeated_returns_independent_dicts(self):
+        task = "Use {braces} as-is"
+        first = format_prompt("claude", task)
+        first["user"] = "mutated"
+        second = format_prompt("claude", task)
+        assert second["user"] == get_template("claude").user_template.format(task_description=task)
+
     def test_templates_contain_grammar(self):
         for name in TEMPLATES:
             t = get_template(name)
@@ -67,3 +67,12 @@ class TestLspCompletionData:
         assert "where" in keywords
         assert "if" in keywords
         assert "credential" in keywords
+
+    def test_static_completions_cover_types_and_keywords(self):
+        try:
+            from a2e_lang.lsp import _STATIC_COMPLETIONS, OPERATION_DESCRIPTIONS
+        except ImportError:
+            pytest.skip("pygls not installed")
+        labels = {item.label for item in _STATIC_COMPLETIONS}
+        assert set(OPERATION_DESCRIPTIONS) <= labels
+        assert {"workflow", "contains", "method"} <= labels
@@ -116,6 +116,30 @@ class TestOperationDef:
         op = w.operations[0]
         assert op.if_clause.if_false is None
 
+    def test_if_clause_with_path_value(self):
+        w = parse('''
+        workflow "t"
+        check = Conditional {
+            if /workflow/a == /workflow/b
+            then process
+        }
+        ''')
+        ic = w.operations[0].if_clause
+        assert ic.value == Path(raw="/workflow/b")
+        assert ic.if_true == ("process",)
+
+    def test_operator_keyword_as_condition_field(self):
+        w = parse('''
+        workflow "t"
+        f = FilterData {
+            from /workflow/d
+            where contains contains "x"
+            -> /workflow/r
+        }
+        ''')
+        cond = w.operations[0].conditions[0]
+        assert (cond.field, cond.operator, cond.value) == ("contains", "contains", "x")
+
     def test_multiple_operations(self):
         w = parse('''
         workflow "t"
@@ -238,6 +262,12 @@ class TestProperties:
         assert isinstance(auth.value, Credential)
         assert auth.value.id == "my-key"
 
+    def test_leaf_nodes_compare_by_type(self):
+        assert Path(raw="x") == Path(raw="x")
+        assert Path(raw="x") != Credential(id="x")
+        assert Path(raw="x") != ("x",)
+        assert hash(Path(raw="x")) == hash(Path(raw="x"))
+
     def test_object_value(self):
         w = parse('''
         workflow "t"
@@ -434,3 +464,64 @@ class TestAllOperationTypes:
     def test_encode_decode(self):
         w = parse('workflow "t"\nop = EncodeDecode { from /workflow/d operation: "encode" encoding: "base64" -> /workflow/r }')
         assert w.operations[0].op_type == "EncodeDecode"
+
+
+# ---------------------------------------------------------------------------
+# Memoized parsing
+# ---------------------------------------------------------------------------
+
+class TestParseCached:
+
+    def test_same_source_returns_same_workflow(self):
+        from a2e_lang.parser import parse_cached
+        src = 'workflow "cached"\nop = Wait { duration: 100 }'
+        assert parse_cached(src) is parse_cached(src)
+        assert parse_cached(src) == parse(src)
+
+    def test_errors_are_raised(self):
+        from a2e_lang.parser import parse_cached
+        with pytest.raises(ParseError):
+            parse_cached('workflow "t"\n!!invalid!!')
+
+    def test_parse_is_memoized(self):
+        from a2e_lang.parser import parse_uncached
+        src = 'workflow "memo"\nop = Wait { duration: 1 }'
+        parse.cache_clear()
+        assert parse(src) is parse(src)
+        assert parse.cache_info().hits == 1
+        fresh = parse_uncached(src)
+        assert fresh == parse(src) and fresh is not parse(src)
+
+
+# ---------------------------------------------------------------------------
+# Parser backends
+# ---------------------------------------------------------------------------
+
+class TestParserBackends:
+
+    def test_lalr_matches_earley(self, full_source):
+        from a2e_lang.parser import A2ETransformer, _get_parser
+        lalr = A2ETransformer().transform(_get_parser("lalr").parse(full_source))
+        earley = A2ETransformer().transform(_get_parser("earley").parse(full_source))
+        assert lalr == earley
+        assert [(op.line, op.column) for op in lalr.operations] == [
+            (op.line, op.column) for op in earley.operations
+        ]
+
+    def test_lalr_tables_cached_on_disk(self, tmp_path, monkeypatch, minimal_source):
+        from a2e_lang import parser
+        monkeypatch.setenv("A2E_LANG_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(parser, "_lark_parsers", {})
+        first = parser.parse_uncached(minimal_source)
+        assert [p.suffix for p in tmp_path.iterdir()] == [".lark"]
+
+        monkeypatch.setattr(parser, "_lark_parsers", {})
+        assert parser.parse_uncached(minimal_source) == first
+
+    def test_no_disk_cache_when_disabled(self, tmp_path, monkeypatch, minimal_source):
+        from a2e_lang import parser
+        monkeypatch.setenv("A2E_LANG_CACHE_DIR", str(tmp_path))
+        monkeypatch.setenv("A2E_LANG_NO_CACHE", "1")
+        monkeypatch.setattr(parser, "_lark_parsers", {})
+        parser.parse_uncached(minimal_source)
+        assert list(tmp_path.iterdir()) == []
@@ -1,7 +1,7 @@
 """Tests for Phase 3: Runtime & Observability features."""
 
 import json
-import time
+import threading
 import urllib.request
 import pytest
 
@@ -69,6 +69,31 @@ class TestStructuredLogging:
         assert pipeline.operation_count == 1
         assert pipeline.operations[0].status == "skipped"
 
+    def test_pipeline_counts_follow_status_changes(self):
+        logger = ExecutionLogger("test")
+        logger.start_operation("a", "Wait")
+        logger.start_operation("b", "Wait")
+        logger.skip_operation("c", "Wait")
+        assert logger.pipeline.success_count == 0
+        logger.complete_operation("a")
+        logger.fail_operation("b", "boom")
+        pipeline = logger.finish()
+
+        assert (pipeline.success_count, pipeline.error_count) == (1, 1)
+        rebuilt = PipelineLog("copy", operations=list(pipeline.operations))
+        assert (rebuilt.success_count, rebuilt.error_count) == (1, 1)
+
+    def test_repeated_id_updates_most_recent_entry(self):
+        logger = ExecutionLogger("test")
+        logger.start_operation("op1", "Wait")
+        logger.complete_operation("op1")
+        logger.skip_operation("op1", "Wait", reason="again")
+        logger.start_operation("op1", "Wait")
+        logger.fail_operation("op1", "boom")
+
+        statuses = [log.status for log in logger.pipeline.operations]
+        assert statuses == ["completed", "skipped", "failed"]
+
     def test_pipeline_log_duration(self):
         logger = ExecutionLogger("test")
         logger.start_operation("op1", "Wait")
@@ -89,6 +114,44 @@ class TestStructuredLogging:
         assert parsed["workflow_name"] == "test"
         assert parsed["status"] == "completed"
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_pipeline_log_to_json_stringifies_unknown_values(self, monkeypatch, use_orjson):
+        from a2e_lang import _json
+        if not use_orjson:
+            monkeypatch.setattr(_json, "orjson", None)
+        logger = ExecutionLogger("test")
+        logger.start_operation("op1", "Wait")
+        logger.complete_operation("op1", output={1: {"x"}})
+        pipeline = logger.finish()
+
+        parsed = json.loads(pipeline.to_json())
+        assert parsed["operations"][0]["output_snapshot"] == {"1": "{'x'}"}
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("finished", [True, False])
+    def test_write_json_matches_to_dict(self, monkeypatch, use_orjson, finished):
+        import io
+        from a2e_lang import _json
+        if not use_orjson:
+            monkeypatch.setattr(_json, "orjson", None)
+        logger = ExecutionLogger("tést")
+        logger.start_operation("op1", "Wait")
+        logger.complete_operation("op1", output={"n": 1})
+        logger.start_operation("op2", "ApiCall")
+        logger.fail_operation("op2", "boom")
+        pipeline = logger.finish() if finished else logger.pipeline
+
+        buf = io.BytesIO()
+        pipeline.write_json(buf)
+        assert buf.getvalue() == _json.dumpb(pipeline.to_dict())
+        assert pipeline.to_json() == buf.getvalue().decode("utf-8")
+
+    def test_write_json_empty_pipeline(self):
+        import io
+        buf = io.BytesIO()
+        PipelineLog("empty").write_json(buf)
+        assert json.loads(buf.getvalue())["operations"] == []
+
     def test_pipeline_summary(self):
         logger = ExecutionLogger("test")
         logger.start_operation("op1", "ApiCall")
@@ -99,6 +162,91 @@ class TestStructuredLogging:
         assert "test" in summary
         assert "✅" in summary
 
+    @pytest.mark.parametrize("mode, expected", [
+        ("ref", list(range(100))),
+        ("summary", {"type": "list", "len": 100}),
+        ("none", None),
+    ])
+    def test_snapshot_modes(self, mode, expected):
+        logger = ExecutionLogger("test", snapshot_mode=mode)
+        logger.start_operation("op1", "FilterData")
+        logger.complete_operation("op1", output=list(range(100)))
+        assert logger.pipeline.operations[0].output_snapshot == expected
+
+    def test_snapshot_summary_keeps_small_values_and_dict_keys(self):
+        logger = ExecutionLogger("test")
+        logger.start_operation("small", "Wait")
+        logger.complete_operation("small", output={"a": 1})
+        logger.start_operation("big", "Wait")
+        logger.complete_operation("big", output={f"k{i}": i for i in range(40)})
+        small, big = logger.pipeline.operations
+
+        assert small.output_snapshot == {"a": 1}
+        assert big.output_snapshot["len"] == 40
+        assert big.output_snapshot["keys"][:2] == ["k0", "k1"]
+        assert len(big.output_snapshot["keys"]) == 32
+
+    def test_snapshot_summary_bounds_nested_values(self):
+        logger = ExecutionLogger("test")
+        small = {"meta": {"ok": True}}
+        logger.start_operation("one", "ApiCall")
+        logger.complete_operation("one", output={"data": "x" * 5000, "n": 1})
+        logger.start_operation("many", "ApiCall")
+        logger.complete_operation("many", output=[{"d": "y" * 900} for _ in range(30)])
+        logger.start_operation("deep", "Wait")
+        deep: list = [1]
+        for _ in range(20):
+            deep = [deep]
+        logger.complete_operation("deep", output=deep)
+        logger.start_operation("small", "Wait")
+        logger.complete_operation("small", output=small)
+        one, many, deep_log, small_log = logger.pipeline.operations
+
+        assert one.output_snapshot == {"data": {"type": "str", "len": 5000}, "n": 1}
+        # The shared budget keeps the first items and describes the rest
+        assert many.output_snapshot[0] == {"d": "y" * 900}
+        assert many.output_snapshot[-1] == {"d": {"type": "str", "len": 900}}
+        assert len(logger.pipeline.to_json()) < 2 * 16 * 1024
+        level = deep_log.output_snapshot
+        for _ in range(8):
+            level = level[0]
+        assert level == {"type": "list", "len": 1}
+        assert small_log.output_snapshot is small
+
+    def test_unknown_snapshot_mode(self):
+        with pytest.raises(ValueError):
+            ExecutionLogger("test", snapshot_mode="full")
+
+    def test_summary_lines_rendered_once_final(self):
+        logger = ExecutionLogger("test")
+        logger.start_operation("done", "Wait")
+        logger.complete_operation("done")
+        logger.start_operation("pending", "ApiCall")
+        done, pending = logger.pipeline.operations
+
+        assert done._rendered is not None and pending._rendered is None
+        lines = logger.pipeline.summary().splitlines()
+        assert done._rendered in lines
+        assert "  ⏭️ pending (ApiCall) [—]" in lines
+
+    def test_logs_without_metadata_omit_it(self):
+        logger = ExecutionLogger("test")
+        logger.start_operation("op1", "Wait")
+        logger.skip_operation("op2", "Wait")
+        logger.start_operation("op3", "Wait", attempt=2)
+        op1, op2, op3 = logger.pipeline.operations
+
+        assert op1.metadata is op2.metadata
+        assert "metadata" not in op1.to_dict()
+        assert op1.timestamp == logger._op_starts["op1"]
+        assert op3.to_dict()["metadata"] == {"attempt": 2}
+
+    def test_log_records_are_slotted(self):
+        logger = ExecutionLogger("test")
+        logger.start_operation("op1", "Wait")
+        assert not hasattr(logger.pipeline, "__dict__")
+        assert not hasattr(logger.pipeline.operations[0], "__dict__")
+
     def test_operation_log_to_dict(self):
         log = OperationLog(
             operation_id="op1",
@@ -310,11 +458,249 @@ class TestExecutionEngine:
         assert isinstance(filtered, list)
         assert len(filtered) == 2  # Alice and Charlie
 
+    def test_execute_filter_data_multiple_conditions(self):
+        workflow = parse('''
+        workflow "filter-multi"
+        keep = FilterData {
+          from /workflow/users
+          where age >= 30, name startsWith "A"
+          -> /workflow/kept
+        }
+        ''')
+        engine = ExecutionEngine(
+            retry_policy=NO_RETRY,
+            input_data={"/workflow/users": [
+                {"name": "Alice", "age": 30},
+                {"name": "Anna", "age": "old"},
+                {"name": "Bob", "age": 40},
+                {"name": "Ada"},
+                "not-a-dict",
+            ]},
+        )
+        for _ in range(2):  # second run reuses the compiled predicates
+            result = engine.execute(workflow)
+            assert result.data["/workflow/kept"] == [{"name": "Alice", "age": 30}]
+
+    def test_execute_read_only_input_is_not_copied(self):
+        from types import MappingProxyType
+
+        workflow = parse(FILTER_WORKFLOW)
+        base = {"/workflow/users": [{"name": "Alice", "age": 30}]}
+        engine = ExecutionEngine(retry_policy=NO_RETRY, input_data=MappingProxyType(base))
+        result = engine.execute(workflow)
+
+        assert result.success is True
+        assert result.data["/workflow/users"] is base["/workflow/users"]
+        assert result.data["/workflow/filtered"] == [{"name": "Alice", "age": 30}]
+        assert "/workflow/filtered" not in base
+
+    def test_execute_merge_data(self):
+        workflow = parse('''
+        workflow "merge"
+        m = MergeData {
+          sources: [/workflow/a, /workflow/b, /workflow/missing]
+          strategy: "concat"
+          -> /workflow/merged
+        }
+        ''')
+        engine = ExecutionEngine(
+            retry_policy=NO_RETRY,
+            input_data={"/workflow/a": [1, 2], "/workflow/b": {"k": 3}},
+        )
+        result = engine.execute(workflow)
+
+        assert result.data["/workflow/merged"] == [1, 2, {"k": 3}]
+
+    def test_execute_overwritten_path_in_declaration_order(self):
+        workflow = parse('''
+        workflow "overwrite"
+        a = FilterData { from /workflow/one where v > 0 -> /workflow/x }
+        b = FilterData { from /workflow/x where v > 0 -> /workflow/y }
+        c = FilterData { from /workflow/two where v > 0 -> /workflow/x }
+        ''')
+        engine = ExecutionEngine(
+            retry_policy=NO_RETRY,
+            input_data={"/workflow/one": [{"v": 1}], "/workflow/two": [{"v": 2}]},
+        )
+        result = engine.execute(workflow)
+
+        ran = [log.operation_id for log in result.pipeline_log.operations]
+        assert ran == ["a", "b", "c"]
+        assert result.data["/workflow/y"] == [{"v": 1}]
+        assert result.data["/workflow/x"] == [{"v": 2}]
+
+    def test_execute_parallel_levels(self, monkeypatch):
+        from a2e_lang import engine as engine_mod
+
+        # Both Waits must be inside the handler at once to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def rendezvous(op, ctx):
+            barrier.wait()
+            return {"waited_ms": 0}
+
+        monkeypatch.setitem(engine_mod._HANDLERS, "Wait", rendezvous)
+        workflow = parse('''
+        workflow "parallel"
+        a = Wait { duration: 100 }
+        b = Wait { duration: 100 }
+        keep = FilterData {
+          from /workflow/x
+          where v > 0
+          -> /workflow/kept
+        }
+        ''')
+        engine = ExecutionEngine(
+            retry_policy=NO_RETRY,
+            input_data={"/workflow/x": [{"v": 1}, {"v": 0}]},
+            max_workers=4,
+        )
+        result = engine.execute(workflow)
+
+        assert result.success is True
+        assert result.pipeline_log.operation_count == 3
+        assert result.data["/workflow/kept"] == [{"v": 1}]
+
+    def test_execute_parallel_levels_overwritten_path(self):
+        workflow = parse('''
+        workflow "overwrite"
+        a = FilterData { from /workflow/one where v > 0 -> /workflow/x }
+        b = FilterData { from /workflow/x where v > 0 -> /workflow/y }
+        c = FilterData { from /workflow/two where v > 0 -> /workflow/x }
+        ''')
+        engine = ExecutionEngine(
+            retry_policy=NO_RETRY,
+            input_data={"/workflow/one": [{"v": 1}], "/workflow/two": [{"v": 2}]},
+            max_workers=4,
+        )
+        result = engine.execute(workflow)
+
+        assert result.data["/workflow/y"] == [{"v": 1}]
+        assert result.data["/workflow/x"] == [{"v": 2}]
+
+    def test_execute_conditional_and_unknown_ids(self):
+        workflow = parse('''
+        workflow "branch"
+        yes = Wait { duration: 0 }
+        no = Wait { duration: 0 }
+        check = Conditional {
+          if /workflow/n > 0
+          then yes
+          else no
+        }
+        run: check -> ghost
+        ''')
+        engine = ExecutionEngine(retry_policy=NO_RETRY, input_data={"/workflow/n": 1})
+        result = engine.execute(workflow)
+
+        assert result.success is True
+        by_id = {log.operation_id: log for log in result.pipeline_log.operations}
+        assert by_id["ghost"].status == "skipped"
+        assert by_id["check"].output_snapshot == {"branch": "then"}
+        assert "yes" in by_id and "no" not in by_id
+
+    def test_execute_nested_conditionals_in_order(self):
+        workflow = parse('''
+        workflow "nested"
+        a = Wait { duration: 0 }
+        b = Wait { duration: 0 }
+        c = Wait { duration: 0 }
+        inner = Conditional {
+          if /workflow/n > 5
+          then a
+          else b
+        }
+        outer = Conditional {
+          if /workflow/n > 0
+          then inner, c
+        }
+        run: outer
+        ''')
+        engine = ExecutionEngine(retry_policy=NO_RETRY, input_data={"/workflow/n": 1})
+        result = engine.execute(workflow)
+
+        ran = [log.operation_id for log in result.pipeline_log.operations]
+        assert ran == ["outer", "inner", "b", "c"]
+
+    def test_execute_prepared_workflow(self):
+        workflow = parse(FILTER_WORKFLOW)
+        engine = ExecutionEngine(retry_policy=NO_RETRY)
+        prepared = engine.prepare(workflow)
+        assert [op.id for op, _, _ in prepared.steps] == ["filter"]
+
+        for users, expected in (
+            ([{"name": "Alice", "age": 30}], 1),
+            ([{"name": "Bob", "age": 20}], 0),
+        ):
+            engine.initial_data = {"/workflow/users": users}
+            result = engine.execute(prepared)
+            assert result.success is True
+            assert len(result.data["/workflow/filtered"]) == expected
+
+    def test_pure_handlers_skip_circuit_breakers(self, monkeypatch):
+        from a2e_lang import engine as engine_mod
+
+        workflow = parse('''
+        workflow "pure"
+        now = GetCurrentDateTime { timezone: "UTC" -> /workflow/now }
+        text = FormatText { template: "hi" -> /workflow/text }
+        w = Wait { duration: 0 }
+        ''')
+        contexts = []
+        monkeypatch.setattr(
+            engine_mod, "ExecutionContext",
+            lambda **kw: contexts.append(ExecutionContext(**kw)) or contexts[-1],
+        )
+        result = ExecutionEngine(retry_policy=NO_RETRY).execute(workflow)
+
+        assert result.success is True
+        assert result.data["/workflow/text"]["formatted"] == "hi"
+        assert set(contexts[0].circuit_breakers) == {"w"}
+
+    def test_failing_unguarded_handler_is_logged(self, monkeypatch):
+        from a2e_lang import engine as engine_mod
+
+        def boom(op, ctx):
+            raise RuntimeError("boom")
+
+        monkeypatch.setitem(engine_mod._HANDLERS, "Calculate", boom)
+        workflow = parse('''
+        workflow "fail"
+        calc = Calculate { expression: "1 / 0" }
+        ''')
+        result = ExecutionEngine(retry_policy=NO_RETRY).execute(workflow)
+
+        assert result.success is False
+        assert result.pipeline_log.operations[0].error == "boom"
+
+    @pytest.mark.parametrize("actual,operator,expected,met", [
+        (1, "==", 1, True),
+        (1, "!=", 1, False),
+        (2, ">", 1, True),
+        (2, "<", 1, False),
+        (1, ">=", 1, True),
+        (1, "<=", 0, False),
+        ("abc", "contains", "b", True),
+        ("b", "in", ["a", "b"], True),
+        ("abc", "startsWith", "ab", True),
+        ("abc", "endsWith", "x", False),
+        (0, "exists", None, True),
+        (None, "exists", None, False),
+        ("", "empty", None, True),
+        (None, "empty", None, True),
+        ("a", ">", 1, False),  # TypeError is a non-match
+        (1, "matches", 1, False),  # unknown operator
+    ])
+    def test_eval_condition(self, actual, operator, expected, met):
+        from a2e_lang.engine import _eval_condition
+        assert _eval_condition(actual, operator, expected) is met
+
     def test_execution_context(self):
         ctx = ExecutionContext()
         ctx.set("/a", 42)
         assert ctx.get("/a") == 42
         assert ctx.get("/b") is None
+        assert not hasattr(ctx, "__dict__")
 
     def test_handler_registry(self):
         assert get_handler("Wait") is not None
@@ -388,3 +774,19 @@ class TestWebhookServer:
                 assert e.code == 400
         finally:
             server.stop()
+
+    def test_webhook_accepts_parsed_workflow(self):
+        source = 'workflow "test"\n\na = Wait { duration: 1 }\nrun: a\n'
+        server = WebhookServer(parse(source), source=source, port=0)
+        server.start_background()
+
+        try:
+            actual_port = server._server.server_address[1]
+            url = f"http://127.0.0.1:{actual_port}"
+
+            for _ in range(2):
+                req = urllib.request.Request(url, data=b"{}", method="POST")
+                with urllib.request.urlopen(req, timeout=5) as resp:
+                    assert json.loads(resp.read())["success"] is True
+        finally:
+            server.stop()
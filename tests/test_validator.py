@@ -266,3 +266,40 @@ class TestCycleDetection:
         ''')
         cycle_errors = [e for e in v.validate(w) if "Cycle" in str(e)]
         assert cycle_errors == []
+
+
+# ---------------------------------------------------------------------------
+# Validation phases
+# ---------------------------------------------------------------------------
+
+class TestValidationPhases:
+
+    SOURCE = '''
+    workflow "t"
+    a = ApiCall { method: "GET" url: "https://x.com" -> /workflow/a }
+    a = Wait { }
+    check = Conditional { if /workflow/a > 0 then missing }
+    '''
+
+    def test_phases_cover_validate(self, v):
+        w = parse(self.SOURCE)
+        phased = v.validate_limits(w) + v.validate_syntax(w) + v.validate_structure(w)
+        assert phased and list(map(str, phased)) == list(map(str, v.validate(w)))
+
+    def test_watcher_keeps_validate_order(self, v, monkeypatch):
+        from a2e_lang import watcher
+        monkeypatch.setattr(watcher, "_last_structure", None)
+        expected = list(map(str, v.validate(parse(self.SOURCE))))
+        edited = self.SOURCE.replace("https://x.com", "https://y.com")
+        for source in (self.SOURCE, edited):  # the edit reuses the structure errors
+            watcher._parse_and_validate.cache_clear()
+            _, errors = watcher._parse_and_validate(source)
+            assert list(map(str, errors)) == expected
+
+    def test_structure_key_ignores_property_values(self):
+        from a2e_lang.validator import structure_key
+        w1 = parse(self.SOURCE)
+        w2 = parse(self.SOURCE.replace("https://x.com", "https://y.com"))
+        w3 = parse(self.SOURCE.replace("then missing", "then a"))
+        assert structure_key(w1) == structure_key(w2)
+        assert structure_key(w1) != structure_key(w3)